@@ -13,15 +13,40 @@ import os
 import json
 import logging
 import asyncio
+import bisect
+import contextlib
+import contextvars
 import functools
+import hashlib
+import random
+import threading
+import time
+import weakref
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, AsyncIterator
 from dataclasses import dataclass
+import ahocorasick
 import google.generativeai as genai
+import msgspec
 from django.conf import settings
 from django.utils import timezone
 import re
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    # datetime.fromisoformat understands a trailing 'Z' from Python 3.11 on
+    _parse_iso_datetime = datetime.fromisoformat
+
 
 # Configure logging
 logger = logging.getLogger('ai_service')
@@ -29,8 +54,524 @@ logger = logging.getLogger('ai_service')
 # Configure Gemini AI
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+# Words that suggest a task is more complex
+COMPLEXITY_INDICATORS = frozenset([
+    "complex", "challenging", "difficult", "intricate", "sophisticated",
+    "advanced", "complicated", "elaborate", "high-level", "comprehensive",
+    "extensive", "involved", "detailed", "critical", "crucial",
+    "essential", "vital", "significant", "major", "important",
+    "key", "central", "fundamental", "pivotal", "primary",
+    "strategic", "technical", "review", "analysis", "design",
+    "implementation", "migration", "integration", "deployment", "optimization",
+    "reconfiguration", "restructuring", "revamp", "overhaul", "refactor",
+    "system", "framework", "architecture", "infrastructure", "platform",
+    "meeting", "presentation", "urgent", "immediate", "stakeholder"
+])
+
+# Simplicity indicators - words that suggest a task is simpler
+SIMPLICITY_INDICATORS = frozenset([
+    "simple", "basic", "easy", "straightforward", "quick",
+    "small", "minor", "trivial", "beginner", "starter",
+    "practice", "exercise", "tutorial", "learning", "demo",
+    "example", "sample", "test", "prototype", "hobby",
+    "game", "html", "css", "frontend", "ui", "simple app",
+    "tic-tac-toe", "tic tac toe", "tictactoe", "toy project", "practice project"
+])
+
+# Strong simplicity phrases that should almost always result in Low priority
+STRONG_SIMPLICITY_PHRASES = frozenset([
+    "simple game", "basic game", "simple html", "basic html",
+    "simple app", "basic app", "learning project", "practice project",
+    "simple tic-tac-toe", "basic tic-tac-toe", "simple tictactoe",
+    "html game", "css game", "beginner project", "starter project"
+])
+
+
+def _compile_phrases(phrases) -> 're.Pattern':
+    """Compile phrases into one whole-word alternation, longest phrase first"""
+    alternation = '|'.join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True))
+    return re.compile(r'\b(' + alternation + r')\b')
+
+
+_COMPLEXITY_RE = _compile_phrases(COMPLEXITY_INDICATORS)
+_SIMPLICITY_RE = _compile_phrases(SIMPLICITY_INDICATORS)
+
+
+# Simple tasks that are forced to Low priority regardless of the AI response
+SIMPLE_TASK_PATTERNS = frozenset([
+    "tic-tac-toe", "tic tac toe", "tictactoe",
+    "simple html", "basic html", "html game",
+    "learning project", "practice project", "simple game",
+    "tutorial project", "beginner project"
+])
+
+
+def _build_task_pattern_automaton() -> 'ahocorasick.Automaton':
+    """Build one automaton over the strong simplicity phrases and simple task patterns"""
+    kinds = {}
+    for phrase in STRONG_SIMPLICITY_PHRASES:
+        kinds.setdefault(phrase, set()).add('strong')
+    for phrase in SIMPLE_TASK_PATTERNS:
+        kinds.setdefault(phrase, set()).add('simple')
+        
+    automaton = ahocorasick.Automaton()
+    for phrase, phrase_kinds in kinds.items():
+        automaton.add_word(phrase, (len(phrase), frozenset(phrase_kinds)))
+    automaton.make_automaton()
+    return automaton
+
+
+_TASK_PATTERNS = _build_task_pattern_automaton()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _match_task_patterns(task_text: str) -> set:
+    """
+    Scan lowercased task text once for strong simplicity phrases and simple task patterns
+    
+    Strong simplicity phrases only count as whole words, simple task
+    patterns match anywhere in the text.
+    
+    Args:
+        task_text: Lowercased task title and description
+        
+    Returns:
+        Set of matched kinds ('strong', 'simple')
+    """
+    hits = set()
+    for end, (length, kinds) in _TASK_PATTERNS.iter(task_text):
+        if 'strong' in kinds and 'strong' not in hits:
+            start = end - length + 1
+            if ((start == 0 or not _is_word_char(task_text[start - 1])) and
+                    (end + 1 == len(task_text) or not _is_word_char(task_text[end + 1]))):
+                hits.add('strong')
+        if 'simple' in kinds:
+            hits.add('simple')
+    return hits
+
+# Terms that mark a context entry as urgent (matched as whole words, any case)
+URGENCY_TERMS = (
+    'urgent', 'asap', 'immediately', 'today', 'tomorrow', 'deadline',
+    'due', 'meeting', 'schedule', 'important', 'priority', 'critical',
+    'approaching', 'soon', 'fast', 'quick', 'promptly'
+)
+
+_URGENCY_RE = re.compile(r'\b(?:' + '|'.join(re.escape(term) for term in URGENCY_TERMS) + r')\b', re.IGNORECASE)
+
+# Date proximity levels: (label, minimum priority score) for a context date
+# less than 1, 2 and 7 days away, and for anything further out
+_DATE_URGENCY_THRESHOLDS = (1.0, 2.0, 7.0)
+_DATE_URGENCY_LEVELS = (
+    ("critical", 9.0),
+    ("high", 8.0),
+    ("medium", 0.0),
+    ("none", 0.0),
+)
+
+# Priority label for a score: bisect_right over the lower bound of each label above "Very Low"
+PRIORITY_THRESHOLDS = (2.0, 5.0, 7.0, 9.0)
+PRIORITY_LABELS = ("Very Low", "Low", "Medium", "High", "Critical")
+
+# Priority overrides by days until the earliest context date (bisect_right over the
+# thresholds): (score floor, label or None to derive it from the score, context
+# relevance floor, urgency factor, reasoning note)
+_CONTEXT_DATE_THRESHOLDS = (1.0, 2.0, 4.0, 7.0)
+_CONTEXT_DATE_OVERRIDES = (
+    (9.5, "Critical", 0.98, "Critical deadline detected within 24 hours",
+     "\n(Priority automatically elevated to Critical due to deadline within 24 hours)"),
+    (8.5, "High", 0.9, "Urgent deadline within 48 hours",
+     "\n(Priority adjusted due to deadline within 48 hours)"),
+    (7.5, "High", 0.8, "Upcoming deadline within 4 days", ""),
+    (6.5, None, 0.7, "Upcoming deadline within a week", ""),
+    None,
+)
+
+# Result templates for analyses that report something even when they fail
+_FALLBACK_PRIORITY = MappingProxyType({
+    'score': 5.0,  # Medium priority as default
+    'priority_label': 'Medium',
+    'reasoning': 'Default priority assigned due to analysis error',
+    'urgency_factors': ('Task requires attention',),
+    'context_relevance': 0.5,
+    'action_timeframe': 'As scheduled',
+    'impact_assessment': 'Impact could not be determined',
+})
+_FALLBACK_ENHANCEMENT_INFO = MappingProxyType({'is_enhanced': False})
+
+# Time references emphasized in context summaries
+TIME_TERMS = ('today', 'tomorrow', 'next week', 'meeting', 'schedule', 'deadline',
+              'due date', 'urgent', 'asap', 'immediately', 'soon')
+
+_HIGHLIGHT_RE = re.compile(r'\b(' + '|'.join(re.escape(term) for term in TIME_TERMS) + r')\b', re.IGNORECASE)
+
+MONTHS = r'(?:January|February|March|April|May|June|July|August|September|October|November|December)'
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# All natural language date references in one alternation; the named group
+# that matched selects the parser in _DATE_PARSERS
+_FUSED_DATE_RE = re.compile(
+    r'(?P<iso>\d{4}-\d{1,2}-\d{1,2})'
+    r'|(?P<md_y>' + MONTHS + r'\s+\d{1,2},\s+\d{4})'
+    r'|(?P<dm_y>\d{1,2}\s+' + MONTHS + r'\s+\d{4})'
+    r'|(?P<md>' + MONTHS + r'\s+\d{1,2}(?!,\s+\d{4}))'
+    r'|(?P<tomorrow_at>\btomorrow\s+at\s+(?P<hour>\d{1,2})(?:\s*:\s*(?P<minute>\d{1,2}))?\s*(?P<am_pm>am|pm)?)'
+    r'|(?P<tomorrow>\btomorrow\b)'
+    r'|(?P<today>\btoday\b)'
+    r'|(?P<next_week>\bnext week\b)'
+    r'|(?P<weekend>\bthis weekend\b)'
+    r'|(?P<weekday>\b(?:' + '|'.join(WEEKDAYS) + r')\b)',
+    re.IGNORECASE
+)
+
+
+def _find_json_span(text: str) -> Optional[str]:
+    """
+    Return the first balanced top-level {...} span in text, scanning it once
+    
+    Braces inside JSON string literals (including escaped quotes) are ignored.
+    
+    Args:
+        text: Text that may contain a JSON object
+        
+    Returns:
+        The object's source text, or None if no balanced object is found
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_str = False
+    esc = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_str:
+            if esc:
+                esc = False
+            elif c == '\\':
+                esc = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _parse_model_dt(value: str) -> datetime:
+    """Parse a model 'YYYY-MM-DD HH:MM' timestamp, falling back to strptime for odd shapes"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M")
+
+
+def _as_local(parsed: datetime, now: datetime) -> datetime:
+    """Give a naive parsed date the reference time's timezone so it compares with it"""
+    return parsed.replace(tzinfo=now.tzinfo) if parsed.tzinfo is None else parsed
+
+
+def _parse_tomorrow_at(match: 're.Match', today: datetime, now: datetime) -> List[datetime]:
+    """'tomorrow at X' yields both the timed date and tomorrow itself"""
+    tomorrow = today + timedelta(days=1)
+    try:
+        hour = int(match.group('hour'))
+        minute = int(match.group('minute')) if match.group('minute') else 0
+        am_pm = match.group('am_pm').lower() if match.group('am_pm') else None
+        
+        # Handle AM/PM
+        if am_pm == 'pm' and hour < 12:
+            hour += 12
+        elif am_pm == 'am' and hour == 12:
+            hour = 0
+            
+        return [tomorrow.replace(hour=hour, minute=minute), tomorrow]
+    except (ValueError, AttributeError, IndexError):
+        return [tomorrow, tomorrow]  # Fallback to just tomorrow
+
+
+# Parsers keyed by _FUSED_DATE_RE group name; each takes (match, today, current date)
+# and returns the list of dates the reference stands for
+_DATE_PARSERS = {
+    # ISO format dates (YYYY-MM-DD)
+    'iso': lambda m, today, now: [_as_local(datetime.fromisoformat(m.group().strip()), now)],
+    # Month day, year (July 8, 2025)
+    'md_y': lambda m, today, now: [_as_local(datetime.strptime(m.group().strip(), "%B %d, %Y"), now)],
+    # Day Month year (8 July 2025)
+    'dm_y': lambda m, today, now: [_as_local(datetime.strptime(m.group().strip(), "%d %B %Y"), now)],
+    # Month day (July 8) - assume current year
+    'md': lambda m, today, now: [_as_local(datetime.strptime(f"{m.group().strip()}, {now.year}", "%B %d, %Y"), now)],
+    'tomorrow_at': _parse_tomorrow_at,
+    'tomorrow': lambda m, today, now: [today + timedelta(days=1)],
+    'today': lambda m, today, now: [today],
+    'next_week': lambda m, today, now: [today + timedelta(days=7)],
+    'weekend': lambda m, today, now: [today + timedelta(days=(5 - today.weekday()) % 7)],
+    # Day names (Monday, Tuesday, etc.)
+    'weekday': lambda m, today, now: [
+        today + timedelta(days=(WEEKDAYS.index(m.group().strip().capitalize()) - today.weekday()) % 7)
+    ],
+}
+
+# Leading/trailing markdown code fences around a JSON response
+_JSON_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.IGNORECASE)
+
+
+# Prompt templates, filled in with str.format_map
+_ANALYZE_CONTEXT_PROMPT = """
+Analyze the following {source_type} content and extract key insights for task management:
+
+Content: {content}
+
+Please provide a comprehensive analysis in JSON format with the following structure:
+{{
+    "summary": "Brief summary of the content",
+    "key_topics": ["topic1", "topic2", "topic3"],
+    "urgency_indicators": ["urgent phrase 1", "urgent phrase 2"],
+    "potential_tasks": [
+        {{
+            "title": "Task title",
+            "description": "Task description",
+            "urgency": "high/medium/low",
+            "deadline_hint": "any time reference found"
+        }}
+    ],
+    "sentiment_score": 0.5,
+    "time_references": ["tomorrow", "next week", "by Friday"]
+}}
+
+Focus on:
+1. Identifying actionable items or tasks mentioned
+2. Detecting urgency indicators (deadlines, time pressure)
+3. Understanding the overall sentiment and stress level
+4. Extracting time-related information
+5. Identifying key topics and themes
+"""
+
+_PRIORITIZE_URGENT_NOTE = ("URGENT CONTEXT DETECTED: There are urgent items in the context that may require "
+                           "immediate attention and may affect this task priority.")
+_PRIORITIZE_DATE_NOTE = ("IMPORTANT DATE DETECTED: {date} is an important date in the context that requires "
+                         "{urgency} priority attention.")
+
+_PRIORITIZE_PROMPT = """
+Analyze the following task and provide a priority score based on the given context and complexity:
+
+Task Information:
+- Title: {title}
+- Description: {description}
+- Category: {category}
+- User Priority: {priority}
+- Deadline: {deadline}
+- Estimated Duration: {estimated_duration} minutes
+- Complexity Score (auto-detected): {complexity_score}/10
+
+Current Context:
+{context_summary}
+
+{urgent_note}
+{date_note}
+
+User Preferences:
+{user_preferences}
+
+Please analyze and provide a JSON response with:
+{{
+    "priority_score": 7.5,
+    "priority_label": "High",
+    "reasoning": "Detailed explanation of the priority score",
+    "urgency_factors": ["factor1", "factor2", "factor3"],
+    "context_relevance": 0.8,
+    "action_timeframe": "Recommended action timeframe (e.g., 'Today', 'This week', etc.)",
+    "impact_assessment": "Brief assessment of task's impact and importance"
+}}
+
+Priority scoring guidelines:
+- 9-10: Critical/Urgent (immediate action required)
+- 7-8: High priority (should be done soon)
+- 5-6: Medium priority (normal importance)
+- 3-4: Low priority (can be delayed)
+- 1-2: Very low priority (optional/nice to have)
+
+Provide an appropriate priority_label that matches the score ("Critical", "High", "Medium", "Low", or "Very Low").
+
+Consider these factors in order of importance:
+1. Deadline proximity and importance
+2. Context relevance and urgency indicators
+3. Task complexity and estimated duration
+4. Dependencies on other tasks or people
+5. User preferences and work patterns
+6. Potential impact if delayed
+
+IMPORTANT GUIDELINES:
+- Simple tasks (like basic HTML/CSS projects, tutorials, practice exercises, games, demos) MUST be assigned LOW priority unless there are specific urgent deadlines or critical dependencies.
+- SPECIFICALLY, any task involving a simple game like tic-tac-toe, especially in HTML/CSS/JavaScript, should ALWAYS be LOW priority.
+- Tasks with educational or learning purposes should ALWAYS be LOW priority unless they are prerequisites for higher priority work.
+- Tasks with high complexity (score > 6) should generally receive High or Critical priority.
+- Tasks with low complexity (score < 2) MUST receive Low priority.
+- Always consider the actual scope and impact of the task rather than just the presence of certain keywords.
+
+EXPLICIT EXAMPLES OF LOW PRIORITY TASKS:
+- Creating a tic-tac-toe game in HTML/CSS/JavaScript
+- Building a simple calculator app
+- Making a basic portfolio website
+- Learning exercises and tutorials
+- Small hobby projects
+"""
+
+_DEADLINE_URGENT_NOTE = ("URGENT CONTEXT DETECTED: There are urgent items in the context that may require "
+                         "immediate attention and may affect this task deadline.")
+_DEADLINE_DATE_NOTE = "IMPORTANT DATE DETECTED: {date} is an important date in the context that may affect this deadline."
+
+_DEADLINE_PROMPT = """
+Suggest a realistic deadline for the following task based on its complexity and current context:
+
+Task Information:
+- Title: {title}
+- Description: {description}
+- Category: {category}
+- Estimated Duration: {estimated_duration} minutes
+- User Suggested Deadline: {deadline}
+
+Current Context:
+{context_summary}
+
+Current Workload:
+{workload_info}
+
+Current Date/Time: {current_datetime}
+
+{urgent_note}
+{date_note}
 
-@dataclass
+IMPORTANT: The suggested deadline MUST be in the future relative to the current date ({current_date}).
+DO NOT suggest any date in the past.
+
+Please provide a JSON response with:
+{{
+    "suggested_deadline": "Future date in ISO format",
+    "confidence": 0.85,
+    "reasoning": "Detailed explanation for the suggested deadline",
+    "factors_considered": ["factor1", "factor2", "factor3"],
+    "context_relevance": 0.95,
+    "urgent_context_impact": "High/Medium/Low/None"
+}}
+
+Consider:
+1. Task complexity and estimated duration
+2. Current workload and availability
+3. Context urgency indicators
+4. Buffer time for unexpected delays
+5. Dependencies and prerequisites
+6. Work-life balance considerations
+7. Realistic time estimation based on similar tasks
+
+Provide the deadline in ISO format and ensure it's realistic and achievable.
+"""
+
+_CATEGORIES_PROMPT = """
+Suggest appropriate categories and tags for the following task:
+
+Task Information:
+- Title: {title}
+- Description: {description}
+- Current Category: {category}
+
+Existing Categories: {existing_categories}
+Existing Tags: {existing_tags}
+
+Please provide a JSON response with:
+{{
+    "suggested_categories": ["category1", "category2"],
+    "suggested_tags": ["tag1", "tag2", "tag3"],
+    "confidence": 0.9,
+    "reasoning": "Explanation for the suggestions"
+}}
+
+Guidelines:
+1. Prefer existing categories/tags when appropriate
+2. Suggest new ones only if existing ones don't fit well
+3. Categories should be broad (e.g., "Work", "Personal", "Health")
+4. Tags should be specific (e.g., "urgent", "meeting", "research")
+5. Limit suggestions to 2-3 categories and 3-5 tags
+6. Consider the task's nature, urgency, and context
+"""
+
+_SCHEDULE_PROMPT = """
+Suggest an optimal schedule for the following task based on the provided context, workload, and preferences.
+
+Task Information:
+- Title: {title}
+- Description: {description}
+- Priority: {priority}
+- Deadline: {deadline}
+- Estimated Duration: {estimated_duration} minutes
+
+Current Context:
+{context_summary}
+{context_dates_info}
+
+Current Workload:
+{workload_info}
+
+User Preferences:
+- Working Hours: {working_hours_start} to {working_hours_end}
+
+Current Date and Time: {current_datetime}
+
+Please provide a JSON response with the following structure:
+{{
+    "suggested_start_time": "YYYY-MM-DD HH:MM",
+    "suggested_end_time": "YYYY-MM-DD HH:MM",
+    "confidence": 0.85,
+    "reasoning": "Detailed explanation of why this time slot is suggested",
+    "factors_considered": ["factor1", "factor2", "factor3"],
+    "alternative_slots": [
+        {{
+            "start_time": "YYYY-MM-DD HH:MM",
+            "end_time": "YYYY-MM-DD HH:MM",
+            "reason": "Why this is an alternative option"
+        }}
+    ]
+}}
+
+Guidelines for scheduling:
+1. High priority tasks should be scheduled earlier in the day when possible
+2. Tasks with approaching deadlines should be prioritized
+3. Consider context information for optimal timing
+4. Schedule within working hours unless the task is urgent
+5. Provide at least 2 alternative time slots
+6. If there are specific dates mentioned in the context that are relevant to this task, prioritize scheduling near those dates
+7. For tasks without deadlines, suggest reasonable timing based on priority and estimated duration
+"""
+
+_ENHANCE_DESCRIPTION_PROMPT = """
+Enhance the following task description with relevant context and details:
+
+Original Task:
+- Title: {title}
+- Description: {description}
+
+Relevant Context:
+{context_summary}
+
+Please provide an enhanced description that:
+1. Maintains the original intent and scope
+2. Adds relevant context and background information
+3. Includes specific details that might be helpful
+4. Suggests potential steps or considerations
+5. Remains concise and actionable
+
+Return only the enhanced description text, not JSON.
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class TaskPriority:
     """Data class for task priority analysis results"""
     score: float  # 0-10 scale
@@ -42,7 +583,7 @@ class TaskPriority:
     impact_assessment: str = ""  # Brief assessment of importance
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeadlineSuggestion:
     """Data class for deadline suggestion results"""
     suggested_deadline: datetime
@@ -51,7 +592,7 @@ class DeadlineSuggestion:
     factors_considered: List[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CategorySuggestion:
     """Data class for category suggestion results"""
     suggested_categories: List[str]
@@ -60,7 +601,7 @@ class CategorySuggestion:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContextInsights:
     """Data class for context analysis results"""
     summary: str
@@ -71,7 +612,7 @@ class ContextInsights:
     time_references: List[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SchedulingSuggestion:
     """Data class for task scheduling suggestion results"""
     suggested_start_time: datetime
@@ -82,6 +623,508 @@ class SchedulingSuggestion:
     alternative_slots: List[Dict[str, Any]]  # List of alternative time slots
 
 
+class ContextAnalysisResponse(msgspec.Struct):
+    """Expected JSON shape of an analyze_context response"""
+    summary: str = ''
+    key_topics: List[str] = []
+    urgency_indicators: List[str] = []
+    potential_tasks: List[Any] = []
+    sentiment_score: float = 0.0
+    time_references: List[Any] = []
+
+
+class PrioritizeResponse(msgspec.Struct):
+    """Expected JSON shape of a prioritize_task response"""
+    priority_score: float = 5.0
+    priority_label: Optional[str] = None
+    reasoning: str = ''
+    urgency_factors: List[str] = []
+    context_relevance: float = 0.0
+    action_timeframe: str = ''
+    impact_assessment: str = ''
+
+
+class DeadlineResponse(msgspec.Struct):
+    """Expected JSON shape of a suggest_deadline response"""
+    suggested_deadline: Optional[str] = None
+    confidence: float = 0.5
+    reasoning: str = ''
+    factors_considered: List[str] = []
+
+
+class CategoriesResponse(msgspec.Struct):
+    """Expected JSON shape of a suggest_categories_and_tags response"""
+    suggested_categories: List[str] = []
+    suggested_tags: List[str] = []
+    confidence: float = 0.5
+    reasoning: str = ''
+
+
+# Typed decoders; lax mode accepts numbers sent as strings ("0.8")
+_RESPONSE_DECODERS = {
+    schema: msgspec.json.Decoder(schema, strict=False)
+    for schema in (ContextAnalysisResponse, PrioritizeResponse, DeadlineResponse, CategoriesResponse)
+}
+
+
+def _convert_response(data: Any, schema: type) -> Any:
+    """
+    Convert a decoded response to its typed schema
+    
+    Fields whose values have the wrong type (say a number among the
+    urgency_factors) take their schema defaults instead of failing the
+    whole response.
+    
+    Args:
+        data: Decoded JSON, normally a dictionary
+        schema: msgspec.Struct type describing the expected response
+        
+    Returns:
+        Instance of ``schema``
+    """
+    if not isinstance(data, dict):
+        data = {}
+    try:
+        return msgspec.convert(data, schema, strict=False)
+    except msgspec.ValidationError as e:
+        logger.warning("Response doesn't match %s, using defaults for mismatched fields: %s", schema.__name__, e)
+    
+    valid = {}
+    for name in schema.__struct_fields__:
+        if name not in data:
+            continue
+        try:
+            msgspec.convert({name: data[name]}, schema, strict=False)
+        except msgspec.ValidationError:
+            continue
+        valid[name] = data[name]
+    return msgspec.convert(valid, schema, strict=False)
+
+
+@dataclass(slots=True, frozen=True)
+class ContextDigest:
+    """Context preprocessing shared by the analyses of a single task"""
+    summary: str
+    urgent: bool
+    earliest_date: Optional[datetime]
+    urgency_factors: Tuple[str, ...]
+    current_date: datetime
+    context_dates: Tuple[datetime, ...] = ()
+
+
+class _TextResponse:
+    """Minimal stand-in for a Gemini response object exposing only ``text``"""
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _JSONObjectStream:
+    """
+    Incrementally tracks the outermost JSON object of a streamed response so
+    the caller can stop reading as soon as the object is closed.
+
+    Anything other than whitespace or a markdown code fence before the opening
+    brace marks the stream as ``invalid``.
+    """
+    __slots__ = ('_parts', '_depth', '_in_string', '_escape', 'started', 'complete', 'invalid')
+
+    _PREAMBLE_CHARS = frozenset(' \t\r\n`jsonJSON')
+
+    def __init__(self):
+        self._parts = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.started = False
+        self.complete = False
+        self.invalid = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of response text
+        
+        Args:
+            chunk: Text chunk as received from the stream
+            
+        Returns:
+            True once the outermost object has been closed
+        """
+        if self.complete:
+            return True
+            
+        start = 0
+        if not self.started:
+            start = chunk.find('{')
+            preamble = chunk if start == -1 else chunk[:start]
+            if not self._PREAMBLE_CHARS.issuperset(preamble):
+                self.invalid = True
+                return False
+            if start == -1:
+                return False
+            self.started = True
+            
+        for i in range(start, len(chunk)):
+            c = chunk[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c == '{':
+                self._depth += 1
+            elif c == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[start:i + 1])
+                    self.complete = True
+                    return True
+                    
+        self._parts.append(chunk[start:])
+        return False
+
+    def text(self) -> str:
+        """Text of the JSON object consumed so far"""
+        return ''.join(self._parts)
+
+
+class _TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after ``ttl`` seconds
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class _BatchScope:
+    """Identity of one request's AI analyses, inherited by the tasks it spawns"""
+    __slots__ = ('__weakref__',)
+
+
+# Batch scope of the running analyses; prompts are only batched within one scope
+_batch_scope: contextvars.ContextVar[Optional[_BatchScope]] = contextvars.ContextVar(
+    'ai_batch_scope', default=None
+)
+
+
+async def run_in_batch_scope(coro) -> Any:
+    """
+    Await a coroutine in a batch scope of its own
+    
+    Prompts submitted by the coroutine and the tasks it starts are only batched
+    with each other, so one request's task text and context never share a
+    Gemini prompt with another's.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Result of the coroutine
+    """
+    token = _batch_scope.set(_BatchScope())
+    try:
+        return await coro
+    finally:
+        _batch_scope.reset(token)
+
+
+# Set while a caller fans out several prompts of one kind; only those prompts
+# wait for siblings to batch with, all others are sent right away
+_batch_coalescing: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    'ai_batch_coalescing', default=False
+)
+
+
+@contextlib.contextmanager
+def _coalescing():
+    """Let the prompts of tasks started in this block be batched together"""
+    token = _batch_coalescing.set(True)
+    try:
+        yield
+    finally:
+        _batch_coalescing.reset(token)
+
+
+class _BatchCoalescer:
+    """
+    Coalesces concurrently pending prompts of the same kind into a single
+    Gemini request and fans the per-prompt results back out to the callers.
+    Only prompts of the same batch scope (see run_in_batch_scope) are combined,
+    or of the same event loop when no scope is set.
+
+    Prompts submitted inside a _coalescing() block within ``max_wait`` seconds
+    of each other (up to ``max_batch`` of them) are sent as one combined prompt
+    asking for a JSON array with one element per prompt. Any other prompt is
+    sent right away unless a batch is already pending. A batch of one is sent
+    unchanged, and if a combined response cannot be split back up every prompt
+    in the batch is retried on its own.
+    """
+
+    def __init__(self, service: 'GeminiAIService', max_batch: int = 8, max_wait: float = 0.025):
+        self._service = service
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Pending prompts are tracked per batch scope, falling back to the
+        # event loop for analyses run outside of one
+        self._states = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _get_state(self, owner: Any) -> Dict[str, Any]:
+        with self._lock:
+            state = self._states.get(owner)
+            if state is None:
+                state = {'pending': [], 'timer': None, 'tasks': set()}
+                self._states[owner] = state
+            return state
+
+    async def submit(self, prompt: str) -> Any:
+        """
+        Queue a prompt for the next batch and wait for its own response
+        
+        Args:
+            prompt: The prompt to send to the AI model
+            
+        Returns:
+            Response object exposing the generated ``text``
+        """
+        cached = self._service._get_cached_response(prompt)
+        if cached is not None:
+            return cached
+            
+        loop = asyncio.get_running_loop()
+        state = self._get_state(_batch_scope.get() or loop)
+        if not state['pending'] and not _batch_coalescing.get():
+            # Nothing to batch with, so don't wait out max_wait
+            return await self._service._generate_json_streamed(prompt)
+            
+        future = loop.create_future()
+        state['pending'].append((prompt, future))
+        
+        if len(state['pending']) >= self.max_batch:
+            self._flush(loop, state)
+        elif state['timer'] is None:
+            state['timer'] = loop.call_later(self.max_wait, self._flush, loop, state)
+            
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, state: Dict[str, Any]) -> None:
+        if state['timer'] is not None:
+            state['timer'].cancel()
+            state['timer'] = None
+            
+        batch, state['pending'] = state['pending'], []
+        if batch:
+            task = loop.create_task(self._dispatch(batch))
+            state['tasks'].add(task)
+            task.add_done_callback(state['tasks'].discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        if len(batch) == 1:
+            prompt, future = batch[0]
+            await self._resolve(future, self._service._generate_json_streamed(prompt))
+            return
+            
+        try:
+            response = await self._service._generate_content_async(
+                self._combine(batch),
+                max_output_tokens=min(8192, 1024 * len(batch))
+            )
+            results = self._split(response.text, len(batch))
+        except Exception as e:
+            logger.warning("Batched Gemini request failed, retrying %d prompts individually: %s", len(batch), e)
+            await asyncio.gather(*[
+                self._resolve(future, self._service._generate_content_async(prompt))
+                for prompt, future in batch
+            ])
+            return
+            
+        for (prompt, future), result in zip(batch, results):
+            response = _TextResponse(json.dumps(result))
+            self._service._cache_response(prompt, response.text)
+            if not future.done():
+                future.set_result(response)
+
+    @staticmethod
+    async def _resolve(future: asyncio.Future, coro) -> None:
+        try:
+            result = await coro
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _combine(batch: List[Tuple[str, asyncio.Future]]) -> str:
+        parts = [
+            f"You will receive {len(batch)} independent requests, numbered from 0. "
+            "Answer each one separately, exactly as if it had been sent on its own."
+        ]
+        for i, (prompt, _) in enumerate(batch):
+            parts.append(f"### Request {i}\n{prompt.strip()}")
+        parts.append(
+            f'Return a JSON object of the form {{"results": [...]}} where "results" is an array of exactly '
+            f"{len(batch)} JSON objects, the element at index i being the complete JSON response to Request i."
+        )
+        return "\n\n".join(parts)
+
+    def _split(self, text: str, expected: int) -> List[Dict[str, Any]]:
+        try:
+            data = _loads(text)
+        except json.JSONDecodeError:
+            data = self._service._extract_json_from_text(text)
+            
+        results = data.get('results') if isinstance(data, dict) else None
+        if not isinstance(results, list) or len(results) != expected:
+            raise ValueError(f"Expected {expected} batched results, got {len(results) if isinstance(results, list) else 'none'}")
+        if not all(isinstance(result, dict) for result in results):
+            raise ValueError("Batched results must be JSON objects")
+        return results
+
+
+# Appended to every prompt that asks for JSON
+_JSON_INSTRUCTION = """
+                
+                IMPORTANT: Return ONLY valid, parseable JSON without any additional text, markdown formatting or code blocks.
+                Do not include backticks, the word 'json', or any other text before or after the JSON object.
+                The response should be a single, valid JSON object and nothing else.
+                """
+
+# Sampling parameters shared by every Gemini request
+_GENERATION_CONFIG = {
+    'temperature': 0.2,
+    'top_p': 0.95,
+    'top_k': 40,
+}
+# Canonical form of the sampling parameters, folded into response cache keys
+_GENERATION_CONFIG_KEY = json.dumps(_GENERATION_CONFIG, sort_keys=True)
+
+@dataclass(slots=True, frozen=True)
+class PrioritizeFeatures:
+    """Non-AI features of a task computed before prompting for its priority"""
+    task_text: str
+    days_difference: Optional[float]
+    date_urgency: str
+    urgency_min_score: float
+    complexity_score: float
+    has_strong_simplicity: bool
+    is_simple_task: bool
+
+
+def _date_urgency_level(digest: ContextDigest) -> Optional[int]:
+    """Index into _DATE_URGENCY_LEVELS for the earliest context date, or None without one"""
+    if not digest.earliest_date:
+        return None
+    days_difference = (digest.earliest_date - digest.current_date).total_seconds() / 86400
+    return bisect.bisect_right(_DATE_URGENCY_THRESHOLDS, days_difference)
+
+
+def _build_prioritize_features(task_data: Dict[str, Any], digest: ContextDigest) -> PrioritizeFeatures:
+    """
+    Compute date proximity and complexity features for prioritize_task
+    
+    Kept free of service state and fully annotated so it can be compiled
+    ahead of time without changes.
+    
+    Args:
+        task_data: Dictionary containing task information
+        digest: ContextDigest for the task's context
+        
+    Returns:
+        PrioritizeFeatures for the task
+    """
+    # Calculate date proximity for urgency assessment
+    days_difference: Optional[float] = None
+    date_urgency, urgency_min_score = "none", 0.0
+    if digest.earliest_date:
+        days_difference = (digest.earliest_date - digest.current_date).total_seconds() / 86400
+        date_urgency, urgency_min_score = _DATE_URGENCY_LEVELS[_date_urgency_level(digest)]
+    
+    # Perform complexity analysis on the task title and description
+    task_text = f"{task_data.get('title', '')} {task_data.get('description', '')}".lower()
+    complexity_count = len(set(_COMPLEXITY_RE.findall(task_text)))
+    simplicity_count = len(set(_SIMPLICITY_RE.findall(task_text)))
+    
+    # Check for strong simplicity phrases that should force low priority
+    task_pattern_hits = _match_task_patterns(task_text)
+    has_strong_simplicity = 'strong' in task_pattern_hits
+    
+    # Adjust complexity score based on simplicity indicators
+    # More simplicity indicators should reduce the complexity score
+    complexity_score = min(10, complexity_count * 0.8 - simplicity_count * 1.5)
+    
+    # If strong simplicity phrases are found, force a very low complexity score
+    if has_strong_simplicity:
+        complexity_score = min(1.5, complexity_score)  # Cap at 1.5 for strong simplicity indicators
+        logger.info("Strong simplicity phrase detected in task: '%s'. Forcing low complexity score.", task_data.get('title', ''))
+        
+    complexity_score = max(0, complexity_score)  # Ensure it doesn't go below 0
+    
+    return PrioritizeFeatures(
+        task_text=task_text,
+        days_difference=days_difference,
+        date_urgency=date_urgency,
+        urgency_min_score=urgency_min_score,
+        complexity_score=complexity_score,
+        has_strong_simplicity=has_strong_simplicity,
+        is_simple_task='simple' in task_pattern_hits
+    )
+
+
+# Safety settings sent with every Gemini request
+_SAFETY_SETTINGS = (
+    {
+        "category": "HARM_CATEGORY_HARASSMENT",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    },
+    {
+        "category": "HARM_CATEGORY_HATE_SPEECH",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    },
+    {
+        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    },
+    {
+        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    },
+)
+
+
+# asyncio.eager_task_factory only exists on Python 3.12+
+_EAGER_TASK_FACTORY = getattr(asyncio, 'eager_task_factory', None)
+
+
 class GeminiAIService:
     """
     Main AI service class that handles all AI-powered features
@@ -90,24 +1133,39 @@ class GeminiAIService:
     
     def __init__(self):
         self.model = genai.GenerativeModel('gemini-1.5-flash')
-        self.safety_settings = [
-            {
-                "category": "HARM_CATEGORY_HARASSMENT",
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-            },
-            {
-                "category": "HARM_CATEGORY_HATE_SPEECH",
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-            },
-            {
-                "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-            },
-            {
-                "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-            }
-        ]
+        self.safety_settings = _SAFETY_SETTINGS
+        # Responses are cached by prompt hash so identical prompts skip Gemini
+        self._response_cache = _TTLCache(maxsize=2048, ttl=600)
+        # Scheduling suggestions are also cached by their structured inputs, so a
+        # hit skips building the prompt; kept short-lived since slots age quickly
+        self._schedule_cache = _TTLCache(maxsize=512, ttl=300)
+        # Concurrent prompts of the same kind share a single Gemini request
+        self._coalescers = {
+            kind: _BatchCoalescer(self)
+            for kind in ('context', 'priority', 'deadline', 'categories', 'schedule')
+        }
+        # Blocking SDK calls get their own pool, sized to the Gemini concurrency budget
+        self._executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'GEMINI_CONCURRENCY', 8),
+            thread_name_prefix='gemini'
+        )
+
+    def warm_up(self) -> None:
+        """
+        Open the Gemini connection ahead of the first request
+        
+        Counting tokens goes through the same client as generation but is cheap
+        and doesn't use generation quota. The SDK call takes no timeout, so it
+        runs on the Gemini pool and is waited for at most AI_ANALYSIS_TIMEOUT seconds.
+        """
+        timeout = getattr(settings, 'AI_ANALYSIS_TIMEOUT', 60)
+        try:
+            self._executor.submit(self.model.count_tokens, 'ping').result(timeout=timeout)
+            logger.info("Gemini client warmed up")
+        except TimeoutError:
+            logger.info("Gemini warm-up timed out after %ss", timeout)
+        except Exception as e:
+            logger.info("Gemini warm-up failed: %s", e)
         
     async def analyze_context(self, context_content: str, source_type: str) -> ContextInsights:
         """
@@ -121,76 +1179,49 @@ class GeminiAIService:
             ContextInsights object with analysis results
         """
         try:
-            prompt = f"""
-            Analyze the following {source_type} content and extract key insights for task management:
-
-            Content: {context_content}
-
-            Please provide a comprehensive analysis in JSON format with the following structure:
-            {{
-                "summary": "Brief summary of the content",
-                "key_topics": ["topic1", "topic2", "topic3"],
-                "urgency_indicators": ["urgent phrase 1", "urgent phrase 2"],
-                "potential_tasks": [
-                    {{
-                        "title": "Task title",
-                        "description": "Task description",
-                        "urgency": "high/medium/low",
-                        "deadline_hint": "any time reference found"
-                    }}
-                ],
-                "sentiment_score": 0.5,
-                "time_references": ["tomorrow", "next week", "by Friday"]
-            }}
-
-            Focus on:
-            1. Identifying actionable items or tasks mentioned
-            2. Detecting urgency indicators (deadlines, time pressure)
-            3. Understanding the overall sentiment and stress level
-            4. Extracting time-related information
-            5. Identifying key topics and themes
-            """
+            prompt = _ANALYZE_CONTEXT_PROMPT.format_map({
+                'source_type': source_type,
+                'content': context_content,
+            })
 
-            response = await self._generate_content_async(prompt)
+            response = await self._coalescers['context'].submit(prompt)
             
             # Parse JSON response
             try:
-                # Try direct parsing first
-                result_data = json.loads(response.text)
-            except json.JSONDecodeError:
+                # Try direct typed decoding first
+                result = _RESPONSE_DECODERS[ContextAnalysisResponse].decode(response.text)
+            except msgspec.ValidationError:
+                # Well-formed JSON with some mismatched field types
+                result = _convert_response(msgspec.json.decode(response.text), ContextAnalysisResponse)
+            except msgspec.DecodeError:
                 # Log the failed response for debugging
-                logger.warning(f"JSON parsing failed in analyze_context. Response text: {response.text[:500]}...")
+                logger.warning("JSON parsing failed in analyze_context. Response text: %.500s...", response.text)
                 
                 # Try fallback parsing methods
                 result_data = self._extract_json_from_text(response.text)
                 
                 # Log the extraction results
-                logger.info(f"Extracted JSON result: {json.dumps(result_data, default=str)[:200]}...")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Extracted JSON result: %.200s...", json.dumps(result_data, default=str))
                 
-                # Ensure all required fields exist
+                # Ensure a summary exists; missing fields take their schema defaults
                 if not result_data.get('summary'):
                     logger.warning("No summary found in extracted JSON, using fallback")
                     result_data['summary'] = "Analysis extracted key information from content."
                     
-                # Set default values for any missing fields
-                for field in ['key_topics', 'urgency_indicators', 'potential_tasks', 'time_references']:
-                    if field not in result_data:
-                        result_data[field] = []
-                        
-                if 'sentiment_score' not in result_data:
-                    result_data['sentiment_score'] = 0.0
+                result = _convert_response(result_data, ContextAnalysisResponse)
             
             return ContextInsights(
-                summary=result_data.get('summary', ''),
-                key_topics=result_data.get('key_topics', []),
-                urgency_indicators=result_data.get('urgency_indicators', []),
-                potential_tasks=result_data.get('potential_tasks', []),
-                sentiment_score=float(result_data.get('sentiment_score', 0.0)),
-                time_references=result_data.get('time_references', [])
+                summary=result.summary,
+                key_topics=result.key_topics,
+                urgency_indicators=result.urgency_indicators,
+                potential_tasks=result.potential_tasks,
+                sentiment_score=result.sentiment_score,
+                time_references=result.time_references
             )
             
         except Exception as e:
-            logger.error(f"Error analyzing context: {str(e)}")
+            logger.error("Error analyzing context: %s", e)
             # Return default insights on error
             return ContextInsights(
                 summary="Error analyzing content",
@@ -201,8 +1232,43 @@ class GeminiAIService:
                 time_references=[]
             )
 
+    def _digest(self, context_data: List[Dict[str, Any]],
+                urgency_cache: Optional[Dict[int, bool]] = None,
+                pre_sorted: bool = False,
+                context_dates: Optional[List[datetime]] = None) -> ContextDigest:
+        """
+        Summarize the context and detect urgency and the referenced dates once
+        
+        Args:
+            context_data: List of relevant context entries
+            urgency_cache: Optional per-request urgency results keyed by id(context)
+            pre_sorted: Whether context_data is already sorted by urgency and recency
+            context_dates: Optional dates already extracted from context_data; with a
+                complete urgency_cache the context scan is skipped
+            
+        Returns:
+            ContextDigest shared by the analyses of a task
+        """
+        if urgency_cache is None:
+            urgency_cache = {}
+        context_data = self._with_parsed_dates(context_data)
+        current_date = timezone.now()
+        if context_dates and all(id(context) in urgency_cache for context in context_data):
+            has_urgent_context = any(urgency_cache[id(context)] for context in context_data)
+        else:
+            has_urgent_context, context_dates = self._scan_contexts(context_data, current_date, urgency_cache)
+        return ContextDigest(
+            summary=self._prepare_context_summary(context_data, urgency_cache, pre_sorted=pre_sorted),
+            urgent=has_urgent_context,
+            earliest_date=min(context_dates),
+            urgency_factors=("Urgent context detected",) if has_urgent_context else (),
+            current_date=current_date,
+            context_dates=tuple(context_dates)
+        )
+
     async def prioritize_task(self, task_data: Dict[str, Any], context_data: List[Dict[str, Any]], 
-                            user_preferences: Optional[Dict[str, Any]] = None) -> TaskPriority:
+                            user_preferences: Optional[Dict[str, Any]] = None,
+                            digest: Optional[ContextDigest] = None) -> TaskPriority:
         """
         Analyze and prioritize a task based on context and user preferences
         
@@ -210,229 +1276,83 @@ class GeminiAIService:
             task_data: Dictionary containing task information
             context_data: List of relevant context entries
             user_preferences: Optional user preferences for prioritization
+            digest: Optional precomputed ContextDigest for context_data
             
         Returns:
             TaskPriority object with priority analysis
         """
         try:
-            # Prepare context summary
-            context_summary = self._prepare_context_summary(context_data)
-            
-            # Check for urgent context
-            urgent_contexts = [ctx for ctx in context_data if self._has_urgency_indicators(ctx)]
-            has_urgent_context = len(urgent_contexts) > 0
-            
-            # Get current date and extract dates from context
-            current_date = timezone.now()
-            context_dates = self._extract_dates_from_context(context_data, current_date)
-            earliest_context_date = min(context_dates) if context_dates else None
-            
-            # Calculate date proximity for urgency assessment
-            date_urgency = "none"
-            if earliest_context_date:
-                days_difference = (earliest_context_date - current_date).total_seconds() / 86400
-                if days_difference < 1:  # Less than 1 day
-                    date_urgency = "critical"
-                elif days_difference < 2:  # Less than 2 days
-                    date_urgency = "high"
-                elif days_difference < 7:  # Less than a week
-                    date_urgency = "medium"
-            
-            # Perform complexity analysis on the task title and description
-            complexity_indicators = [
-                "complex", "challenging", "difficult", "intricate", "sophisticated",
-                "advanced", "complicated", "elaborate", "high-level", "comprehensive",
-                "extensive", "involved", "detailed", "critical", "crucial",
-                "essential", "vital", "significant", "major", "important",
-                "key", "central", "fundamental", "pivotal", "primary",
-                "strategic", "technical", "review", "analysis", "design",
-                "implementation", "migration", "integration", "deployment", "optimization",
-                "reconfiguration", "restructuring", "revamp", "overhaul", "refactor",
-                "system", "framework", "architecture", "infrastructure", "platform",
-                "meeting", "presentation", "urgent", "immediate", "stakeholder"
-            ]
-            
-            # Simplicity indicators - words that suggest a task is simpler
-            simplicity_indicators = [
-                "simple", "basic", "easy", "straightforward", "quick", 
-                "small", "minor", "trivial", "beginner", "starter",
-                "practice", "exercise", "tutorial", "learning", "demo",
-                "example", "sample", "test", "prototype", "hobby",
-                "game", "html", "css", "frontend", "ui", "simple app",
-                "tic-tac-toe", "tic tac toe", "tictactoe", "toy project", "practice project"
-            ]
-            
-            # Strong simplicity phrases that should almost always result in Low priority
-            strong_simplicity_phrases = [
-                "simple game", "basic game", "simple html", "basic html", 
-                "simple app", "basic app", "learning project", "practice project",
-                "simple tic-tac-toe", "basic tic-tac-toe", "simple tictactoe", 
-                "html game", "css game", "beginner project", "starter project"
-            ]
-            
-            task_text = f"{task_data.get('title', '')} {task_data.get('description', '')}".lower()
-            complexity_count = sum(1 for indicator in complexity_indicators if indicator in task_text)
-            simplicity_count = sum(1 for indicator in simplicity_indicators if indicator in task_text)
-            
-            # Check for strong simplicity phrases that should force low priority
-            has_strong_simplicity = any(phrase in task_text for phrase in strong_simplicity_phrases)
-            
-            # Adjust complexity score based on simplicity indicators
-            # More simplicity indicators should reduce the complexity score
-            complexity_score = min(10, complexity_count * 0.8 - simplicity_count * 1.5)
-            
-            # If strong simplicity phrases are found, force a very low complexity score
-            if has_strong_simplicity:
-                complexity_score = min(1.5, complexity_score)  # Cap at 1.5 for strong simplicity indicators
-                logger.info(f"Strong simplicity phrase detected in task: '{task_data.get('title', '')}'. Forcing low complexity score.")
-                
-            complexity_score = max(0, complexity_score)  # Ensure it doesn't go below 0
-            
-            prompt = f"""
-            Analyze the following task and provide a priority score based on the given context and complexity:
-
-            Task Information:
-            - Title: {task_data.get('title', '')}
-            - Description: {task_data.get('description', '')}
-            - Category: {task_data.get('category', 'None')}
-            - User Priority: {task_data.get('priority', 'None')}
-            - Deadline: {task_data.get('deadline', 'None')}
-            - Estimated Duration: {task_data.get('estimated_duration', 'Unknown')} minutes
-            - Complexity Score (auto-detected): {complexity_score}/10
-
-            Current Context:
-            {context_summary}
-            
-            {'URGENT CONTEXT DETECTED: There are urgent items in the context that may require immediate attention and may affect this task priority.' if has_urgent_context else ''}
-            {'IMPORTANT DATE DETECTED: ' + earliest_context_date.strftime('%Y-%m-%d') + ' is an important date in the context that requires ' + date_urgency.upper() + ' priority attention.' if earliest_context_date else ''}
-
-            User Preferences:
-            {json.dumps(user_preferences or {}, indent=2)}
-
-            Please analyze and provide a JSON response with:
-            {{
-                "priority_score": 7.5,
-                "priority_label": "High",
-                "reasoning": "Detailed explanation of the priority score",
-                "urgency_factors": ["factor1", "factor2", "factor3"],
-                "context_relevance": 0.8,
-                "action_timeframe": "Recommended action timeframe (e.g., 'Today', 'This week', etc.)",
-                "impact_assessment": "Brief assessment of task's impact and importance"
-            }}
-
-            Priority scoring guidelines:
-            - 9-10: Critical/Urgent (immediate action required)
-            - 7-8: High priority (should be done soon)
-            - 5-6: Medium priority (normal importance)
-            - 3-4: Low priority (can be delayed)
-            - 1-2: Very low priority (optional/nice to have)
-
-            Provide an appropriate priority_label that matches the score ("Critical", "High", "Medium", "Low", or "Very Low").
-
-            Consider these factors in order of importance:
-            1. Deadline proximity and importance
-            2. Context relevance and urgency indicators
-            3. Task complexity and estimated duration
-            4. Dependencies on other tasks or people
-            5. User preferences and work patterns
-            6. Potential impact if delayed
-            
-            IMPORTANT GUIDELINES:
-            - Simple tasks (like basic HTML/CSS projects, tutorials, practice exercises, games, demos) MUST be assigned LOW priority unless there are specific urgent deadlines or critical dependencies.
-            - SPECIFICALLY, any task involving a simple game like tic-tac-toe, especially in HTML/CSS/JavaScript, should ALWAYS be LOW priority.
-            - Tasks with educational or learning purposes should ALWAYS be LOW priority unless they are prerequisites for higher priority work.
-            - Tasks with high complexity (score > 6) should generally receive High or Critical priority.
-            - Tasks with low complexity (score < 2) MUST receive Low priority.
-            - Always consider the actual scope and impact of the task rather than just the presence of certain keywords.
-            
-            EXPLICIT EXAMPLES OF LOW PRIORITY TASKS:
-            - Creating a tic-tac-toe game in HTML/CSS/JavaScript
-            - Building a simple calculator app
-            - Making a basic portfolio website
-            - Learning exercises and tutorials
-            - Small hobby projects            
-            """
+            # Prepare context summary, urgency and the earliest date it mentions
+            if digest is None:
+                digest = self._digest(context_data)
+            context_summary = digest.summary
+            has_urgent_context = digest.urgent
+            earliest_context_date = digest.earliest_date
+            
+            # Date proximity and complexity analysis of the task title and description
+            features = _build_prioritize_features(task_data, digest)
+            days_difference = features.days_difference
+            date_urgency = features.date_urgency
+            urgency_min_score = features.urgency_min_score
+            complexity_score = features.complexity_score
+            
+            prompt = _PRIORITIZE_PROMPT.format_map({
+                'title': task_data.get('title', ''),
+                'description': task_data.get('description', ''),
+                'category': task_data.get('category', 'None'),
+                'priority': task_data.get('priority', 'None'),
+                'deadline': task_data.get('deadline', 'None'),
+                'estimated_duration': task_data.get('estimated_duration', 'Unknown'),
+                'complexity_score': complexity_score,
+                'context_summary': context_summary,
+                'urgent_note': _PRIORITIZE_URGENT_NOTE if has_urgent_context else '',
+                'date_note': _PRIORITIZE_DATE_NOTE.format(
+                    date=earliest_context_date.strftime('%Y-%m-%d'),
+                    urgency=date_urgency.upper()
+                ) if earliest_context_date else '',
+                'user_preferences': json.dumps(user_preferences or {}, indent=2, sort_keys=True),
+            })
 
-            response = await self._generate_content_async(prompt)
-            
-            try:
-                result_data = json.loads(response.text)
-            except json.JSONDecodeError:
-                result_data = self._extract_json_from_text(response.text)
-            
-            # Check if this is a simple task that should be forced to low priority
-            task_text = f"{task_data.get('title', '')} {task_data.get('description', '')}".lower()
+            response = await self._coalescers['priority'].submit(prompt)
+            result = self._decode_response(response.text, PrioritizeResponse)
             
             # Force low priority for specific simple tasks regardless of AI response
-            force_low_priority = False
-            
-            # Check for specific simple task patterns
-            simple_task_patterns = [
-                "tic-tac-toe", "tic tac toe", "tictactoe",
-                "simple html", "basic html", "html game",
-                "learning project", "practice project", "simple game",
-                "tutorial project", "beginner project"
-            ]
-            
-            if any(pattern in task_text for pattern in simple_task_patterns):
-                force_low_priority = True
-                logger.info(f"Forcing LOW priority for simple task: '{task_data.get('title', '')}' based on pattern match")
+            force_low_priority = features.is_simple_task
+            if force_low_priority:
+                logger.info("Forcing LOW priority for simple task: '%s' based on pattern match", task_data.get('title', ''))
             
-            # Set default priority label based on score if not provided
-            score = float(result_data.get('priority_score', 5.0))
+            score = result.priority_score
+            reasoning = result.reasoning
             
             # Override score for simple tasks
             if force_low_priority:
                 score = 2.5  # Force a low priority score
-                result_data['priority_score'] = score
-                result_data['priority_label'] = "Low"  # Explicitly set to Low
-                result_data['reasoning'] = f"This is a simple task that should be low priority. {result_data.get('reasoning', '')}"
-                logger.info(f"Explicitly setting priority_label to 'Low' for simple task: '{task_data.get('title', '')}'")  
-            
-            # Only calculate priority label if not already set or if we need to force it
-            elif 'priority_label' not in result_data:
-                if score >= 9.0:
-                    priority_label = "Critical"
-                elif score >= 7.0:
-                    priority_label = "High"
-                elif score >= 5.0:
-                    priority_label = "Medium"
-                elif score >= 2.0:
-                    priority_label = "Low"
-                else:
-                    priority_label = "Very Low"
-                    
-                result_data['priority_label'] = priority_label
+                reasoning = f"This is a simple task that should be low priority. {reasoning}"
+                logger.info("Explicitly setting a Low priority score for simple task: '%s'", task_data.get('title', ''))
             
             # Update context_relevance based on detected urgency
-            context_relevance = float(result_data.get('context_relevance', 0.0))
+            context_relevance = result.context_relevance
             if has_urgent_context and earliest_context_date and context_relevance < 0.7:
                 # Increase context relevance if urgent context is detected but not reflected in AI response
-                days_difference = (earliest_context_date - current_date).total_seconds() / 86400
                 if days_difference < 2:  # If we have urgent context within 48 hours
                     context_relevance = max(0.8, context_relevance)
-                    logger.info(f"Increased context_relevance to {context_relevance} due to detected urgent context")
+                    logger.info("Increased context_relevance to %s due to detected urgent context", context_relevance)
                 
             # Adjust score based on urgent context if needed
             adjusted_score = score
-            if has_urgent_context and score < 7.0 and earliest_context_date:
-                days_difference = (earliest_context_date - current_date).total_seconds() / 86400
-                if days_difference < 1:  # Less than 1 day
-                    adjusted_score = max(9.0, score)
-                    logger.info(f"Increased priority score from {score} to {adjusted_score} due to critical urgency")
-                elif days_difference < 2:  # Less than 2 days
-                    adjusted_score = max(8.0, score)
-                    logger.info(f"Increased priority score from {score} to {adjusted_score} due to high urgency")
+            if has_urgent_context and score < 7.0 and urgency_min_score:
+                adjusted_score = max(urgency_min_score, score)
+                logger.info("Increased priority score from %s to %s due to %s urgency", score, adjusted_score, date_urgency)
                 
             return TaskPriority(
                 score=adjusted_score,
-                reasoning=result_data.get('reasoning', '') + ("\n(Score adjusted based on urgent context)" if adjusted_score > score else ""),
-                urgency_factors=result_data.get('urgency_factors', []) + (["Urgent context detected"] if has_urgent_context else []),
+                reasoning=reasoning + ("\n(Score adjusted based on urgent context)" if adjusted_score > score else ""),
+                urgency_factors=result.urgency_factors + list(digest.urgency_factors),
                 context_relevance=context_relevance
             )
             
         except Exception as e:
-            logger.error(f"Error prioritizing task: {str(e)}")
+            logger.error("Error prioritizing task: %s", e)
             return TaskPriority(
                 score=5.0,
                 reasoning="Error in AI analysis, using default priority",
@@ -441,7 +1361,8 @@ class GeminiAIService:
             )
 
     async def suggest_deadline(self, task_data: Dict[str, Any], context_data: List[Dict[str, Any]], 
-                             current_workload: Optional[Dict[str, Any]] = None) -> DeadlineSuggestion:
+                             current_workload: Optional[Dict[str, Any]] = None,
+                             digest: Optional[ContextDigest] = None) -> DeadlineSuggestion:
         """
         Suggest a realistic deadline for a task based on complexity and context
         
@@ -449,106 +1370,71 @@ class GeminiAIService:
             task_data: Dictionary containing task information
             context_data: List of relevant context entries
             current_workload: Optional information about current task load
+            digest: Optional precomputed ContextDigest for context_data
             
         Returns:
             DeadlineSuggestion object with deadline recommendation
         """
         try:
-            current_date = timezone.now()
-            context_summary = self._prepare_context_summary(context_data)
-            workload_info = json.dumps(current_workload or {}, indent=2)
-            
-            # Check if there are urgent context items that should affect deadline
-            urgent_contexts = [ctx for ctx in context_data if self._has_urgency_indicators(ctx)]
-            has_urgent_context = len(urgent_contexts) > 0
-            
-            # Extract near-term dates from context if they exist
-            context_dates = self._extract_dates_from_context(context_data, current_date)
-            earliest_context_date = min(context_dates) if context_dates else None
-            
-            prompt = f"""
-            Suggest a realistic deadline for the following task based on its complexity and current context:
-
-            Task Information:
-            - Title: {task_data.get('title', '')}
-            - Description: {task_data.get('description', '')}
-            - Category: {task_data.get('category', 'None')}
-            - Estimated Duration: {task_data.get('estimated_duration', 'Unknown')} minutes
-            - User Suggested Deadline: {task_data.get('deadline', 'None')}
-
-            Current Context:
-            {context_summary}
-
-            Current Workload:
-            {workload_info}
-
-            Current Date/Time: {current_date.isoformat()}
-
-            {'URGENT CONTEXT DETECTED: There are urgent items in the context that may require immediate attention and may affect this task deadline.' if has_urgent_context else ''}
-            {'IMPORTANT DATE DETECTED: ' + earliest_context_date.strftime('%Y-%m-%d') + ' is an important date in the context that may affect this deadline.' if earliest_context_date else ''}
-
-            IMPORTANT: The suggested deadline MUST be in the future relative to the current date ({current_date.strftime('%B %d, %Y')}). 
-            DO NOT suggest any date in the past.
-
-            Please provide a JSON response with:
-            {{
-                "suggested_deadline": "Future date in ISO format",
-                "confidence": 0.85,
-                "reasoning": "Detailed explanation for the suggested deadline",
-                "factors_considered": ["factor1", "factor2", "factor3"],
-                "context_relevance": 0.95,
-                "urgent_context_impact": "High/Medium/Low/None"
-            }}
-
-            Consider:
-            1. Task complexity and estimated duration
-            2. Current workload and availability
-            3. Context urgency indicators
-            4. Buffer time for unexpected delays
-            5. Dependencies and prerequisites
-            6. Work-life balance considerations
-            7. Realistic time estimation based on similar tasks
-
-            Provide the deadline in ISO format and ensure it's realistic and achievable.
-            """
+            # Context summary plus urgent items and near-term dates that should affect deadline
+            if digest is None:
+                digest = self._digest(context_data)
+            current_date = digest.current_date
+            default_deadline = current_date + timedelta(days=7)
+            context_summary = digest.summary
+            has_urgent_context = digest.urgent
+            earliest_context_date = digest.earliest_date
+            workload_info = json.dumps(current_workload or {}, indent=2, sort_keys=True)
+            
+            prompt = _DEADLINE_PROMPT.format_map({
+                'title': task_data.get('title', ''),
+                'description': task_data.get('description', ''),
+                'category': task_data.get('category', 'None'),
+                'estimated_duration': task_data.get('estimated_duration', 'Unknown'),
+                'deadline': task_data.get('deadline', 'None'),
+                'context_summary': context_summary,
+                'workload_info': workload_info,
+                'current_datetime': current_date.isoformat(),
+                'urgent_note': _DEADLINE_URGENT_NOTE if has_urgent_context else '',
+                'date_note': _DEADLINE_DATE_NOTE.format(
+                    date=earliest_context_date.strftime('%Y-%m-%d')
+                ) if earliest_context_date else '',
+                'current_date': current_date.strftime('%B %d, %Y'),
+            })
 
-            response = await self._generate_content_async(prompt)
-            
-            try:
-                result_data = json.loads(response.text)
-            except json.JSONDecodeError:
-                result_data = self._extract_json_from_text(response.text)
+            response = await self._coalescers['deadline'].submit(prompt)
+            result = self._decode_response(response.text, DeadlineResponse)
+            reasoning = result.reasoning
+            factors_considered = result.factors_considered
             
             # Parse the suggested deadline
-            deadline_str = result_data.get('suggested_deadline', '')
             try:
-                suggested_deadline = datetime.fromisoformat(deadline_str.replace('Z', '+00:00'))
+                suggested_deadline = _parse_iso_datetime(result.suggested_deadline)
                 
                 # Validate that the suggested deadline is in the future
                 if suggested_deadline <= current_date:
-                    logger.warning(f"AI suggested a deadline in the past: {suggested_deadline}. Using fallback date.")
+                    logger.warning("AI suggested a deadline in the past: %s. Using fallback date.", suggested_deadline)
                     # Set a fallback deadline 7 days from now
-                    suggested_deadline = current_date + timedelta(days=7)
+                    suggested_deadline = default_deadline
                     
                     # Update reasoning to mention the correction
-                    original_reasoning = result_data.get('reasoning', '')
-                    result_data['reasoning'] = f"[SYSTEM CORRECTION: Original suggested date was in the past. Adjusted to 7 days from now.] {original_reasoning}"
-                    result_data['factors_considered'] = ["System correction applied"] + result_data.get('factors_considered', [])
+                    reasoning = f"[SYSTEM CORRECTION: Original suggested date was in the past. Adjusted to 7 days from now.] {reasoning}"
+                    factors_considered = ["System correction applied"] + factors_considered
                 
-            except (ValueError, AttributeError):
+            except (ValueError, TypeError, AttributeError):
                 # Fallback to a reasonable default (7 days from now)
-                suggested_deadline = current_date + timedelta(days=7)
-                result_data['reasoning'] = "Failed to parse suggested deadline, using default (7 days from now)"
+                suggested_deadline = default_deadline
+                reasoning = "Failed to parse suggested deadline, using default (7 days from now)"
             
             return DeadlineSuggestion(
                 suggested_deadline=suggested_deadline,
-                confidence=float(result_data.get('confidence', 0.5)),
-                reasoning=result_data.get('reasoning', ''),
-                factors_considered=result_data.get('factors_considered', [])
+                confidence=result.confidence,
+                reasoning=reasoning,
+                factors_considered=factors_considered
             )
             
         except Exception as e:
-            logger.error(f"Error suggesting deadline: {str(e)}")
+            logger.error("Error suggesting deadline: %s", e)
             return DeadlineSuggestion(
                 suggested_deadline=timezone.now() + timedelta(days=7),
                 confidence=0.5,
@@ -571,50 +1457,26 @@ class GeminiAIService:
             CategorySuggestion object with category and tag recommendations
         """
         try:
-            prompt = f"""
-            Suggest appropriate categories and tags for the following task:
-
-            Task Information:
-            - Title: {task_data.get('title', '')}
-            - Description: {task_data.get('description', '')}
-            - Current Category: {task_data.get('category', 'None')}
-
-            Existing Categories: {', '.join(existing_categories)}
-            Existing Tags: {', '.join(existing_tags)}
-
-            Please provide a JSON response with:
-            {{
-                "suggested_categories": ["category1", "category2"],
-                "suggested_tags": ["tag1", "tag2", "tag3"],
-                "confidence": 0.9,
-                "reasoning": "Explanation for the suggestions"
-            }}
-
-            Guidelines:
-            1. Prefer existing categories/tags when appropriate
-            2. Suggest new ones only if existing ones don't fit well
-            3. Categories should be broad (e.g., "Work", "Personal", "Health")
-            4. Tags should be specific (e.g., "urgent", "meeting", "research")
-            5. Limit suggestions to 2-3 categories and 3-5 tags
-            6. Consider the task's nature, urgency, and context
-            """
+            prompt = _CATEGORIES_PROMPT.format_map({
+                'title': task_data.get('title', ''),
+                'description': task_data.get('description', ''),
+                'category': task_data.get('category', 'None'),
+                'existing_categories': ', '.join(existing_categories),
+                'existing_tags': ', '.join(existing_tags),
+            })
 
-            response = await self._generate_content_async(prompt)
-            
-            try:
-                result_data = json.loads(response.text)
-            except json.JSONDecodeError:
-                result_data = self._extract_json_from_text(response.text)
+            response = await self._coalescers['categories'].submit(prompt)
+            result = self._decode_response(response.text, CategoriesResponse)
             
             return CategorySuggestion(
-                suggested_categories=result_data.get('suggested_categories', []),
-                suggested_tags=result_data.get('suggested_tags', []),
-                confidence=float(result_data.get('confidence', 0.5)),
-                reasoning=result_data.get('reasoning', '')
+                suggested_categories=result.suggested_categories,
+                suggested_tags=result.suggested_tags,
+                confidence=result.confidence,
+                reasoning=result.reasoning
             )
             
         except Exception as e:
-            logger.error(f"Error suggesting categories and tags: {str(e)}")
+            logger.error("Error suggesting categories and tags: %s", e)
             return CategorySuggestion(
                 suggested_categories=[],
                 suggested_tags=[],
@@ -625,7 +1487,8 @@ class GeminiAIService:
     async def suggest_schedule(self, task_data: Dict[str, Any], 
                             context_data: List[Dict[str, Any]],
                             user_preferences: Optional[Dict[str, Any]] = None,
-                            current_workload: Optional[Dict[str, Any]] = None) -> SchedulingSuggestion:
+                            current_workload: Optional[Dict[str, Any]] = None,
+                            digest: Optional[ContextDigest] = None) -> SchedulingSuggestion:
         """
         Suggest optimal scheduling for a task based on context, workload, and user preferences
         
@@ -634,17 +1497,26 @@ class GeminiAIService:
             context_data: List of relevant context entries
             user_preferences: Optional user preferences for scheduling
             current_workload: Optional information about current task load
+            digest: Optional precomputed ContextDigest for context_data
             
         Returns:
             SchedulingSuggestion object with scheduling recommendations
         """
+        current_date = timezone.now()
         try:
-            # Prepare context summary
-            context_summary = self._prepare_context_summary(context_data)
-            
-            # Extract time references from context
-            current_date = timezone.now()
-            context_dates = self._extract_dates_from_context(context_data, current_date)
+            cache_key = self._schedule_cache_key(task_data, context_data, user_preferences, current_workload,
+                                                 current_date)
+            if cache_key is not None:
+                cached = self._schedule_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+                    
+            # Reuse the shared context summary and time references
+            if digest is None:
+                digest = self._digest(context_data)
+            context_summary = digest.summary
+            current_date = digest.current_date
+            context_dates = digest.context_dates
             
             # Extract working hours from user preferences
             working_hours_start = "09:00"
@@ -667,7 +1539,7 @@ class GeminiAIService:
             if task_deadline:
                 try:
                     if isinstance(task_deadline, str):
-                        deadline_date = datetime.fromisoformat(task_deadline.replace('Z', '+00:00'))
+                        deadline_date = _parse_iso_datetime(task_deadline)
                     else:
                         deadline_date = task_deadline
                     deadline_str = deadline_date.strftime("%Y-%m-%d %H:%M")
@@ -694,64 +1566,32 @@ class GeminiAIService:
                     context_dates_info += f" and {len(context_dates) - 3} more"
             
             # Create prompt for scheduling suggestion
-            prompt = f"""
-            Suggest an optimal schedule for the following task based on the provided context, workload, and preferences.
-            
-            Task Information:
-            - Title: {task_title}
-            - Description: {task_description}
-            - Priority: {task_priority}
-            - Deadline: {deadline_str}
-            - Estimated Duration: {task_duration} minutes
-            
-            Current Context:
-            {context_summary}
-            {context_dates_info}
-            
-            Current Workload:
-            {workload_info}
-            
-            User Preferences:
-            - Working Hours: {working_hours_start} to {working_hours_end}
-            
-            Current Date and Time: {current_date.strftime('%Y-%m-%d %H:%M')}
-            
-            Please provide a JSON response with the following structure:
-            {{
-                "suggested_start_time": "YYYY-MM-DD HH:MM",
-                "suggested_end_time": "YYYY-MM-DD HH:MM",
-                "confidence": 0.85,
-                "reasoning": "Detailed explanation of why this time slot is suggested",
-                "factors_considered": ["factor1", "factor2", "factor3"],
-                "alternative_slots": [
-                    {{
-                        "start_time": "YYYY-MM-DD HH:MM",
-                        "end_time": "YYYY-MM-DD HH:MM",
-                        "reason": "Why this is an alternative option"
-                    }}
-                ]
-            }}
-            
-            Guidelines for scheduling:
-            1. High priority tasks should be scheduled earlier in the day when possible
-            2. Tasks with approaching deadlines should be prioritized
-            3. Consider context information for optimal timing
-            4. Schedule within working hours unless the task is urgent
-            5. Provide at least 2 alternative time slots
-            6. If there are specific dates mentioned in the context that are relevant to this task, prioritize scheduling near those dates
-            7. For tasks without deadlines, suggest reasonable timing based on priority and estimated duration
-            """
+            prompt = _SCHEDULE_PROMPT.format_map({
+                'title': task_title,
+                'description': task_description,
+                'priority': task_priority,
+                'deadline': deadline_str,
+                'estimated_duration': task_duration,
+                'context_summary': context_summary,
+                'context_dates_info': context_dates_info,
+                'workload_info': workload_info,
+                'working_hours_start': working_hours_start,
+                'working_hours_end': working_hours_end,
+                'current_datetime': current_date.strftime('%Y-%m-%d %H:%M'),
+            })
 
-            response = await self._generate_content_async(prompt)
+            # Batched with concurrent scheduling requests; a lone prompt is streamed so
+            # parsing starts as soon as its JSON object is complete
+            response = await self._coalescers['schedule'].submit(prompt)
             
             try:
-                result_data = json.loads(response.text)
+                result_data = _loads(response.text)
             except json.JSONDecodeError:
                 result_data = self._extract_json_from_text(response.text)
                 
                 # If extraction failed, provide default values
                 if not result_data:
-                    logger.warning(f"Failed to parse JSON response for scheduling suggestion: {response.text[:200]}...")
+                    logger.warning("Failed to parse JSON response for scheduling suggestion: %.200s...", response.text)
                     result_data = {}
             
             # Parse the start and end times
@@ -760,8 +1600,8 @@ class GeminiAIService:
                 end_time_str = result_data.get('suggested_end_time')
                 
                 if start_time_str and end_time_str:
-                    suggested_start_time = datetime.strptime(start_time_str, "%Y-%m-%d %H:%M")
-                    suggested_end_time = datetime.strptime(end_time_str, "%Y-%m-%d %H:%M")
+                    suggested_start_time = _parse_model_dt(start_time_str)
+                    suggested_end_time = _parse_model_dt(end_time_str)
                 else:
                     # Default to tomorrow during working hours if no suggestion
                     tomorrow = current_date + timedelta(days=1)
@@ -769,7 +1609,7 @@ class GeminiAIService:
                     suggested_start_time = tomorrow
                     suggested_end_time = tomorrow + timedelta(minutes=task_duration)
             except (ValueError, TypeError) as e:
-                logger.error(f"Error parsing suggested times: {str(e)}")
+                logger.error("Error parsing suggested times: %s", e)
                 # Default to tomorrow during working hours
                 tomorrow = current_date + timedelta(days=1)
                 tomorrow = tomorrow.replace(hour=10, minute=0, second=0, microsecond=0)  # 10:00 AM
@@ -780,8 +1620,8 @@ class GeminiAIService:
             alternative_slots = []
             for alt_slot in result_data.get('alternative_slots', []):
                 try:
-                    alt_start = datetime.strptime(alt_slot.get('start_time'), "%Y-%m-%d %H:%M")
-                    alt_end = datetime.strptime(alt_slot.get('end_time'), "%Y-%m-%d %H:%M")
+                    alt_start = _parse_model_dt(alt_slot.get('start_time'))
+                    alt_end = _parse_model_dt(alt_slot.get('end_time'))
                     alternative_slots.append({
                         'start_time': alt_start.isoformat(),
                         'end_time': alt_end.isoformat(),
@@ -791,22 +1631,18 @@ class GeminiAIService:
                     # Skip invalid alternative slots
                     continue
             
-            # If we don't have enough alternative slots, add some defaults
-            while len(alternative_slots) < 2:
-                # Add slots later in the day or next day
-                next_slot_start = suggested_start_time + timedelta(hours=3)
-                next_slot_end = next_slot_start + timedelta(minutes=task_duration)
-                
+            # If we don't have enough alternative slots, add defaults every 3 hours
+            # after the suggested start (which itself is left untouched)
+            task_timedelta = timedelta(minutes=task_duration)
+            for k in range(1, max(0, 2 - len(alternative_slots)) + 1):
+                next_slot_start = suggested_start_time + timedelta(hours=3 * k)
                 alternative_slots.append({
                     'start_time': next_slot_start.isoformat(),
-                    'end_time': next_slot_end.isoformat(),
+                    'end_time': (next_slot_start + task_timedelta).isoformat(),
                     'reason': 'Automatically generated alternative'
                 })
-                
-                # Move to next day for second alternative if needed
-                suggested_start_time = next_slot_start
             
-            return SchedulingSuggestion(
+            suggestion = SchedulingSuggestion(
                 suggested_start_time=suggested_start_time,
                 suggested_end_time=suggested_end_time,
                 confidence=float(result_data.get('confidence', 0.7)),
@@ -814,9 +1650,12 @@ class GeminiAIService:
                 factors_considered=result_data.get('factors_considered', ['Task priority', 'Estimated duration']),
                 alternative_slots=alternative_slots
             )
+            if cache_key is not None:
+                self._schedule_cache.set(cache_key, suggestion)
+            return suggestion
             
         except Exception as e:
-            logger.error(f"Error suggesting schedule: {str(e)}")
+            logger.error("Error suggesting schedule: %s", e)
             # Return default scheduling suggestion
             tomorrow = current_date + timedelta(days=1)
             tomorrow = tomorrow.replace(hour=10, minute=0, second=0, microsecond=0)  # 10:00 AM
@@ -833,40 +1672,84 @@ class GeminiAIService:
                 }]
             )
             
+    @staticmethod
+    def _schedule_cache_key(task_data: Dict[str, Any], context_data: List[Dict[str, Any]],
+                            user_preferences: Optional[Dict[str, Any]],
+                            current_workload: Optional[Dict[str, Any]],
+                            current_date: datetime) -> Optional[Tuple]:
+        """
+        Build a scheduling cache key from the inputs the scheduling prompt depends on
+        
+        Args:
+            task_data: Dictionary containing task information
+            context_data: List of relevant context entries
+            user_preferences: Optional user preferences for scheduling
+            current_workload: Optional information about current task load
+            current_date: Time of the request; suggested slots are only reused
+                within the same hour
+            
+        Returns:
+            Hashable key, or None if the context entries cannot be identified
+        """
+        context_ids = tuple(context.get('id') for context in context_data)
+        if None in context_ids:
+            return None
+        # Entries can be edited in place, so also key on what the prompt reads from them
+        context_text = json.dumps([
+            (context.get('content'), context.get('content_date'), context.get('source_type'))
+            for context in context_data
+        ], default=str)
+        context_hash = hashlib.blake2b(context_text.encode('utf-8'), digest_size=16).hexdigest()
+        preferences = user_preferences or {}
+        workload = current_workload or {}
+        key = (
+            current_date.strftime('%Y-%m-%dT%H'),
+            task_data.get('id'),
+            task_data.get('updated_at'),
+            task_data.get('title'),
+            task_data.get('description'),
+            task_data.get('priority'),
+            task_data.get('deadline'),
+            task_data.get('estimated_duration'),
+            context_ids,
+            context_hash,
+            preferences.get('working_hours_start'),
+            preferences.get('working_hours_end'),
+            workload.get('pending_tasks'),
+            workload.get('high_priority_tasks'),
+            len(workload.get('upcoming_deadlines') or ()),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     async def enhance_task_description(self, task_data: Dict[str, Any], 
-                                     context_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+                                     context_data: List[Dict[str, Any]],
+                                     digest: Optional[ContextDigest] = None) -> Dict[str, Any]:
         """
         Enhance task description with context-aware details
         
         Args:
             task_data: Dictionary containing task information
             context_data: List of relevant context entries
+            digest: Optional precomputed ContextDigest for context_data
             
         Returns:
             Dictionary with enhanced description or error information
         """
         try:
-            context_summary = self._prepare_context_summary(context_data)
+            if digest is not None:
+                context_summary = digest.summary
+            else:
+                context_summary = self._prepare_context_summary(self._with_parsed_dates(context_data))
             
-            prompt = f"""
-            Enhance the following task description with relevant context and details:
-
-            Original Task:
-            - Title: {task_data.get('title', '')}
-            - Description: {task_data.get('description', '')}
-
-            Relevant Context:
-            {context_summary}
-
-            Please provide an enhanced description that:
-            1. Maintains the original intent and scope
-            2. Adds relevant context and background information
-            3. Includes specific details that might be helpful
-            4. Suggests potential steps or considerations
-            5. Remains concise and actionable
-
-            Return only the enhanced description text, not JSON.
-            """
+            prompt = _ENHANCE_DESCRIPTION_PROMPT.format_map({
+                'title': task_data.get('title', ''),
+                'description': task_data.get('description', ''),
+                'context_summary': context_summary,
+            })
 
             response = await self._generate_content_async(prompt)
             enhanced_text = response.text.strip()
@@ -879,7 +1762,7 @@ class GeminiAIService:
             }
             
         except Exception as e:
-            logger.error(f"Error enhancing task description: {str(e)}")
+            logger.error("Error enhancing task description: %s", e)
             return {
                 "success": False,
                 "enhanced_text": None,
@@ -888,39 +1771,30 @@ class GeminiAIService:
                 "is_enhanced": False
             }
 
-    async def _generate_content_async(self, prompt: str) -> Any:
+    async def _generate_content_async(self, prompt: str, max_output_tokens: int = 1024) -> Any:
         """
         Generate content using Gemini API asynchronously
         
         Args:
             prompt: The prompt to send to the AI model
+            max_output_tokens: Output token budget (raised for batched prompts)
             
         Returns:
             Generated response object
         """
+        cached = self._get_cached_response(prompt, max_output_tokens)
+        if cached is not None:
+            return cached
+            
+        cache_prompt = prompt
         try:
             # Set retry parameters
             max_retries = 2
             retry_count = 0
             retry_delay = 1  # seconds
             
-            # Add explicit instructions for JSON formatting
-            if "JSON" in prompt:
-                # Strengthen JSON instruction
-                prompt = prompt + """
-                
-                IMPORTANT: Return ONLY valid, parseable JSON without any additional text, markdown formatting or code blocks.
-                Do not include backticks, the word 'json', or any other text before or after the JSON object.
-                The response should be a single, valid JSON object and nothing else.
-                """
-            
+            prompt, generation_config = self._build_request(prompt, max_output_tokens)
             loop = asyncio.get_event_loop()
-            generation_config = {
-                'temperature': 0.2,
-                'top_p': 0.95,
-                'top_k': 40,
-                'max_output_tokens': 1024,
-            }
             
             while retry_count <= max_retries:
                 try:
@@ -933,10 +1807,11 @@ class GeminiAIService:
                     )
                     
                     # Run the synchronous function in the executor
-                    response = await loop.run_in_executor(None, generate_func)
+                    response = await loop.run_in_executor(self._executor, generate_func)
                     
                     # Check if response is valid
                     if hasattr(response, 'text') and response.text.strip():
+                        self._cache_response(cache_prompt, response.text, max_output_tokens)
                         return response
                     else:
                         raise ValueError("Empty or invalid response received from API")
@@ -944,25 +1819,159 @@ class GeminiAIService:
                 except Exception as inner_e:
                     retry_count += 1
                     if retry_count > max_retries:
-                        logger.error(f"All retries failed in Gemini API call: {str(inner_e)}")
+                        logger.error("All retries failed in Gemini API call: %s", inner_e)
                         raise
                     
-                    logger.warning(f"Retry {retry_count} after error: {str(inner_e)}")
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+                    logger.warning("Retry %d after error: %s", retry_count, inner_e)
+                    # Exponential backoff, jittered so concurrent retries don't hit Gemini in lockstep
+                    await asyncio.sleep(retry_delay * (0.5 + random.random()))
+                    retry_delay *= 2
             
             raise Exception("Failed to get valid response from Gemini API after retries")
             
         except Exception as e:
-            logger.error(f"Error in Gemini API call: {str(e)}")
+            logger.error("Error in Gemini API call: %s", e)
             raise
 
-    def _prepare_context_summary(self, context_data: List[Dict[str, Any]]) -> str:
+    @staticmethod
+    def _build_request(prompt: str, max_output_tokens: int) -> Tuple[str, Dict[str, Any]]:
+        """Finalize a prompt and build the generation config for a Gemini request"""
+        # Add explicit instructions for JSON formatting
+        if "JSON" in prompt:
+            # Strengthen JSON instruction
+            prompt = prompt + _JSON_INSTRUCTION
+        
+        generation_config = dict(_GENERATION_CONFIG, max_output_tokens=max_output_tokens)
+        return prompt, generation_config
+
+    async def _generate_content_stream(self, prompt: str, max_output_tokens: int = 1024):
+        """
+        Stream generated text from the Gemini API chunk by chunk
+        
+        The synchronous streaming call runs in the executor and hands chunks
+        back to the event loop as they arrive; closing the generator early
+        stops the producer at its next chunk.
+        
+        Args:
+            prompt: The prompt to send to the AI model
+            max_output_tokens: Output token budget
+            
+        Yields:
+            Text chunks in arrival order
+        """
+        prompt, generation_config = self._build_request(prompt, max_output_tokens)
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        stop = threading.Event()
+        
+        def put(item):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # The event loop is already gone, nobody is listening anymore
+                stop.set()
+        
+        def produce():
+            try:
+                response = self.model.generate_content(
+                    contents=prompt,
+                    generation_config=generation_config,
+                    safety_settings=self.safety_settings,
+                    stream=True
+                )
+                for chunk in response:
+                    if stop.is_set():
+                        return
+                    put((chunk.text, None))
+            except Exception as e:
+                put((None, e))
+            else:
+                put((None, None))
+        
+        loop.run_in_executor(self._executor, produce)
+        try:
+            while True:
+                text, error = await queue.get()
+                if error is not None:
+                    raise error
+                if text is None:
+                    return
+                yield text
+        finally:
+            stop.set()
+
+    async def _generate_json_streamed(self, prompt: str, max_output_tokens: int = 1024) -> Any:
+        """
+        Generate a JSON response, returning as soon as its outermost object is complete
+        
+        Falls back to the buffered _generate_content_async (with its retries)
+        if streaming fails or yields nothing.
+        
+        Args:
+            prompt: The prompt to send to the AI model
+            max_output_tokens: Output token budget
+            
+        Returns:
+            Response object exposing the generated ``text``
+        """
+        cached = self._get_cached_response(prompt, max_output_tokens)
+        if cached is not None:
+            return cached
+            
+        tracker = _JSONObjectStream()
+        raw_parts = []
+        try:
+            stream = self._generate_content_stream(prompt, max_output_tokens)
+            try:
+                async for chunk in stream:
+                    raw_parts.append(chunk)
+                    if not tracker.invalid and tracker.feed(chunk):
+                        break
+            finally:
+                await stream.aclose()
+        except Exception as e:
+            logger.warning("Streaming Gemini request failed, falling back to buffered call: %s", e)
+            return await self._generate_content_async(prompt, max_output_tokens=max_output_tokens)
+            
+        # Malformed or truncated output is handed back whole for the usual JSON recovery
+        text = tracker.text() if tracker.complete else ''.join(raw_parts)
+        if not text.strip():
+            return await self._generate_content_async(prompt, max_output_tokens=max_output_tokens)
+            
+        self._cache_response(prompt, text, max_output_tokens)
+        return _TextResponse(text)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _prompt_cache_key(prompt: str, max_output_tokens: int = 1024) -> str:
+        """
+        Hash a prompt and its generation config, with trailing whitespace normalized away
+        
+        Memoized per (prompt, max_output_tokens) so a request hashes its prompt once.
+        """
+        canonical = "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+        config = f"{_GENERATION_CONFIG_KEY}|max_output_tokens={max_output_tokens}\n"
+        return hashlib.blake2b((config + canonical).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _get_cached_response(self, prompt: str, max_output_tokens: int = 1024) -> Optional[_TextResponse]:
+        """Return a cached response for the prompt and config, if one is still fresh"""
+        text = self._response_cache.get(self._prompt_cache_key(prompt, max_output_tokens))
+        return _TextResponse(text) if text is not None else None
+
+    def _cache_response(self, prompt: str, text: str, max_output_tokens: int = 1024) -> None:
+        """Remember the response text generated for a prompt and config"""
+        self._response_cache.set(self._prompt_cache_key(prompt, max_output_tokens), text)
+
+    def _prepare_context_summary(self, context_data: List[Dict[str, Any]],
+                                 urgency_cache: Optional[Dict[int, bool]] = None,
+                                 pre_sorted: bool = False) -> str:
         """
         Prepare a summary of context data for use in prompts
         
         Args:
             context_data: List of context entry dictionaries
+            urgency_cache: Optional per-request urgency results keyed by id(context)
+            pre_sorted: Whether context_data is already sorted by urgency and recency
             
         Returns:
             String summarizing context entries with emphasis on urgent items
@@ -970,181 +1979,258 @@ class GeminiAIService:
         if not context_data:
             return "No relevant context available."
         
+        if urgency_cache is None:
+            urgency_cache = {}
+        current_date = timezone.now()
+        
         # Sort context by urgency and recency
-        sorted_context = sorted(context_data, 
-                               key=lambda x: (self._has_urgency_indicators(x), 
-                                            x.get('content_date', ''),
-                                            x.get('relevance_score', 0)), 
-                               reverse=True)
+        if pre_sorted:
+            sorted_context = context_data
+        else:
+            sorted_context = sorted(context_data, 
+                                   key=lambda x: (self._has_urgency_indicators(x, urgency_cache, current_date), 
+                                                self._recency(x),
+                                                x.get('relevance_score', 0)), 
+                                   reverse=True)
         
         summary_parts = ["IMPORTANT CONTEXT INFORMATION:"]
         
         # Extract urgency indicators and deadlines first as a special section
-        urgent_contexts = [ctx for ctx in sorted_context if self._has_urgency_indicators(ctx)]
+        urgent_contexts = [ctx for ctx in sorted_context
+                           if self._has_urgency_indicators(ctx, urgency_cache, current_date)]
         if urgent_contexts:
             summary_parts.append("\nURGENT ITEMS AND DEADLINES:")
             for i, context in enumerate(urgent_contexts, 1):
                 # Extract date if present
                 date_info = context.get('content_date', 'Unknown date')
-                content = context.get('content', '')[:500]
+                excerpt = self._content_excerpt(context)
                 
                 # Check for time-related words and highlight them
-                highlighted_content = self._highlight_time_references(content)
+                highlighted_content = self._highlight_time_references(excerpt)
                 
                 summary_parts.append(f"""\n[URGENT ITEM {i}] - Date: {date_info}
 {highlighted_content}""")
         
         # Add remaining context items
         summary_parts.append("\nADDITIONAL CONTEXT:")
+        urgent_ids = {id(context) for context in urgent_contexts}
         for i, context in enumerate(sorted_context[:5], 1):  # Limit to 5 most relevant
-            if context not in urgent_contexts:  # Skip if already added as urgent
-                summary_parts.append(f"""
-                Context {i} ({context.get('source_type', 'unknown')}):
-                Content: {context.get('content', '')[:500]}...
-                Date: {context.get('content_date', 'Unknown')}
+            if id(context) in urgent_ids:  # Skip if already added as urgent
+                continue
+            source_type = context.get('source_type', 'unknown')
+            excerpt = self._content_excerpt(context)
+            date_info = context.get('content_date', 'Unknown')
+            summary_parts.append(f"""
+                Context {i} ({source_type}):
+                Content: {excerpt}...
+                Date: {date_info}
                 """)
         
         return "\n".join(summary_parts)
         
-    def _has_urgency_indicators(self, context: Dict[str, Any]) -> bool:
-        """Check if context has urgency indicators or near dates"""
-        content = context.get('content', '').lower()
+    @staticmethod
+    def _content_excerpt(context: Dict[str, Any]) -> str:
+        """First 500 characters of a context entry's content"""
+        return (context.get('content') or '')[:500]
+
+    @staticmethod
+    def _with_parsed_dates(context_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Context entries with ISO string content_date values parsed to datetimes, once per request
+        
+        Entries whose date is parsed are shallow copies, so the caller's dictionaries
+        are left as they were; the others are passed through as is. Naive values are
+        made aware in the current timezone; strings that do not parse are kept and
+        ignored by the date extraction.
+        
+        Args:
+            context_data: List of context entry dictionaries
+            
+        Returns:
+            List of context entry dictionaries in the same order
+        """
+        parsed = []
+        for context in context_data:
+            content_date = context.get('content_date')
+            if content_date and isinstance(content_date, str):
+                try:
+                    parsed_date = _parse_iso_datetime(content_date)
+                except (ValueError, TypeError):
+                    pass
+                else:
+                    if timezone.is_naive(parsed_date):
+                        parsed_date = timezone.make_aware(parsed_date)
+                    context = {**context, 'content_date': parsed_date}
+            parsed.append(context)
+        return parsed
+
+    @staticmethod
+    def _recency(context: Dict[str, Any]) -> float:
+        """Sort key for a context entry's content_date; entries without a parsed date sort oldest"""
+        content_date = context.get('content_date')
+        return content_date.timestamp() if isinstance(content_date, datetime) else float('-inf')
+
+    def _has_urgency_indicators(self, context: Dict[str, Any],
+                                urgency_cache: Optional[Dict[int, bool]] = None,
+                                current_date: Optional[datetime] = None) -> bool:
+        """
+        Check if context has urgency indicators or near dates
+        
+        Args:
+            context: Context entry dictionary
+            urgency_cache: Optional per-request results keyed by id(context); only
+                pass one while the context entries it refers to stay alive
+            current_date: Optional reference time, so callers checking many
+                entries read the clock once
+                
+        Returns:
+            True if the entry is urgent
+        """
+        key = id(context)
+        if urgency_cache is not None and key in urgency_cache:
+            return urgency_cache[key]
+            
+        if current_date is None:
+            current_date = timezone.now()
+        urgent = self._is_context_urgent(context, self._dates_in_context(context, current_date), current_date)
+        if urgency_cache is not None:
+            urgency_cache[key] = urgent
+        return urgent
+
+    def _is_context_urgent(self, context: Dict[str, Any], context_dates: List[datetime],
+                           current_date: datetime) -> bool:
+        """
+        Decide urgency for one context entry given the dates already found in it
         
+        Args:
+            context: Context entry dictionary
+            context_dates: Dates extracted from this entry
+            current_date: Reference time for the date check
+            
+        Returns:
+            True if the entry mentions an urgency term or a date within a week
+        """
         # First check for explicit urgency terms
-        urgency_terms = ['urgent', 'asap', 'immediately', 'today', 'tomorrow', 'deadline', 
-                        'due', 'meeting', 'schedule', 'important', 'priority', 'critical',
-                        'approaching', 'soon', 'fast', 'quick', 'promptly']
+        if _URGENCY_RE.search(context.get('content') or ''):
+            return True
         
-        if any(term in content for term in urgency_terms):
+        # An entry without any date falls back to a default that is always within the week
+        if not context_dates:
             return True
         
         # Then check if the context has a date that's coming up soon
         try:
-            current_date = timezone.now()
-            # Get dates from this context item only
-            context_dates = self._extract_dates_from_context([context], current_date)
+            earliest_date = min(context_dates)
+            days_until = (earliest_date - current_date).total_seconds() / 86400
             
-            if context_dates:
-                earliest_date = min(context_dates)
-                days_until = (earliest_date - current_date).total_seconds() / 86400
-                
-                # If date is within a week (7 days), consider it urgent
-                if days_until < 7:
-                    logger.debug(f"Context considered urgent due to date {earliest_date.isoformat()} within {days_until:.1f} days")
-                    return True
+            # If date is within a week (7 days), consider it urgent
+            if days_until < 7:
+                logger.debug("Context considered urgent due to date %s within %.1f days", earliest_date, days_until)
+                return True
         except Exception as e:
-            logger.debug(f"Error checking dates for urgency: {str(e)}")
+            logger.debug("Error checking dates for urgency: %s", e)
             
         return False
+
+    def _scan_contexts(self, context_data: List[Dict[str, Any]], current_date: datetime,
+                       urgency_cache: Optional[Dict[int, bool]] = None) -> Tuple[bool, List[datetime]]:
+        """
+        Detect urgency and collect the referenced dates in a single pass over the context
+        
+        Args:
+            context_data: List of context entry dictionaries
+            current_date: Reference time for date extraction
+            urgency_cache: Optional per-request urgency results keyed by id(context),
+                filled in for every entry
+            
+        Returns:
+            Tuple of (any entry urgent, dates found or [fallback date])
+        """
+        any_urgent = False
+        found_dates = []
+        for context in context_data:
+            context_dates = self._dates_in_context(context, current_date)
+            if urgency_cache is not None:
+                urgent = urgency_cache.get(id(context))
+                if urgent is None:
+                    urgent = self._is_context_urgent(context, context_dates, current_date)
+                    urgency_cache[id(context)] = urgent
+                any_urgent = any_urgent or urgent
+            elif not any_urgent:
+                any_urgent = self._is_context_urgent(context, context_dates, current_date)
+            found_dates.extend(context_dates)
+        
+        if not found_dates:
+            found_dates.append(self._fallback_context_date(context_data, current_date))
+        
+        return any_urgent, found_dates
+
+    @staticmethod
+    def _fallback_context_date(context_data: List[Dict[str, Any]], current_date: datetime) -> datetime:
+        """Default date used when no context entry references one"""
+        today = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        # Entries without dates always count as urgent, so any context means tomorrow
+        if context_data:
+            return today + timedelta(days=1)
+        return today + timedelta(days=7)
     
     def _highlight_time_references(self, text: str) -> str:
         """Highlight time references in text"""
-        time_terms = ['today', 'tomorrow', 'next week', 'meeting', 'schedule', 'deadline', 
-                      'due date', 'urgent', 'asap', 'immediately', 'soon']
-        
-        result = text
-        for term in time_terms:
-            # Case-insensitive replacement to add emphasis
-            pattern = re.compile(re.escape(term), re.IGNORECASE)
-            result = pattern.sub(f"**{term.upper()}**", result)
-            
-        return result
+        # Case-insensitive replacement to add emphasis, in a single pass
+        return _HIGHLIGHT_RE.sub(lambda m: f"**{m.group(1).upper()}**", text)
         
     def _extract_dates_from_context(self, context_data: List[Dict[str, Any]], current_date: datetime) -> List[datetime]:
         """Extract dates from context data"""
         found_dates = []
-        today = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
-        
-        # First extract explicit dates from content_date fields
         for context in context_data:
-            if 'content_date' in context and context['content_date']:
-                try:
-                    # If content_date is a string, try to parse it
-                    if isinstance(context['content_date'], str):
-                        try:
-                            parsed_date = datetime.fromisoformat(context['content_date'])
-                            found_dates.append(parsed_date)
-                        except (ValueError, TypeError):
-                            pass
-                    # If it's already a datetime object, use it directly
-                    elif isinstance(context['content_date'], datetime):
-                        found_dates.append(context['content_date'])
-                except Exception:
-                    pass
-                    
-        # Patterns and parsing functions for natural language date extraction
-        next_week = today + timedelta(days=7)  # Define next_week for date patterns
-        
-        # Then look for date references in context content
-        date_patterns = [
-            # ISO format dates (YYYY-MM-DD)
-            (r'\d{4}-\d{1,2}-\d{1,2}', lambda x: datetime.fromisoformat(x.strip())),
-            # Month day, year (July 8, 2025)
-            (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}', 
-             lambda x: datetime.strptime(x.strip(), "%B %d, %Y")),
-            # Day Month year (8 July 2025)
-            (r'\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}',
-             lambda x: datetime.strptime(x.strip(), "%d %B %Y")),
-            # Month day (July 8) - assume current year
-            (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?!,\s+\d{4})',
-             lambda x: datetime.strptime(f"{x.strip()}, {current_date.year}", "%B %d, %Y")),
-            # Tomorrow
-            (r'\btomorrow\b', lambda x: tomorrow),
-            # Today
-            (r'\btoday\b', lambda x: today),
-            # Next week
-            (r'\bnext week\b', lambda x: next_week),
-            # This weekend
-            (r'\bthis weekend\b', lambda x: today + timedelta(days=(5 - today.weekday()) % 7)),
-            # Day names (Monday, Tuesday, etc.)
-            (r'\b(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b', 
-             lambda x: today + timedelta(days=(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'].index(x.strip().capitalize()) - today.weekday()) % 7)),
-        ]
+            found_dates.extend(self._dates_in_context(context, current_date))
         
-        for context in context_data:
-            content = context.get('content', '')
-            
-            # Special handling for explicit "tomorrow at X" mentions
-            tomorrow_time_match = re.search(r'tomorrow\s+at\s+(\d{1,2})(?:\s*:\s*(\d{1,2}))?\s*(am|pm|AM|PM)?', content)
-            if tomorrow_time_match:
-                try:
-                    hour = int(tomorrow_time_match.group(1))
-                    minute = int(tomorrow_time_match.group(2)) if tomorrow_time_match.group(2) else 0
-                    am_pm = tomorrow_time_match.group(3).lower() if tomorrow_time_match.group(3) else None
-                    
-                    # Handle AM/PM
-                    if am_pm == 'pm' and hour < 12:
-                        hour += 12
-                    elif am_pm == 'am' and hour == 12:
-                        hour = 0
-                        
-                    date_with_time = tomorrow.replace(hour=hour, minute=minute)
-                    found_dates.append(date_with_time)
-                except (ValueError, AttributeError, IndexError):
-                    found_dates.append(tomorrow)  # Fallback to just tomorrow
-            
-            # Check for each date pattern
-            for pattern, date_parser in date_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        matched_text = match.group(0)
-                        parsed_date = date_parser(matched_text)
-                        found_dates.append(parsed_date)
-                    except (ValueError, TypeError):
-                        pass
-        
-        # If no dates found, add tomorrow as default for urgent items
-        if not found_dates and any(self._has_urgency_indicators(ctx) for ctx in context_data):
-            found_dates.append(tomorrow)
-            
-        # If still no dates found, add one week from today as fallback
+        # If no dates found, fall back to tomorrow for urgent items or one week from today
         if not found_dates:
-            found_dates.append(today + timedelta(days=7))
+            found_dates.append(self._fallback_context_date(context_data, current_date))
             
         return found_dates
 
+    def _dates_in_context(self, context: Dict[str, Any], current_date: datetime) -> List[datetime]:
+        """Extract the dates referenced by a single context entry"""
+        found_dates = []
+        today = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # First take the explicit content_date (parsed up front by _with_parsed_dates)
+        content_date = context.get('content_date')
+        if isinstance(content_date, datetime):
+            found_dates.append(content_date)
+                    
+        # Then look for date references in context content, in a single scan
+        for match in _FUSED_DATE_RE.finditer(context.get('content') or ''):
+            try:
+                found_dates.extend(_DATE_PARSERS[match.lastgroup](match, today, current_date))
+            except (ValueError, TypeError):
+                pass
+        
+        return found_dates
+
+    def _decode_response(self, text: str, schema: type) -> Any:
+        """
+        Decode a JSON response straight into its typed schema
+        
+        Malformed JSON goes through _extract_json_from_text first. Fields with
+        the wrong type take their schema defaults (see _convert_response).
+        
+        Args:
+            text: Response text
+            schema: msgspec.Struct type describing the expected response
+            
+        Returns:
+            Instance of ``schema``
+        """
+        try:
+            return _RESPONSE_DECODERS[schema].decode(text)
+        except msgspec.ValidationError:
+            return _convert_response(msgspec.json.decode(text), schema)
+        except msgspec.DecodeError:
+            return _convert_response(self._extract_json_from_text(text), schema)
+
     def _extract_json_from_text(self, text: str) -> Dict[str, Any]:
         """
         Extract JSON from text response when direct parsing fails
@@ -1156,11 +2242,19 @@ class GeminiAIService:
             Parsed JSON dictionary or empty dict on failure
         """
         try:
-            # First attempt: Try to find complete JSON object enclosed in braces
-            json_match = re.search(r'\{[^{}]*((\{[^{}]*\})[^{}]*)*\}', text, re.DOTALL)
-            if json_match:
+            # Fast path: the whole response is JSON, possibly wrapped in a code fence
+            try:
+                data = _loads(_JSON_FENCE_RE.sub('', text.strip()))
+                if isinstance(data, dict):
+                    return data
+            except json.JSONDecodeError:
+                pass
+            
+            # First attempt: Find the outermost balanced JSON object in one linear scan
+            json_span = _find_json_span(text)
+            if json_span:
                 try:
-                    return json.loads(json_match.group())
+                    return _loads(json_span)
                 except json.JSONDecodeError:
                     pass
             
@@ -1168,7 +2262,7 @@ class GeminiAIService:
             code_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
             if code_block_match:
                 try:
-                    return json.loads(code_block_match.group(1))
+                    return _loads(code_block_match.group(1))
                 except json.JSONDecodeError:
                     pass
                 
@@ -1197,19 +2291,144 @@ class GeminiAIService:
                 return result
                 
         except Exception as e:
-            logger.error(f"Error during JSON extraction: {str(e)}")
+            logger.error("Error during JSON extraction: %s", e)
         
-        logger.warning(f"Failed to extract JSON from text: {text[:200]}...")
+        logger.warning("Failed to extract JSON from text: %.200s...", text)
         return {"summary": "Content analysis failed", "key_topics": [], "urgency_indicators": [], "potential_tasks": [], "sentiment_score": 0, "time_references": []}
 
 
+def _is_successful_result(result: Any) -> bool:
+    """Whether an analysis result came from the model rather than an error fallback"""
+    if isinstance(result, dict):
+        return bool(result.get('success', True))
+    if isinstance(result, ContextInsights):
+        return result.summary != "Error analyzing content"
+    reasoning = getattr(result, 'reasoning', '')
+    return not reasoning.startswith(('Error in AI analysis', 'Default suggestion due to error'))
+
+
+@functools.lru_cache(maxsize=1)
+def get_service() -> GeminiAIService:
+    """Return the process-wide GeminiAIService instance"""
+    return GeminiAIService()
+
+
+@dataclass(slots=True, frozen=True)
+class _ResultContext:
+    """Request state shared by the process_new_task result handlers"""
+    task_data: Dict[str, Any]
+    current_date: datetime
+    earliest_date: Optional[datetime]
+    days_until: Optional[float]
+
+
 class AITaskManager:
     """
     High-level task manager that orchestrates AI services for task management
     """
     
     def __init__(self):
-        self.ai_service = GeminiAIService()
+        self.ai_service = get_service()
+        # Analysis results keyed by method and a hash of their inputs
+        self._result_cache = _TTLCache(maxsize=10000, ttl=3600)
+        # Runs in progress by the same key, shared by concurrent identical calls
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # asyncio primitives bind to one loop, and requests run on their own loops
+        self._max_in_flight = getattr(settings, 'AI_MAX_IN_FLIGHT', 32)
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._semaphores_lock = threading.Lock()
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight analyses on the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self._max_in_flight)
+                self._semaphores[loop] = semaphore
+            return semaphore
+    
+    async def _bounded(self, coro) -> Any:
+        """Await an analysis once one of the loop's in-flight slots is free"""
+        async with self._get_semaphore():
+            return await coro
+    
+    @staticmethod
+    def _content_hash(value: Any) -> Optional[str]:
+        """Stable BLAKE2b hash of JSON-like input data, or None if it cannot be serialized"""
+        try:
+            canonical = json.dumps(value, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _normalized_task(task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Task data with title and description case-folded and whitespace-collapsed"""
+        normalized = dict(task_data)
+        for field in ('title', 'description'):
+            if isinstance(normalized.get(field), str):
+                normalized[field] = ' '.join(normalized[field].casefold().split())
+        return normalized
+    
+    async def _cached_analysis(self, kind: str, key_parts: Tuple[Optional[str], ...], call,
+                               ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached result of an analysis, or run it and cache a successful result
+        
+        Concurrent calls with the same key share a single run (single-flight). The
+        shared future is a concurrent.futures.Future so callers on other request
+        event loops can wait on it too.
+        
+        Args:
+            kind: Analysis name, used as the cache namespace
+            key_parts: Hashes of the inputs the analysis depends on; caching is
+                skipped if any of them is None
+            call: Zero-argument callable returning the analysis coroutine
+            ttl: Seconds to keep the result, defaults to the result cache TTL
+            
+        Returns:
+            The analysis result
+        """
+        if None in key_parts:
+            return await call()
+        key = (kind,) + tuple(key_parts)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cached
+            
+        with self._inflight_lock:
+            shared = self._inflight.get(key)
+            leader = shared is None
+            if leader:
+                shared = self._inflight[key] = Future()
+                
+        if not leader:
+            try:
+                # Shielded so a cancelled follower doesn't cancel the shared run
+                return await asyncio.shield(asyncio.wrap_future(shared))
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+                # The leader was cancelled; run the analysis ourselves
+                return await call()
+                
+        try:
+            result = await call()
+        except Exception as e:
+            shared.set_exception(e)
+            raise
+        except BaseException:
+            shared.cancel()
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        if _is_successful_result(result):
+            self._result_cache.set(key, result, ttl)
+        shared.set_result(result)
+        return result
     
     async def process_new_task(self, task_data: Dict[str, Any], 
                               context_data: List[Dict[str, Any]] = None,
@@ -1232,16 +2451,53 @@ class AITaskManager:
             Dictionary with all AI analysis results
         """
         results = {}
+        async for _, partial in self.process_new_task_stream(task_data, context_data, user_preferences,
+                                                              existing_categories, existing_tags,
+                                                              current_workload):
+            results.update(partial)
+        return results
+
+    async def process_new_task_stream(self, task_data: Dict[str, Any],
+                                      context_data: List[Dict[str, Any]] = None,
+                                      user_preferences: Dict[str, Any] = None,
+                                      existing_categories: List[str] = None,
+                                      existing_tags: List[str] = None,
+                                      current_workload: Dict[str, Any] = None
+                                      ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Process a new task, yielding each analysis as soon as it finishes
         
+        Args:
+            task_data: Task information
+            context_data: Relevant context entries
+            user_preferences: User preferences for AI analysis
+            existing_categories: Available categories
+            existing_tags: Available tags
+            current_workload: Current task load information
+            
+        Yields:
+            (task_type, partial results) pairs in completion order; merging the
+            partial dictionaries gives the process_new_task result. A final
+            ('error', {'error': ...}) pair is yielded if processing fails.
+        """
         # Ensure context_data is at least an empty list, not None
         if context_data is None:
             context_data = []
             logger.info("No context data provided, using empty list")
+        # Key cached results on the context as passed in, before it is parsed and sorted
+        context_key = self._content_hash(context_data)
+        if context_data:
+            context_data = self.ai_service._with_parsed_dates(context_data)
         
-        # Pre-analyze context to detect urgent items and important dates
+        # Pre-analyze context to detect urgent items and important dates; urgency
+        # results are shared with the context digest built below
+        urgency_cache = {}
+        context_pre_sorted = False
         has_urgent_context = False
         urgent_contexts = []
         context_dates = []
+        earliest_date = None
+        days_until = None
         current_date = timezone.now()
         
         if context_data:
@@ -1253,247 +2509,337 @@ class AITaskManager:
             if context_dates:
                 earliest_date = min(context_dates)
                 days_until = (earliest_date - current_date).total_seconds() / 86400
-                logger.info(f"Earliest context date found: {earliest_date.isoformat()}, {days_until:.1f} days from now")
+                logger.info("Earliest context date found: %s, %.1f days from now", earliest_date, days_until)
                 
                 # Consider anything within a week as at least somewhat urgent
                 if days_until < 7:
                     date_based_urgency = True
-                    logger.info(f"Date-based urgency detected: date within {days_until:.1f} days")
+                    logger.info("Date-based urgency detected: date within %.1f days", days_until)
             
             # Identify urgent context items
-            urgent_contexts = [ctx for ctx in context_data if self.ai_service._has_urgency_indicators(ctx)]
+            urgent_contexts = [ctx for ctx in context_data
+                               if self.ai_service._has_urgency_indicators(ctx, urgency_cache, current_date)]
             has_urgent_context = len(urgent_contexts) > 0 or date_based_urgency
             
             if has_urgent_context:
-                logger.info(f"Found {len(urgent_contexts)} urgent context items that may affect task analysis")
+                logger.info("Found %d urgent context items that may affect task analysis", len(urgent_contexts))
+            
+            # Sort once by urgency and recency so the context summary can skip its own sort
+            try:
+                context_data = sorted(context_data,
+                                      key=lambda x: (urgency_cache[id(x)],
+                                                     self.ai_service._recency(x),
+                                                     x.get('relevance_score', 0)),
+                                      reverse=True)
+                context_pre_sorted = True
+            except TypeError as e:
+                logger.warning("Could not pre-sort context entries: %s", e)
         
         # Log context analysis for debugging
-        logger.debug(f"Context analysis: urgent={has_urgent_context}, dates_found={len(context_dates)}")
+        logger.debug("Context analysis: urgent=%s, dates_found=%d", has_urgent_context, len(context_dates))
         
+        running = set()
         try:
-            # Run all AI analyses concurrently
-            tasks = []
-            task_types = []
+            # Run all AI analyses concurrently, sharing one pass of context preprocessing
+            try:
+                digest = self.ai_service._digest(context_data, urgency_cache,
+                                                 pre_sorted=context_pre_sorted,
+                                                 context_dates=context_dates)
+            except Exception as e:
+                logger.error("Error preparing context digest: %s", e)
+                digest = None
+            analyses = []
+            skipped_enhancement = None
+            
+            # Identical inputs reuse earlier results; hash the shared inputs once
+            task_key = self._content_hash(task_data)
+            # Priority and description enhancement don't depend on casing or spacing,
+            # so near-duplicate task text shares their results
+            loose_task_key = self._content_hash(self._normalized_task(task_data))
+            preferences_key = self._content_hash(user_preferences)
+            workload_key = self._content_hash(current_workload)
+            # Deadlines and time slots are relative to now, so their results are
+            # only reused within the same hour and for as long as a schedule
+            time_key = current_date.strftime('%Y-%m-%dT%H')
+            time_ttl = self.ai_service._schedule_cache.ttl
+            # Priority floors depend on how close the earliest context date is, so
+            # its results are only reused while that stays in the same urgency level
+            urgency_key = _date_urgency_level(digest) if digest is not None else time_key
             
             # Priority analysis - Always run this
-            tasks.append(
-                self.ai_service.prioritize_task(task_data, context_data, user_preferences)
-            )
-            task_types.append('priority')
+            analyses.append(('priority', self._cached_analysis(
+                'priority', (loose_task_key, context_key, preferences_key, urgency_key),
+                lambda: self.ai_service.prioritize_task(task_data, context_data, user_preferences,
+                                                        digest=digest)
+            )))
             
             # Deadline suggestion
-            tasks.append(
-                self.ai_service.suggest_deadline(task_data, context_data, current_workload)
-            )
-            task_types.append('deadline')
+            analyses.append(('deadline', self._cached_analysis(
+                'deadline', (task_key, context_key, workload_key, time_key),
+                lambda: self.ai_service.suggest_deadline(task_data, context_data, current_workload,
+                                                         digest=digest),
+                ttl=time_ttl
+            )))
             
             # Scheduling suggestion
-            tasks.append(
-                self.ai_service.suggest_schedule(task_data, context_data, user_preferences, current_workload)
-            )
-            task_types.append('scheduling')
+            analyses.append(('scheduling', self._cached_analysis(
+                'scheduling', (task_key, context_key, preferences_key, workload_key, time_key),
+                lambda: self.ai_service.suggest_schedule(task_data, context_data, user_preferences,
+                                                         current_workload, digest=digest),
+                ttl=time_ttl
+            )))
             
             # Category and tag suggestions
             if existing_categories is not None and existing_tags is not None:
-                tasks.append(
-                    self.ai_service.suggest_categories_and_tags(
+                analyses.append(('categorization', self._cached_analysis(
+                    'categorization',
+                    (task_key, self._content_hash([existing_categories, existing_tags])),
+                    lambda: self.ai_service.suggest_categories_and_tags(
                         task_data, existing_categories, existing_tags
                     )
-                )
-                task_types.append('categorization')
-            
-            # Enhanced description - Always run this
-            tasks.append(
-                self.ai_service.enhance_task_description(task_data, context_data)
-            )
-            task_types.append('enhanced_description')
-            
-            # Execute all tasks concurrently
-            if tasks:
-                task_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results based on task types
-                for i, (task_type, result) in enumerate(zip(task_types, task_results)):
-                    if isinstance(result, Exception):
-                        logger.error(f"Error in {task_type} analysis: {str(result)}")
-                        if task_type == 'priority':
-                            # Provide fallback priority with minimal information
-                            results['priority'] = {
-                                'score': 5.0,  # Medium priority as default
-                                'priority_label': 'Medium', 
-                                'reasoning': 'Default priority assigned due to analysis error',
-                                'urgency_factors': ['Task requires attention'],
-                                'context_relevance': 0.5,
-                                'action_timeframe': 'As scheduled',
-                                'impact_assessment': 'Impact could not be determined'
-                            }
-                        elif task_type == 'enhanced_description':
-                            # Set enhanced description to original or empty string
-                            results['enhanced_description'] = task_data.get('description', '')
-                            results['enhanced_description_info'] = {
-                                'error': str(result),
-                                'is_enhanced': False,
-                                'original_text': task_data.get('description', '')
-                            }
-                        continue
-                    
-                    # Process successful results
-                    if task_type == 'priority':
-                        priority_result = result
-                        
-                        # Check if we need to override based on urgent context
-                        score = getattr(priority_result, 'score', 5.0)
-                        priority_label = getattr(priority_result, 'priority_label', 
-                                               self._get_priority_label(score))
-                        context_relevance = getattr(priority_result, 'context_relevance', 0.5)
-                        reasoning = getattr(priority_result, 'reasoning', '')
-                        urgency_factors = getattr(priority_result, 'urgency_factors', [])
-                        
-                        # If the context has dates or is urgent but AI didn't give it enough weight
-                        if context_dates:
-                            earliest_date = min(context_dates)
-                            days_until = (earliest_date - current_date).total_seconds() / 86400
-                            
-                            # Override the score based on how close the date is
-                            # More aggressive overrides for nearer dates
-                            if days_until < 1:  # Within 24 hours
-                                score = max(9.5, score)
-                                priority_label = "Critical"
-                                context_relevance = 0.98
-                                urgency_factors.append("Critical deadline detected within 24 hours")
-                                reasoning += "\n(Priority automatically elevated to Critical due to deadline within 24 hours)"
-                                logger.info(f"Elevated task priority to Critical due to context date within 24 hours")
-                            elif days_until < 2:  # Within 48 hours
-                                score = max(8.5, score)
-                                priority_label = "High"
-                                context_relevance = max(0.9, context_relevance)
-                                urgency_factors.append("Urgent deadline within 48 hours")
-                                reasoning += "\n(Priority adjusted due to deadline within 48 hours)"
-                                logger.info(f"Adjusted task priority due to context date within 48 hours")
-                            elif days_until < 4:  # Within 4 days
-                                score = max(7.5, score)
-                                priority_label = "High" if score >= 7.0 else priority_label
-                                context_relevance = max(0.8, context_relevance)
-                                urgency_factors.append("Upcoming deadline within 4 days")
-                            elif days_until < 7:  # Within a week
-                                score = max(6.5, score)
-                                priority_label = self._get_priority_label(score)  # Recalculate label
-                                context_relevance = max(0.7, context_relevance)
-                                urgency_factors.append("Upcoming deadline within a week")
-                                
-                        results['priority'] = {
-                            'score': score,
-                            'priority_label': priority_label,
-                            'reasoning': reasoning,
-                            'urgency_factors': urgency_factors,
-                            'context_relevance': context_relevance,
-                            'action_timeframe': getattr(priority_result, 'action_timeframe', ''),
-                            'impact_assessment': getattr(priority_result, 'impact_assessment', '')
-                        }
-                    elif task_type == 'deadline':
-                        deadline_result = result
-                        
-                        # Extract suggested deadline from result
-                        suggested_deadline = getattr(deadline_result, 'suggested_deadline', 
-                                                  datetime.now() + timedelta(days=7))
-                        confidence = getattr(deadline_result, 'confidence', 0.7)
-                        reasoning = getattr(deadline_result, 'reasoning', 'Based on task details')
-                        factors = getattr(deadline_result, 'factors_considered', [])
-                        
-                        # Always check if we can improve deadline based on context dates
-                        if context_dates:
-                            earliest_date = min(context_dates)
-                            days_until = (earliest_date - current_date).total_seconds() / 86400
-                            
-                            # For items with dates, align the deadline with the context date
-                            # More aggressive overrides for nearer dates and lower AI confidence
-                            if days_until < 2 or (days_until < 7 and confidence < 0.85):
-                                suggested_deadline = earliest_date
-                                confidence = 0.98 if days_until < 2 else 0.9
-                                reasoning += f"\n(Deadline automatically aligned with important date: {earliest_date.strftime('%Y-%m-%d')})"
-                                factors.append("Context date alignment")
-                                logger.info(f"Aligned deadline with context date: {earliest_date.isoformat()}, {days_until:.1f} days from now")
-                            # For dates within a week, at least move the deadline closer if AI's was further out
-                            elif days_until < 7:
-                                ai_days_until = (suggested_deadline - current_date).total_seconds() / 86400
-                                if ai_days_until > days_until + 1:  # If AI's deadline is more than 1 day later than context date
-                                    suggested_deadline = earliest_date + timedelta(days=1)  # Add 1 day buffer
-                                    confidence = max(0.85, confidence)
-                                    reasoning += f"\n(Deadline adjusted to be closer to important date: {earliest_date.strftime('%Y-%m-%d')})"
-                                    factors.append("Context date proximity adjustment")
-                                    logger.info(f"Adjusted deadline to be closer to context date: now {suggested_deadline.isoformat()}")
-                        
-                        results['deadline'] = {
-                            'suggested_deadline': suggested_deadline.isoformat(),
-                            'confidence': confidence,
-                            'reasoning': reasoning,
-                            'factors_considered': factors
-                        }
-                    elif task_type == 'categorization':
-                        category_result = result
-                        results['categorization'] = {
-                            'suggested_categories': getattr(category_result, 'suggested_categories', []),
-                            'suggested_tags': getattr(category_result, 'suggested_tags', []),
-                            'confidence': getattr(category_result, 'confidence', 0.5),
-                            'reasoning': getattr(category_result, 'reasoning', '')
-                        }
-                    elif task_type == 'scheduling':
-                        scheduling_result = result
-                        
-                        # Format the scheduling suggestion results
-                        results['scheduling'] = {
-                            'suggested_start_time': getattr(scheduling_result, 'suggested_start_time', datetime.now() + timedelta(days=1)).isoformat(),
-                            'suggested_end_time': getattr(scheduling_result, 'suggested_end_time', datetime.now() + timedelta(days=1, hours=1)).isoformat(),
-                            'confidence': getattr(scheduling_result, 'confidence', 0.7),
-                            'reasoning': getattr(scheduling_result, 'reasoning', 'Based on task details and context'),
-                            'factors_considered': getattr(scheduling_result, 'factors_considered', ['Task priority', 'Estimated duration']),
-                            'alternative_slots': getattr(scheduling_result, 'alternative_slots', [])
-                        }
-                        
-                        # Log the scheduling suggestion
-                        logger.info(f"Scheduling suggestion for task '{task_data.get('title', '')}': "
-                                  f"{getattr(scheduling_result, 'suggested_start_time', '').isoformat()} - "
-                                  f"{getattr(scheduling_result, 'suggested_end_time', '').isoformat()}")
-                        
-                    elif task_type == 'enhanced_description':
-                        enhanced_description_result = result
-                        if enhanced_description_result.get('success', False):
-                            results['enhanced_description'] = enhanced_description_result.get('enhanced_text', 
-                                                                                           task_data.get('description', ''))
-                            results['enhanced_description_info'] = {
-                                'original_text': enhanced_description_result.get('original_text', ''),
-                                'is_enhanced': enhanced_description_result.get('is_enhanced', False)
-                            }
-                        else:
-                            # If enhancement failed, use original description
-                            results['enhanced_description'] = task_data.get('description', '')
-                            results['enhanced_description_info'] = {
-                                'error': enhanced_description_result.get('error', 'Unknown error'),
-                                'is_enhanced': False,
-                                'original_text': task_data.get('description', '')
-                            }
+                )))
+            
+            # Enhanced description - only when there is a description to enhance
+            if (task_data.get('description') or '').strip():
+                analyses.append(('enhanced_description', self._cached_analysis(
+                    'enhanced_description', (loose_task_key, context_key),
+                    lambda: self.ai_service.enhance_task_description(task_data, context_data, digest=digest)
+                )))
+            else:
+                skipped_enhancement = self._unenhanced_description(task_data, 'No description to enhance')
+            
+            result_ctx = _ResultContext(task_data, current_date, earliest_date, days_until)
+            running = {self._start_analysis(task_type, analysis) for task_type, analysis in analyses}
+            if skipped_enhancement is not None:
+                yield 'enhanced_description', skipped_enhancement
+            
+            # Hand each result back as soon as its analysis completes
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task_type = task.get_name()
+                    exc = task.exception()
+                    yield task_type, self._format_analysis(
+                        task_type, exc if exc is not None else task.result(), result_ctx
+                    )
             
         except Exception as e:
-            logger.error(f"Error in process_new_task: {str(e)}")
-            results['error'] = str(e)
+            logger.error("Error in process_new_task: %s", e)
+            yield 'error', {'error': str(e)}
+        finally:
+            # The consumer may stop early; don't leave analyses running
+            for task in running:
+                task.cancel()
+
+    def _start_analysis(self, task_type: str, coro) -> asyncio.Task:
+        """Start an analysis as a task named after its type, bounded by the loop's in-flight limit"""
+        loop = asyncio.get_running_loop()
+        if _EAGER_TASK_FACTORY is not None:
+            return _EAGER_TASK_FACTORY(loop, self._bounded(coro), name=task_type)
+        return loop.create_task(self._bounded(coro), name=task_type)
+
+    def _format_analysis(self, task_type: str, result: Any, ctx: '_ResultContext') -> Dict[str, Any]:
+        """
+        Turn one analysis result (or the exception it raised) into its response entries
         
-        return results
+        Args:
+            task_type: Analysis name
+            result: Analysis result or exception
+            ctx: Request state shared by the result handlers
+            
+        Returns:
+            Partial results dictionary for this analysis
+        """
+        if isinstance(result, Exception):
+            logger.error("Error in %s analysis: %s", task_type, result)
+            fallback = self._ERROR_HANDLERS.get(task_type)
+            return fallback(self, result, ctx) if fallback else {}
+        return self._RESULT_HANDLERS[task_type](self, result, ctx)
+
+    def _priority_fallback(self, error: Exception, ctx: '_ResultContext') -> Dict[str, Any]:
+        # Provide fallback priority with minimal information
+        return {'priority': dict(_FALLBACK_PRIORITY)}
+
+    def _enhanced_description_fallback(self, error: Exception, ctx: '_ResultContext') -> Dict[str, Any]:
+        # Set enhanced description to original or empty string
+        return self._unenhanced_description(ctx.task_data, str(error))
+
+    @staticmethod
+    def _unenhanced_description(task_data: Dict[str, Any], error: str) -> Dict[str, Any]:
+        """Results entries reporting the original description when it wasn't enhanced"""
+        description = task_data.get('description', '')
+        return {
+            'enhanced_description': description,
+            'enhanced_description_info': {
+                **_FALLBACK_ENHANCEMENT_INFO, 'error': error, 'original_text': description
+            }
+        }
+
+    def _format_priority(self, priority_result: TaskPriority, ctx: '_ResultContext') -> Dict[str, Any]:
+        # Check if we need to override based on urgent context
+        score = priority_result.score
+        priority_label = priority_result.priority_label
+        context_relevance = priority_result.context_relevance
+        reasoning = priority_result.reasoning
+        # Tuples throughout, so results shared through the result cache stay immutable
+        urgency_factors = tuple(priority_result.urgency_factors)
+
+        # If the context has dates or is urgent but AI didn't give it enough weight
+        if ctx.days_until is not None:
+            # Override the score based on how close the date is
+            # More aggressive overrides for nearer dates
+            override = _CONTEXT_DATE_OVERRIDES[
+                bisect.bisect_right(_CONTEXT_DATE_THRESHOLDS, ctx.days_until)
+            ]
+            if override is not None:
+                score_floor, label, relevance_floor, factor, note = override
+                score = max(score_floor, score)
+                priority_label = label or self._get_priority_label(score)
+                context_relevance = max(relevance_floor, context_relevance)
+                urgency_factors = (*urgency_factors, factor)
+                if note:
+                    reasoning += note
+                    logger.info("Adjusted task priority to %s: %s", priority_label, factor)
+
+        return {'priority': {
+            'score': score,
+            'priority_label': priority_label,
+            'reasoning': reasoning,
+            'urgency_factors': urgency_factors,
+            'context_relevance': context_relevance,
+            'action_timeframe': priority_result.action_timeframe,
+            'impact_assessment': priority_result.impact_assessment
+        }}
+
+    def _format_deadline(self, deadline_result: DeadlineSuggestion, ctx: '_ResultContext') -> Dict[str, Any]:
+        # Extract suggested deadline from result
+        suggested_deadline = deadline_result.suggested_deadline
+        confidence = deadline_result.confidence
+        reasoning = deadline_result.reasoning
+        factors = list(deadline_result.factors_considered)
+        earliest_date, days_until = ctx.earliest_date, ctx.days_until
+
+        # Always check if we can improve deadline based on context dates
+        if days_until is not None:
+            # For items with dates, align the deadline with the context date
+            # More aggressive overrides for nearer dates and lower AI confidence
+            if days_until < 2 or (days_until < 7 and confidence < 0.85):
+                suggested_deadline = earliest_date
+                confidence = 0.98 if days_until < 2 else 0.9
+                reasoning += f"\n(Deadline automatically aligned with important date: {earliest_date.strftime('%Y-%m-%d')})"
+                factors.append("Context date alignment")
+                logger.info("Aligned deadline with context date: %s, %.1f days from now", earliest_date, days_until)
+            # For dates within a week, at least move the deadline closer if AI's was further out
+            elif days_until < 7:
+                ai_days_until = (suggested_deadline - ctx.current_date).total_seconds() / 86400
+                if ai_days_until > days_until + 1:  # If AI's deadline is more than 1 day later than context date
+                    suggested_deadline = earliest_date + timedelta(days=1)  # Add 1 day buffer
+                    confidence = max(0.85, confidence)
+                    reasoning += f"\n(Deadline adjusted to be closer to important date: {earliest_date.strftime('%Y-%m-%d')})"
+                    factors.append("Context date proximity adjustment")
+                    logger.info("Adjusted deadline to be closer to context date: now %s", suggested_deadline)
+
+        return {'deadline': {
+            'suggested_deadline': suggested_deadline.isoformat(),
+            'confidence': confidence,
+            'reasoning': reasoning,
+            'factors_considered': factors
+        }}
+
+    def _format_categorization(self, category_result: CategorySuggestion, ctx: '_ResultContext') -> Dict[str, Any]:
+        # Copies, so callers can't change results shared through the result cache
+        return {'categorization': {
+            'suggested_categories': list(getattr(category_result, 'suggested_categories', [])),
+            'suggested_tags': list(getattr(category_result, 'suggested_tags', [])),
+            'confidence': getattr(category_result, 'confidence', 0.5),
+            'reasoning': getattr(category_result, 'reasoning', '')
+        }}
+
+    def _format_scheduling(self, scheduling_result: SchedulingSuggestion, ctx: '_ResultContext') -> Dict[str, Any]:
+        # Format the scheduling suggestion results
+        suggested_start = scheduling_result.suggested_start_time.isoformat()
+        suggested_end = scheduling_result.suggested_end_time.isoformat()
+
+        # Log the scheduling suggestion
+        logger.info("Scheduling suggestion for task '%s': %s - %s",
+                    ctx.task_data.get('title', ''), suggested_start, suggested_end)
+        
+        return {'scheduling': {
+            'suggested_start_time': suggested_start,
+            'suggested_end_time': suggested_end,
+            'confidence': scheduling_result.confidence,
+            'reasoning': scheduling_result.reasoning,
+            'factors_considered': list(scheduling_result.factors_considered),
+            'alternative_slots': [dict(slot) for slot in scheduling_result.alternative_slots]
+        }}
+
+    def _format_enhanced_description(self, enhanced_description_result: Dict[str, Any],
+                                     ctx: '_ResultContext') -> Dict[str, Any]:
+        description = ctx.task_data.get('description', '')
+        if enhanced_description_result.get('success', False):
+            return {
+                'enhanced_description': enhanced_description_result.get('enhanced_text', description),
+                'enhanced_description_info': {
+                    'original_text': description,
+                    'is_enhanced': enhanced_description_result.get('is_enhanced', False)
+                }
+            }
+        # If enhancement failed, use original description
+        return self._unenhanced_description(
+            ctx.task_data, enhanced_description_result.get('error', 'Unknown error')
+        )
+
+    # Result formatting by analysis type; error handlers exist only for analyses
+    # that always report something
+    _RESULT_HANDLERS = {
+        'priority': _format_priority,
+        'deadline': _format_deadline,
+        'categorization': _format_categorization,
+        'scheduling': _format_scheduling,
+        'enhanced_description': _format_enhanced_description,
+    }
+    _ERROR_HANDLERS = {
+        'priority': _priority_fallback,
+        'enhanced_description': _enhanced_description_fallback,
+    }
 
     def _get_priority_label(self, score: float) -> str:
         """Get a text label for a priority score"""
-        if score >= 9.0:
-            return "Critical"
-        elif score >= 7.0:
-            return "High"
-        elif score >= 5.0:
-            return "Medium"
-        elif score >= 2.0:
-            return "Low"
-        else:
-            return "Very Low"
-            
         # Note: The threshold for Low priority was lowered from 3.0 to 2.0
         # This makes it easier for simple tasks to be classified as Low priority
+        return PRIORITY_LABELS[bisect.bisect_right(PRIORITY_THRESHOLDS, score)]
+    
+    async def prioritize_tasks(self, tasks: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]) -> List[Any]:
+        """
+        Prioritize several tasks concurrently
+        
+        Args:
+            tasks: (task_data, context_data) pair for each task
+            
+        Returns:
+            TaskPriority for each task in order, or the exception its analysis raised
+        """
+        with _coalescing():
+            return await asyncio.gather(*(
+                self._bounded(self.ai_service.prioritize_task(task_data, context_data))
+                for task_data, context_data in tasks
+            ), return_exceptions=True)
+    
+    async def analyze_context(self, content: str, source_type: str) -> ContextInsights:
+        """
+        Analyze one context entry, reusing the result for identical content
+        
+        Args:
+            content: The text content to analyze
+            source_type: Type of source (whatsapp, email, notes, etc.)
+            
+        Returns:
+            ContextInsights object with analysis results
+        """
+        return await self._cached_analysis(
+            'context', (self._content_hash(content), source_type),
+            lambda: self.ai_service.analyze_context(content, source_type)
+        )
     
     async def analyze_daily_context(self, context_entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -1508,16 +2854,28 @@ class AITaskManager:
         results = []
         
         try:
-            # Process context entries concurrently
-            tasks = [
-                self.ai_service.analyze_context(
-                    entry.get('content', ''), 
-                    entry.get('source_type', 'unknown')
-                )
-                for entry in context_entries
-            ]
-            
-            analysis_results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Process context entries concurrently, keeping at most a bounded number in
+            # flight so memory stays flat however many entries arrive
+            analysis_results = [None] * len(context_entries)
+            pending = {}
+            entries = iter(enumerate(context_entries))
+            with _coalescing():
+                while True:
+                    for i, entry in entries:
+                        task = asyncio.ensure_future(self._bounded(self.analyze_context(
+                            entry.get('content', ''), 
+                            entry.get('source_type', 'unknown')
+                        )))
+                        pending[task] = i
+                        if len(pending) >= self._max_in_flight:
+                            break
+                    if not pending:
+                        break
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        i = pending.pop(task)
+                        exc = task.exception()
+                        analysis_results[i] = exc if exc is not None else task.result()
             
             for i, result in enumerate(analysis_results):
                 if not isinstance(result, Exception):
@@ -1531,14 +2889,14 @@ class AITaskManager:
                         'time_references': result.time_references
                     })
                 else:
-                    logger.error(f"Error analyzing context entry {i}: {str(result)}")
+                    logger.error("Error analyzing context entry %d: %s", i, result)
                     results.append({
                         'context_id': context_entries[i].get('id'),
                         'error': str(result)
                     })
         
         except Exception as e:
-            logger.error(f"Error in analyze_daily_context: {str(e)}")
+            logger.error("Error in analyze_daily_context: %s", e)
         
         return results
 
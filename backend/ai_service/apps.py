@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AiServiceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ai_service'
+
+    def ready(self):
+        from . import signals  # noqa: F401 -- connects the cache invalidation handlers
@@ -0,0 +1,28 @@
+"""
+Signal handlers keeping AI service caches in step with the data they derive from
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tasks.models import Category, ContextEntry, Tag
+from .utils import CategoryTagManager, ContextProcessor, _context_cache_enabled
+
+
+@receiver(post_save, sender=ContextEntry)
+@receiver(post_delete, sender=ContextEntry)
+def invalidate_relevant_context(sender, instance, **kwargs):
+    """Drop cached relevant context when one of the user's context entries changes"""
+    ContextProcessor.invalidate_context(instance.user_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_popular_names(sender, **kwargs):
+    """Drop the cached popular category and tag lists when a category or tag changes"""
+    # The lists are only cached in a shared cache; a local one would make every
+    # save bump a version that no other worker reads
+    if _context_cache_enabled():
+        CategoryTagManager.invalidate_popular()
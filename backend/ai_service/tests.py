@@ -1,3 +1,583 @@
-from django.test import TestCase
+import asyncio
+import copy
+import json
+import re
+import threading
+import time
+import unittest
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from smart_todo_backend.renderers import ORJSONRenderer, orjson
+from tasks.models import ContextEntry, Tag, Task
+from .ai_core import (
+    AITaskManager, ContextDigest, GeminiAIService, _BatchCoalescer, _batch_scope, _build_prioritize_features,
+    _coalescing, run_in_batch_scope,
+)
+from .utils import (
+    CategoryTagManager, ContextProcessor, WorkloadAnalyzer, _get_ai_loop, run_async_ai_analysis, uvloop,
+)
+
+
+class _Response:
+    """Stand-in for a Gemini response, iterable like a streamed one"""
+
+    def __init__(self, text):
+        self.text = text
+
+    def __iter__(self):
+        for i in range(0, len(self.text), 16):
+            yield _Response(self.text[i:i + 16])
+
+
+class StubModel:
+    """
+    Stub for genai.GenerativeModel answering each prompt type with canned JSON
+
+    Batched prompts get one answer per request. Set ``error`` to make every
+    call fail and ``delays`` to slow down prompts containing a phrase.
+    """
+
+    def __init__(self, error=None, delays=None):
+        self.error = error
+        self.delays = delays or {}
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def generate_content(self, contents=None, generation_config=None, safety_settings=None, stream=False):
+        with self._lock:
+            self.prompts.append(contents)
+        for phrase, delay in self.delays.items():
+            if phrase in contents:
+                time.sleep(delay)
+        if self.error is not None:
+            raise self.error
+        if 'independent requests' in contents:
+            requests = re.split(r'### Request \d+\n', contents)[1:]
+            return _Response(json.dumps({'results': [json.loads(self.answer(r)) for r in requests]}))
+        return _Response(self.answer(contents))
+
+    def calls(self, phrase=''):
+        return sum(phrase in prompt for prompt in self.prompts)
+
+    @staticmethod
+    def answer(prompt):
+        now = timezone.now()
+        if prompt.startswith('echo '):
+            return json.dumps({'echo': prompt.split()[1]})
+        if 'priority score' in prompt:
+            return json.dumps({'priority_score': 6.0, 'priority_label': 'Medium', 'reasoning': 'r',
+                               'urgency_factors': [], 'context_relevance': 0.4})
+        if 'realistic deadline' in prompt:
+            return json.dumps({'suggested_deadline': (now + timedelta(days=3)).isoformat(),
+                               'confidence': 0.8, 'reasoning': 'd', 'factors_considered': []})
+        if 'categories and tags' in prompt:
+            return json.dumps({'suggested_categories': ['Work'], 'suggested_tags': ['a'],
+                               'confidence': 0.9, 'reasoning': 'c'})
+        if 'optimal schedule' in prompt:
+            start = (now + timedelta(days=1)).strftime('%Y-%m-%d %H:%M')
+            return json.dumps({'suggested_start_time': start, 'suggested_end_time': start,
+                               'confidence': 0.8, 'reasoning': 's', 'alternative_slots': []})
+        if 'Enhance the following' in prompt:
+            return 'Enhanced description'
+        return json.dumps({'summary': 'sum', 'key_topics': [], 'urgency_indicators': [],
+                           'potential_tasks': [], 'sentiment_score': 0.0})
+
+
+def _make_service(model):
+    service = GeminiAIService()
+    service.model = model
+    return service
+
+
+def _make_manager(model):
+    manager = AITaskManager()
+    manager.ai_service = _make_service(model)
+    return manager
+
+
+class ComplexityMatchingTests(SimpleTestCase):
+
+    def complexity(self, title):
+        digest = ContextDigest(summary='', urgent=False, earliest_date=None, urgency_factors=(),
+                               current_date=timezone.now())
+        return _build_prioritize_features({'title': title}, digest).complexity_score
+
+    def test_indicators_match_whole_words_only(self):
+        # "key" and "ui" don't fire inside "keyboard" and "build"
+        self.assertEqual(self.complexity('Build a keyboard'), 0)
+        self.assertEqual(self.complexity('Fix the key system'), 1.6)
+
+    def test_plural_and_ing_forms_do_not_count(self):
+        self.assertEqual(self.complexity('Reviews of meetings'), 0)
+        self.assertEqual(self.complexity('Review the meeting'), 1.6)
+        self.assertEqual(self.complexity('Design the tests'), 0.8)
+        self.assertEqual(self.complexity('Design the test'), 0)
+
+
+class BatchCoalescerTests(SimpleTestCase):
+
+    def test_batched_response_goes_back_to_each_caller(self):
+        model = StubModel()
+        coalescer = _BatchCoalescer(_make_service(model), max_batch=3, max_wait=1)
+
+        async def submit_all():
+            with _coalescing():
+                return await asyncio.gather(*(coalescer.submit(f'echo {i}') for i in range(3)))
+
+        responses = asyncio.run(submit_all())
+
+        self.assertEqual(model.calls(), 1)
+        self.assertEqual([json.loads(r.text)['echo'] for r in responses], ['0', '1', '2'])
+
+    def test_failed_batch_reaches_every_waiter(self):
+        model = StubModel(error=RuntimeError('Gemini unavailable'))
+        coalescer = _BatchCoalescer(_make_service(model), max_batch=3, max_wait=1)
+
+        async def submit_all():
+            with _coalescing():
+                return await asyncio.gather(*(coalescer.submit(f'echo {i}') for i in range(3)),
+                                            return_exceptions=True)
+
+        # Skip the retry backoff
+        with mock.patch('ai_service.ai_core.random.random', return_value=-0.5):
+            results = asyncio.run(submit_all())
+
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+
+    def test_prompts_of_different_scopes_are_not_batched(self):
+        model = StubModel()
+        coalescer = _BatchCoalescer(_make_service(model), max_batch=2, max_wait=0.05)
+
+        async def submit_scoped():
+            with _coalescing():
+                return await asyncio.gather(*(run_in_batch_scope(coalescer.submit(f'echo {i}')) for i in range(2)))
+
+        asyncio.run(submit_scoped())
+
+        self.assertEqual(model.calls(), 2)
+        self.assertEqual(model.calls('independent requests'), 0)
+
+    def test_lone_prompt_is_sent_without_waiting(self):
+        model = StubModel()
+        coalescer = _BatchCoalescer(_make_service(model), max_batch=8, max_wait=5)
+
+        started = time.monotonic()
+        response = asyncio.run(coalescer.submit('echo 0'))
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(json.loads(response.text), {'echo': '0'})
+
+    def test_analyze_daily_context_batches_its_prompts(self):
+        model = StubModel()
+        manager = _make_manager(model)
+        entries = [{'id': i, 'content': f'Meeting notes {i}', 'source_type': 'notes'} for i in range(3)]
+
+        results = asyncio.run(run_in_batch_scope(manager.analyze_daily_context(entries)))
+
+        self.assertEqual(model.calls(), 1)
+        self.assertEqual([result['summary'] for result in results], ['sum', 'sum', 'sum'])
+
+    def test_prioritize_tasks_batches_its_prompts(self):
+        model = StubModel()
+        manager = _make_manager(model)
+        tasks = [({'title': f'Task number {i}', 'description': 'Details'}, []) for i in range(3)]
+
+        results = asyncio.run(run_in_batch_scope(manager.prioritize_tasks(tasks)))
+
+        self.assertEqual(model.calls(), 1)
+        self.assertEqual([result.score for result in results], [6.0, 6.0, 6.0])
+
+    def test_batch_scope_is_reset_afterwards(self):
+        async def scoped():
+            return _batch_scope.get()
+
+        async def run():
+            inner = await run_in_batch_scope(scoped())
+            return inner, _batch_scope.get()
+
+        inner, outer = asyncio.run(run())
+
+        self.assertIsNotNone(inner)
+        self.assertIsNone(outer)
+
+
+class CachedAnalysisTests(SimpleTestCase):
+
+    task = {'title': 'Write quarterly report', 'description': 'Summarize results', 'estimated_duration': 60}
+
+    def process(self, manager, now=None, context=None):
+        coro = manager.process_new_task(self.task, context or [], {}, ['Work'], ['a'], {'pending_tasks': 1})
+        if now is None:
+            return asyncio.run(coro)
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            return asyncio.run(coro)
+
+    def test_concurrent_identical_keys_share_one_model_call(self):
+        model = StubModel(delays={'echo': 0.05})
+        manager = _make_manager(model)
+
+        def analysis():
+            return manager.ai_service._generate_content_async('echo shared')
+
+        async def run_all():
+            return await asyncio.gather(*(manager._cached_analysis('echo', ('key',), analysis) for _ in range(5)))
+
+        results = asyncio.run(run_all())
+
+        self.assertEqual(model.calls(), 1)
+        self.assertEqual({r.text for r in results}, {json.dumps({'echo': 'shared'})})
+
+    def test_identical_keys_on_other_loops_share_one_model_call(self):
+        model = StubModel(delays={'echo': 0.1})
+        manager = _make_manager(model)
+        results = []
+
+        def run_on_own_loop():
+            results.append(asyncio.run(manager._cached_analysis(
+                'echo', ('key',), lambda: manager.ai_service._generate_content_async('echo shared')
+            )))
+
+        threads = [threading.Thread(target=run_on_own_loop) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(model.calls(), 1)
+        self.assertEqual(len(results), 3)
+
+    def test_deadline_and_schedule_expire_when_the_date_changes(self):
+        model = StubModel()
+        manager = _make_manager(model)
+
+        first = self.process(manager)
+        deadline_calls = model.calls('realistic deadline')
+        schedule_calls = model.calls('optimal schedule')
+
+        # Same hour: served from the result cache
+        self.process(manager)
+        self.assertEqual(model.calls('realistic deadline'), deadline_calls)
+        self.assertEqual(model.calls('optimal schedule'), schedule_calls)
+
+        second = self.process(manager, timezone.now() + timedelta(days=1))
+
+        self.assertGreater(model.calls('realistic deadline'), deadline_calls)
+        self.assertGreater(model.calls('optimal schedule'), schedule_calls)
+        self.assertNotEqual(first['deadline']['suggested_deadline'], second['deadline']['suggested_deadline'])
+
+    def test_deadline_and_schedule_expire_at_the_top_of_the_hour(self):
+        model = StubModel()
+        manager = _make_manager(model)
+        before = timezone.now().replace(hour=10, minute=59, second=0, microsecond=0)
+
+        self.process(manager, before)
+        deadline_calls = model.calls('realistic deadline')
+        schedule_calls = model.calls('optimal schedule')
+
+        self.process(manager, before + timedelta(seconds=30))
+        self.assertEqual(model.calls('realistic deadline'), deadline_calls)
+        self.assertEqual(model.calls('optimal schedule'), schedule_calls)
+
+        # Two minutes later is the next hour, so nothing may be reused
+        self.process(manager, before + timedelta(minutes=2))
+        self.assertGreater(model.calls('realistic deadline'), deadline_calls)
+        self.assertGreater(model.calls('optimal schedule'), schedule_calls)
+
+    def test_priority_expires_when_the_context_date_comes_within_48_hours(self):
+        model = StubModel()
+        manager = _make_manager(model)
+        now = timezone.now()
+        context = [{'content': 'Urgent: client review', 'source_type': 'notes',
+                    'content_date': now + timedelta(hours=49)}]
+
+        self.process(manager, now, context)
+        priority_calls = model.calls('priority score')
+
+        # Still more than 48 hours away: served from the result cache
+        self.process(manager, now + timedelta(minutes=30), context)
+        self.assertEqual(model.calls('priority score'), priority_calls)
+
+        # 47 hours away: the urgency floor changes, so the priority is analyzed again
+        self.process(manager, now + timedelta(hours=2), context)
+        self.assertGreater(model.calls('priority score'), priority_calls)
+
+    def test_schedule_is_recomputed_when_a_context_entry_is_edited(self):
+        model = StubModel()
+        service = _make_service(model)
+        now = timezone.now()
+        context = [{'id': 1, 'content': 'Dentist appointment', 'source_type': 'notes',
+                    'content_date': now + timedelta(days=3)}]
+
+        asyncio.run(service.suggest_schedule(self.task, context))
+        asyncio.run(service.suggest_schedule(self.task, context))
+        self.assertEqual(model.calls('optimal schedule'), 1)
+
+        edited = [{**context[0], 'content_date': now + timedelta(days=1)}]
+        asyncio.run(service.suggest_schedule(self.task, edited))
+        self.assertEqual(model.calls('optimal schedule'), 2)
+
+    def test_changing_a_result_leaves_the_cached_one_alone(self):
+        manager = _make_manager(StubModel())
+
+        first = self.process(manager)
+        first['categorization']['suggested_tags'].append('changed')
+        first['scheduling']['factors_considered'].append('changed')
+        for slot in first['scheduling']['alternative_slots']:
+            slot['changed'] = True
+        first['scheduling']['alternative_slots'].append({'changed': True})
+        second = self.process(manager)
+
+        self.assertEqual(second['categorization']['suggested_tags'], ['a'])
+        self.assertNotIn('changed', second['scheduling']['factors_considered'])
+        self.assertFalse(any('changed' in slot for slot in second['scheduling']['alternative_slots']))
+
+
+class ResponseDecodingTests(SimpleTestCase):
+
+    def test_mismatched_field_type_falls_back_to_its_default(self):
+        service = _make_service(StubModel())
+        answer = json.dumps({'priority_score': '7', 'priority_label': 'High', 'reasoning': 'r',
+                             'urgency_factors': ['deadline', 3], 'context_relevance': 0.4})
+
+        with mock.patch.object(StubModel, 'answer', return_value=answer):
+            priority = asyncio.run(service.prioritize_task({'title': 'Ship the release'}, []))
+
+        self.assertEqual(priority.score, 7.0)
+        self.assertEqual(priority.reasoning, 'r')
+        self.assertEqual(priority.urgency_factors, [])
+
+
+class ContextSummaryTests(SimpleTestCase):
+
+    def test_summary_leaves_context_entries_unchanged(self):
+        service = _make_service(StubModel())
+        context = [{'content': 'Urgent: send the slides ' * 40, 'source_type': 'email'},
+                   {'content': 'Team lunch on Friday', 'source_type': 'notes'}]
+        snapshot = copy.deepcopy(context)
+
+        summary = service._prepare_context_summary(context)
+
+        self.assertIn('Team lunch on Friday', summary)
+        self.assertEqual(context, snapshot)
+
+    def test_mixed_content_dates_are_parsed_without_changing_the_entries(self):
+        service = _make_service(StubModel())
+        tomorrow = (timezone.now() + timedelta(days=1)).replace(microsecond=0)
+        context = [{'content': 'Send the slides', 'source_type': 'email', 'content_date': tomorrow.isoformat()},
+                   {'content': 'Team lunch', 'source_type': 'notes'},
+                   {'content': 'Call the bank', 'source_type': 'notes', 'content_date': 'next week'}]
+        snapshot = copy.deepcopy(context)
+
+        digest = service._digest(context)
+        summary = service._prepare_context_summary(context)
+
+        self.assertEqual(digest.earliest_date, tomorrow)
+        self.assertIn('Call the bank', digest.summary)
+        self.assertIn('Call the bank', summary)
+        self.assertEqual(context, snapshot)
+
+
+    def test_enhancement_without_a_digest_parses_content_dates(self):
+        model = StubModel()
+        service = _make_service(model)
+        now = timezone.now()
+        context = [{'content': 'Offsite planning', 'source_type': 'notes',
+                    'content_date': (now + timedelta(days=30)).isoformat()},
+                   {'content': 'Send the slides', 'source_type': 'email',
+                    'content_date': (now + timedelta(days=2)).isoformat()}]
+
+        result = asyncio.run(service.enhance_task_description({'title': 'Prepare talk'}, context))
+
+        self.assertTrue(result['success'])
+        # Only the entry dated within the week is urgent
+        self.assertEqual(model.prompts[0].count('[URGENT ITEM'), 1)
+
+class ProcessNewTaskStreamTests(SimpleTestCase):
+
+    def test_results_are_yielded_as_they_complete(self):
+        model = StubModel(delays={'realistic deadline': 0.3})
+        manager = _make_manager(model)
+        task = {'title': 'Plan team offsite', 'description': 'Venue and agenda', 'estimated_duration': 90}
+
+        async def collect():
+            return [task_type async for task_type, _ in manager.process_new_task_stream(
+                task, [], {}, ['Work'], ['a'], {'pending_tasks': 1}
+            )]
+
+        order = asyncio.run(collect())
+
+        self.assertEqual(order[-1], 'deadline')
+        self.assertEqual(set(order), {'priority', 'deadline', 'scheduling', 'categorization', 'enhanced_description'})
+
+
+class RelevantContextCacheTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username='alice')
+        self.task = {'title': 'Prepare budget review', 'description': 'Quarterly numbers'}
+
+    def add_entry(self, content):
+        return ContextEntry.objects.create(user=self.user, content=content, source_type='notes')
+
+    def relevant_contents(self):
+        return [entry['content'] for entry in ContextProcessor.get_relevant_context(self.user, self.task)]
+
+    def test_local_memory_cache_is_not_used(self):
+        self.add_entry('budget review moved to Monday')
+        self.assertEqual(len(self.relevant_contents()), 1)
+
+        # Without a shared cache, nothing stale is served even without invalidation
+        with mock.patch.object(ContextProcessor, 'invalidate_context'):
+            self.add_entry('budget numbers are due Friday')
+            self.assertEqual(len(self.relevant_contents()), 2)
+
+    def test_shared_cache_is_invalidated_when_context_changes(self):
+        with mock.patch('ai_service.utils._context_cache_enabled', return_value=True):
+            entry = self.add_entry('budget review moved to Monday')
+            self.assertEqual(len(self.relevant_contents()), 1)
+
+            with mock.patch.object(ContextProcessor, '_find_relevant_context') as find:
+                self.relevant_contents()
+            find.assert_not_called()
+
+            self.add_entry('budget numbers are due Friday')
+            self.assertEqual(len(self.relevant_contents()), 2)
+
+            entry.delete()
+            self.assertEqual(self.relevant_contents(), ['budget numbers are due Friday'])
+
+
+class ContextCandidateTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username='bob')
+
+    def add_entry(self, content):
+        return ContextEntry.objects.create(user=self.user, content=content, source_type='notes')
+
+    def test_recent_entries_are_scored_when_no_keyword_matches(self):
+        self.add_entry('Planetarium trip on Friday')
+
+        # Full-text search doesn't match "plan" in "planetarium"; keyword scoring does
+        context = ContextProcessor.get_relevant_context(self.user, {'title': 'Plan weekend'})
+
+        self.assertEqual([entry['content'] for entry in context], ['Planetarium trip on Friday'])
+
+    def test_recent_entries_fill_in_after_keyword_matches(self):
+        self.add_entry('Weekend plan: hiking')
+        self.add_entry('Planetarium trip on Friday')
+
+        candidates = ContextProcessor._fetch_context_candidates(self.user, ['plan'], days_back=7, limit=4)
+
+        self.assertCountEqual([entry['content'] for entry in candidates],
+                              ['Weekend plan: hiking', 'Planetarium trip on Friday'])
+
+
+class WorkloadAnalyzerTests(TestCase):
+
+    def test_workload_metrics_come_from_one_query(self):
+        user = User.objects.create(username='carol')
+        now = timezone.now()
+        Task.objects.create(user=user, title='a', priority='high', deadline=now - timedelta(days=1),
+                            estimated_duration=30, ai_priority_score=8.0)
+        Task.objects.create(user=user, title='b', priority='urgent', deadline=now + timedelta(days=2),
+                            estimated_duration=0, ai_priority_score=6.0)
+        Task.objects.create(user=user, title='c', status='in_progress')
+        Task.objects.create(user=user, title='d', status='completed', priority='urgent')
+
+        with self.assertNumQueries(1):
+            workload = WorkloadAnalyzer.get_current_workload(user)
+
+        self.assertEqual(workload['total_active_tasks'], 3)
+        self.assertEqual(workload['high_priority_tasks'], 1)
+        self.assertEqual(workload['urgent_tasks'], 1)
+        self.assertEqual(workload['overdue_tasks'], 1)
+        self.assertEqual(workload['upcoming_tasks_week'], 1)
+        # Missing or zero durations count as an hour
+        self.assertEqual(workload['total_estimated_hours'], 2.5)
+        # Unscored tasks are left out of the average
+        self.assertEqual(workload['average_priority_score'], 7.0)
+
+
+class PopularNamesCacheTests(TestCase):
+
+    def test_local_memory_cache_is_not_used(self):
+        Tag.objects.create(name='budget', usage_count=5)
+        self.assertEqual(CategoryTagManager.get_popular_tags(), ['budget'])
+
+        # Queryset updates send no signals, and still show up straight away
+        Tag.objects.filter(name='budget').update(usage_count=1)
+        Tag.objects.bulk_create([Tag(name='review', usage_count=3)])
+        self.assertEqual(CategoryTagManager.get_popular_tags(), ['review', 'budget'])
+
+    def test_reusing_a_tag_keeps_the_shared_cache(self):
+        with mock.patch('ai_service.utils._context_cache_enabled', return_value=True):
+            CategoryTagManager.get_or_create_tag('budget')
+            self.assertEqual(CategoryTagManager.get_popular_tags(), ['budget'])
+
+            with mock.patch.object(CategoryTagManager, 'invalidate_popular') as invalidate:
+                tag = CategoryTagManager.get_or_create_tag('budget')
+
+        invalidate.assert_not_called()
+        self.assertEqual(tag.usage_count, 1)
+
+
+class AIEventLoopTests(SimpleTestCase):
+
+    @unittest.skipIf(uvloop is None, 'uvloop is not installed')
+    def test_only_the_ai_loop_runs_on_uvloop(self):
+        self.assertNotIsInstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+        self.assertIsInstance(_get_ai_loop(), uvloop.Loop)
+        self.assertEqual(run_async_ai_analysis(asyncio.sleep(0, 'done')), 'done')
+
+    def test_timed_out_analysis_is_cancelled_on_the_ai_loop(self):
+        cancelled = threading.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with self.settings(AI_ANALYSIS_TIMEOUT=0.2):
+            with self.assertRaises(TimeoutError):
+                run_async_ai_analysis(hang())
+
+        self.assertTrue(cancelled.wait(1))
+
+
+class WarmUpTests(SimpleTestCase):
+
+    def test_warm_up_gives_up_after_the_analysis_timeout(self):
+        release = threading.Event()
+        service = _make_service(mock.Mock(count_tokens=lambda text: release.wait(5)))
+
+        started = time.monotonic()
+        with self.settings(AI_ANALYSIS_TIMEOUT=0.1):
+            service.warm_up()
+        release.set()
+
+        self.assertLess(time.monotonic() - started, 1)
+
+
+@unittest.skipIf(orjson is None, 'orjson is not installed')
+class ORJSONRendererTests(SimpleTestCase):
+
+    def test_output_matches_json_renderer(self):
+        data = {'text': 'line\u2028break\u2029end', 'score': 0.5, 'due': None, 'tags': ['a']}
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_non_finite_floats_are_rejected(self):
+        for value in (float('nan'), float('inf')):
+            with self.assertRaises(ValueError):
+                ORJSONRenderer().render({'results': [{'score': value}]})
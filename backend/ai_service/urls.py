@@ -2,22 +2,45 @@
 URL patterns for AI Service endpoints
 """
 
+import functools
+import importlib
+
 from django.urls import path
-from . import views
+from django.views.decorators.csrf import csrf_exempt
 
 app_name = 'ai_service'
 
-urlpatterns = [
+
+def _lazy_view(name):
+    """
+    Resolve ``views.<name>`` on first request instead of at URLconf import
+
+    Importing the views module pulls in the Gemini client and the rest of the
+    AI stack, so deferring it keeps worker startup light. The wrapper is CSRF
+    exempt like the DRF view it stands in for; DRF enforces CSRF itself.
+    """
+    @csrf_exempt
+    def view(request, *args, **kwargs):
+        return getattr(_views(), name)(request, *args, **kwargs)
+    view.__name__ = view.__qualname__ = name
+    return view
+
+
+@functools.lru_cache(maxsize=1)
+def _views():
+    return importlib.import_module('ai_service.views')
+
+
+urlpatterns = (
     # Context analysis endpoints
-    path('analyze-context/', views.analyze_context, name='analyze_context'),
-    path('context-insights/', views.get_context_insights, name='context_insights'),
+    path('analyze-context/', _lazy_view('analyze_context'), name='analyze_context'),
+    path('context-insights/', _lazy_view('get_context_insights'), name='context_insights'),
     
     # Task AI endpoints
-    path('task-suggestions/', views.get_ai_task_suggestions, name='task_suggestions'),
-    path('prioritize-tasks/', views.prioritize_tasks, name='prioritize_tasks'),
+    path('task-suggestions/', _lazy_view('get_ai_task_suggestions'), name='task_suggestions'),
+    path('prioritize-tasks/', _lazy_view('prioritize_tasks'), name='prioritize_tasks'),
     
     # Analysis and statistics endpoints
-    path('workload-analysis/', views.get_workload_analysis, name='workload_analysis'),
-    path('ai-stats/', views.get_ai_stats, name='ai_stats'),
-]
-
+    path('workload-analysis/', _lazy_view('get_workload_analysis'), name='workload_analysis'),
+    path('ai-stats/', _lazy_view('get_ai_stats'), name='ai_stats'),
+)
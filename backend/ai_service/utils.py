@@ -4,16 +4,90 @@ Utility functions for AI service operations
 
 import logging
 import asyncio
+import bisect
+import concurrent.futures
+import functools
+import hashlib
+import heapq
+import itertools
+import json
+import operator
+import queue
+import re
+import threading
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
+import ahocorasick
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import close_old_connections, connection
+from django.db.models import Avg, Count, F, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce, NullIf
 from tasks.models import Task, ContextEntry, Category, Tag, TaskContextRelation, AIAnalysisLog
 import time
+import atexit
 
 
 logger = logging.getLogger('ai_service')
 
+# Common words ignored when extracting keywords
+_STOPWORDS = frozenset([
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 
+    'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day',
+    'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new',
+    'now', 'old', 'see', 'two', 'who', 'boy', 'did', 'she',
+    'use', 'way', 'will', 'with', 'this', 'that', 'have',
+    'from', 'they', 'know', 'want', 'been', 'good', 'much',
+    'some', 'time', 'very', 'when', 'come', 'here', 'just',
+    'like', 'long', 'make', 'many', 'over', 'such', 'take',
+    'than', 'them', 'well', 'were'
+])
+# Whitespace-separated words longer than three characters
+_CANDIDATE_WORD_RE = re.compile(r'\S{4,}')
+# Punctuation stripped from the ends of keywords
+_KEYWORD_PUNCTUATION = '.,!?;:()[]{}"\'-'
+
+# Popular category/tag lists are cached under a version number; bumping it
+# invalidates the lists for every limit at once
+_POPULAR_VERSION_KEY = 'popular_names:version'
+_POPULAR_CACHE_TIMEOUT = 300
+
+# Workload score factors as (thresholds, points): task count, urgent tasks,
+# overdue tasks (heavily weighted) and estimated hours
+_WORKLOAD_FACTORS = (
+    ((5, 10, 20), (0, 1, 2, 3)),
+    ((0, 2, 5), (0, 1, 2, 3)),
+    ((0, 1, 3), (0, 2, 3, 4)),
+    ((10, 20, 40), (0, 1, 2, 3)),
+)
+# Workload level for a score: bisect_right over the lowest score of each level above "low"
+WORKLOAD_LEVEL_THRESHOLDS = (3, 6, 8)
+WORKLOAD_LEVELS = ('low', 'medium', 'high', 'very_high')
+
+# Relevant context results stay cached until the user's context changes, at most this long
+_CONTEXT_CACHE_TIMEOUT = 600
+
+# Text search configuration of the context content GIN index (tasks migration 0004)
+_CONTEXT_SEARCH_CONFIG = 'english'
+
+
+def _context_cache_enabled() -> bool:
+    """
+    Whether relevant context may be cached
+    
+    Cached context is invalidated through a per-user version in the cache, which
+    only reaches every worker when the cache backend is shared between them.
+    """
+    return not settings.CACHES['default']['BACKEND'].endswith(('.LocMemCache', '.DummyCache'))
+
 
 class ContextProcessor:
     """
@@ -26,6 +100,9 @@ class ContextProcessor:
         """
         Get relevant context entries for a task based on keywords and recency
         
+        Results are cached per user and task text until the user's context changes,
+        when the cache is shared by all workers.
+        
         Args:
             user: User object
             task_data: Task information dictionary
@@ -36,41 +113,250 @@ class ContextProcessor:
             List of relevant context entry dictionaries
         """
         try:
-            # Calculate date threshold
-            date_threshold = timezone.now() - timedelta(days=days_back)
+            if not _context_cache_enabled():
+                return ContextProcessor._find_relevant_context(user, task_data, days_back, max_entries)
+            cache_key = ContextProcessor._context_cache_key(user, task_data, days_back, max_entries)
+            context = cache.get(cache_key)
+            if context is None:
+                context = ContextProcessor._find_relevant_context(user, task_data, days_back, max_entries)
+                cache.set(cache_key, context, timeout=_CONTEXT_CACHE_TIMEOUT)
+            return context
             
-            # Get recent context entries
-            context_entries = ContextEntry.objects.filter(
-                user=user,
-                created_at__gte=date_threshold
-            ).order_by('-created_at')[:max_entries * 2]  # Get more to filter
+        except Exception as e:
+            logger.error(f"Error getting relevant context: {str(e)}")
+            return []
+    
+    @staticmethod
+    def get_relevant_context_batch(user: User, tasks_data: List[Dict[str, Any]],
+                                   days_back: int = 7, max_entries: int = 10) -> List[List[Dict[str, Any]]]:
+        """
+        Get relevant context entries for several tasks of a user at once
+        
+        Tasks missing from the cache share a single context query whose entries
+        are then ranked against each task in memory.
+        
+        Args:
+            user: User object
+            tasks_data: List of task information dictionaries
+            days_back: Number of days to look back for context
+            max_entries: Maximum number of context entries to return per task
+            
+        Returns:
+            List of relevant context entry lists, in the order of tasks_data
+        """
+        try:
+            cache_enabled = _context_cache_enabled()
+            if cache_enabled:
+                cache_keys = [
+                    ContextProcessor._context_cache_key(user, task_data, days_back, max_entries)
+                    for task_data in tasks_data
+                ]
+                contexts = cache.get_many(cache_keys)
+            else:
+                cache_keys = list(range(len(tasks_data)))
+                contexts = {}
+            missing = {key: task_data for key, task_data in zip(cache_keys, tasks_data) if key not in contexts}
+            if missing:
+                task_keywords = {
+                    key: ContextProcessor._extract_keywords(task_data) for key, task_data in missing.items()
+                }
+                candidates = ContextProcessor._fetch_context_candidates(
+                    user,
+                    list(dict.fromkeys(itertools.chain.from_iterable(task_keywords.values()))),
+                    days_back,
+                    max_entries * 2 * len(missing)
+                )
+                fresh = {
+                    key: ContextProcessor.rank_against_task(candidates, keywords, max_entries)
+                    for key, keywords in task_keywords.items()
+                }
+                if cache_enabled:
+                    cache.set_many(fresh, timeout=_CONTEXT_CACHE_TIMEOUT)
+                contexts.update(fresh)
+            return [contexts[key] for key in cache_keys]
+            
+        except Exception as e:
+            logger.error(f"Error getting relevant context batch: {str(e)}")
+            return [[] for _ in tasks_data]
+    
+    @staticmethod
+    def rank_against_task(entries: List[Dict[str, Any]], task_keywords: List[str],
+                          max_entries: int = 5) -> List[Dict[str, Any]]:
+        """
+        Score already fetched context entries against a task's keywords
+        
+        Args:
+            entries: Context entry rows as returned by _fetch_context_candidates
+            task_keywords: Keywords extracted from the task
+            max_entries: Maximum number of context entries to return
             
-            # Extract keywords from task
-            task_keywords = ContextProcessor._extract_keywords(task_data)
+        Returns:
+            List of relevant context entry dictionaries, most relevant first
+        """
+        keyword_automaton = ContextProcessor._build_keyword_automaton(task_keywords)
+        
+        # Score and filter context entries
+        scored_entries = []
+        for entry in entries:
+            relevance_score = ContextProcessor._calculate_relevance(
+                entry['content'], task_keywords, keyword_automaton
+            )
+            if relevance_score > 0.1:  # Minimum relevance threshold
+                scored_entries.append({
+                    'id': str(entry['id']),
+                    'content': entry['content'],
+                    'source_type': entry['source_type'],
+                    'content_date': entry['content_date'] or entry['created_at'],
+                    'relevance_score': relevance_score,
+                    'processed_insights': entry['processed_insights']
+                })
+        
+        # Return top entries by relevance
+        return heapq.nlargest(max_entries, scored_entries, key=lambda x: x['relevance_score'])
+    
+    @staticmethod
+    def invalidate_context(user_id: Any) -> None:
+        """
+        Drop the cached relevant context of a user
+        
+        Args:
+            user_id: Primary key of the user whose context changed
+        """
+        # A fresh version orphans every cached result of the user; the version
+        # defaults to the current time so an evicted version can't be reused
+        cache.set(f'ctx_version:{user_id}', time.time_ns(), timeout=None)
+    
+    @staticmethod
+    def top_array_values(entries: QuerySet[ContextEntry], field: str, k: int = 10) -> List[Any]:
+        """
+        Get the most common items across a JSON array field of context entries
+        
+        On PostgreSQL the items are unnested and counted in the database, so
+        only the top k ever reach Python.
+        
+        Args:
+            entries: Context entries to aggregate over (may be sliced)
+            field: Name of the JSON array field, e.g. 'urgency_indicators'
+            k: Number of items to return
             
-            # Score and filter context entries
-            scored_entries = []
-            for entry in context_entries:
-                relevance_score = ContextProcessor._calculate_relevance(
-                    entry.content, task_keywords
+        Returns:
+            List of the k most common items, most common first
+        """
+        if connection.vendor == 'postgresql':
+            subquery, params = entries.values(field).query.sql_with_params()
+            column = connection.ops.quote_name(field)
+            # Entries whose value isn't an array (null, scalars) contribute no items
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT item FROM ({subquery}) AS entries, "
+                    f"jsonb_array_elements_text(CASE WHEN jsonb_typeof(entries.{column}) = 'array' "
+                    f"THEN entries.{column} END) AS item "
+                    f"GROUP BY item ORDER BY COUNT(*) DESC, item LIMIT %s",
+                    (*params, k)
                 )
-                if relevance_score > 0.1:  # Minimum relevance threshold
-                    scored_entries.append({
-                        'id': str(entry.id),
-                        'content': entry.content,
-                        'source_type': entry.source_type,
-                        'content_date': entry.content_date or entry.created_at,
-                        'relevance_score': relevance_score,
-                        'processed_insights': entry.processed_insights
-                    })
+                return [row[0] for row in cursor.fetchall()]
+        
+        counter = Counter(itertools.chain.from_iterable(
+            items for items in entries.values_list(field, flat=True) if isinstance(items, list)
+        ))
+        return [item for item, _ in counter.most_common(k)]
+    
+    @staticmethod
+    def _context_cache_key(user: User, task_data: Dict[str, Any],
+                           days_back: int, max_entries: int) -> str:
+        """
+        Build the cache key of a task's relevant context
+        
+        Args:
+            user: User object
+            task_data: Task information dictionary
+            days_back: Number of days to look back for context
+            max_entries: Maximum number of context entries to return
             
-            # Sort by relevance and return top entries
-            scored_entries.sort(key=lambda x: x['relevance_score'], reverse=True)
-            return scored_entries[:max_entries]
+        Returns:
+            Cache key scoped to the user's current context version
+        """
+        task_text = json.dumps(
+            [task_data.get(field) for field in ('title', 'description', 'category')], default=str
+        )
+        return 'ctx:{}:{}:{}:{}:{}'.format(
+            user.pk,
+            cache.get_or_set(f'ctx_version:{user.pk}', time.time_ns, timeout=None),
+            hashlib.sha1(task_text.encode()).hexdigest(),
+            days_back,
+            max_entries
+        )
+    
+    @staticmethod
+    def _find_relevant_context(user: User, task_data: Dict[str, Any],
+                               days_back: int, max_entries: int) -> List[Dict[str, Any]]:
+        """
+        Query and score the context entries relevant to a task
+        
+        Args:
+            user: User object
+            task_data: Task information dictionary
+            days_back: Number of days to look back for context
+            max_entries: Maximum number of context entries to return
             
-        except Exception as e:
-            logger.error(f"Error getting relevant context: {str(e)}")
-            return []
+        Returns:
+            List of relevant context entry dictionaries
+        """
+        # Extract keywords from task
+        task_keywords = ContextProcessor._extract_keywords(task_data)
+        
+        context_entries = ContextProcessor._fetch_context_candidates(
+            user, task_keywords, days_back, max_entries * 2  # Get more to filter
+        )
+        return ContextProcessor.rank_against_task(context_entries, task_keywords, max_entries)
+    
+    @staticmethod
+    def _fetch_context_candidates(user: User, keywords: List[str],
+                                  days_back: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        Fetch the recent context entries worth scoring against the keywords
+        
+        On PostgreSQL, entries the full-text search matches come first; when there
+        are fewer than limit of them, the most recent other entries fill the rest,
+        since keyword scoring also matches words the search doesn't.
+        
+        Args:
+            user: User object
+            keywords: Keywords the entries should mention
+            days_back: Number of days to look back for context
+            limit: Maximum number of entries to fetch
+            
+        Returns:
+            List of context entry rows
+        """
+        # Calculate date threshold
+        date_threshold = timezone.now() - timedelta(days=days_back)
+        
+        # Get recent context entries
+        recent_entries = ContextEntry.objects.filter(
+            user=user,
+            created_at__gte=date_threshold
+        )
+        # Only the columns the scored entries need
+        entry_fields = ('id', 'content', 'source_type', 'content_date', 'created_at', 'processed_insights')
+        if keywords and connection.vendor == 'postgresql':
+            # Let the full-text index find entries mentioning any keyword across
+            # the whole window, best ranked first
+            search_vector = SearchVector('content', config=_CONTEXT_SEARCH_CONFIG)
+            search_query = functools.reduce(operator.or_, (
+                SearchQuery(keyword, config=_CONTEXT_SEARCH_CONFIG) for keyword in keywords
+            ))
+            matches = list(recent_entries.annotate(search=search_vector).filter(
+                search=search_query
+            ).annotate(
+                rank=SearchRank(search_vector, search_query)
+            ).order_by('-rank', '-created_at').values(*entry_fields)[:limit])
+            if len(matches) < limit:
+                matches += recent_entries.exclude(
+                    id__in=[entry['id'] for entry in matches]
+                ).order_by('-created_at').values(*entry_fields)[:limit - len(matches)]
+            return matches
+        return list(recent_entries.order_by('-created_at').values(*entry_fields)[:limit])
     
     @staticmethod
     def _extract_keywords(task_data: Dict[str, Any]) -> List[str]:
@@ -83,8 +369,6 @@ class ContextProcessor:
         Returns:
             List of keywords
         """
-        keywords = []
-        
         # Extract from title and description
         text_fields = [
             task_data.get('title', ''),
@@ -92,38 +376,50 @@ class ContextProcessor:
             task_data.get('category', '')
         ]
         
-        for text in text_fields:
-            if text:
-                # Simple keyword extraction (can be enhanced with NLP)
-                words = text.lower().split()
-                # Filter out common words and short words
-                filtered_words = [
-                    word.strip('.,!?;:()[]{}"\'-') 
-                    for word in words 
-                    if len(word) > 3 and word not in [
-                        'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 
-                        'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day',
-                        'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new',
-                        'now', 'old', 'see', 'two', 'who', 'boy', 'did', 'she',
-                        'use', 'way', 'will', 'with', 'this', 'that', 'have',
-                        'from', 'they', 'know', 'want', 'been', 'good', 'much',
-                        'some', 'time', 'very', 'when', 'come', 'here', 'just',
-                        'like', 'long', 'make', 'many', 'over', 'such', 'take',
-                        'than', 'them', 'well', 'were'
-                    ]
-                ]
-                keywords.extend(filtered_words)
+        # Simple keyword extraction (can be enhanced with NLP): filter out common
+        # words and short words, then remove duplicates keeping the text order
+        stripped_words = (
+            word.strip(_KEYWORD_PUNCTUATION)
+            for text in text_fields if text
+            for word in _CANDIDATE_WORD_RE.findall(text.lower())
+            if word not in _STOPWORDS
+        )
+        return list(dict.fromkeys(keyword for keyword in stripped_words if keyword))
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords: List[str]) -> Optional['ahocorasick.Automaton']:
+        """
+        Build an Aho-Corasick automaton matching all keywords in one pass
+        
+        Args:
+            keywords: List of keywords to match
+            
+        Returns:
+            Automaton whose values are (keyword, occurrences in keywords), or None
+            when there are no keywords
+        """
+        keyword_counts = Counter(keyword.lower() for keyword in keywords)
+        keyword_counts.pop('', None)
+        if not keyword_counts:
+            return None
         
-        return list(set(keywords))  # Remove duplicates
+        automaton = ahocorasick.Automaton()
+        for keyword, count in keyword_counts.items():
+            automaton.add_word(keyword, (keyword, count))
+        automaton.make_automaton()
+        return automaton
     
     @staticmethod
-    def _calculate_relevance(content: str, keywords: List[str]) -> float:
+    def _calculate_relevance(content: str, keywords: List[str],
+                             automaton: Optional['ahocorasick.Automaton'] = None) -> float:
         """
         Calculate relevance score between content and keywords
         
         Args:
             content: Content text to analyze
             keywords: List of keywords to match
+            automaton: Optional automaton from _build_keyword_automaton(keywords),
+                built once when scoring many entries
             
         Returns:
             Relevance score between 0 and 1
@@ -131,13 +427,17 @@ class ContextProcessor:
         if not keywords or not content:
             return 0.0
         
+        if automaton is None:
+            automaton = ContextProcessor._build_keyword_automaton(keywords)
+            if automaton is None:
+                return 0.0
+        
         content_lower = content.lower()
-        matches = 0
         total_keywords = len(keywords)
         
-        for keyword in keywords:
-            if keyword.lower() in content_lower:
-                matches += 1
+        # Each distinct keyword found counts once per time it appears in keywords
+        matched = {value for _, value in automaton.iter(content_lower)}
+        matches = sum(count for _, count in matched)
         
         # Calculate basic relevance score
         relevance = matches / total_keywords if total_keywords > 0 else 0.0
@@ -175,38 +475,32 @@ class WorkloadAnalyzer:
                 status__in=['pending', 'in_progress']
             )
             
-            # Calculate workload metrics
-            total_tasks = active_tasks.count()
-            high_priority_tasks = active_tasks.filter(priority='high').count()
-            urgent_tasks = active_tasks.filter(priority='urgent').count()
-            overdue_tasks = active_tasks.filter(
-                deadline__lt=now,
-                status__in=['pending', 'in_progress']
-            ).count()
-            
-            # Calculate total estimated time
-            total_estimated_time = sum([
-                task.estimated_duration or 60  # Default 60 minutes if not specified
-                for task in active_tasks
-            ])
-            
-            # Get tasks due in next 7 days
+            # Calculate all workload metrics in a single query
             week_ahead = now + timedelta(days=7)
-            upcoming_tasks = active_tasks.filter(
-                deadline__gte=now,
-                deadline__lte=week_ahead
-            ).count()
+            metrics = active_tasks.aggregate(
+                total=Count('id'),
+                high_priority=Count('id', filter=Q(priority='high')),
+                urgent=Count('id', filter=Q(priority='urgent')),
+                overdue=Count('id', filter=Q(deadline__lt=now)),
+                # Tasks due in next 7 days
+                upcoming=Count('id', filter=Q(deadline__gte=now, deadline__lte=week_ahead)),
+                # Default 60 minutes if not specified
+                total_time=Sum(Coalesce(NullIf('estimated_duration', Value(0)), Value(60))),
+                avg_priority=Avg('ai_priority_score', filter=Q(ai_priority_score__gt=0)),
+            )
             
-            # Calculate average priority score
-            priority_scores = [task.ai_priority_score for task in active_tasks if task.ai_priority_score]
-            avg_priority_score = sum(priority_scores) / len(priority_scores) if priority_scores else 5.0
+            total_tasks = metrics['total']
+            urgent_tasks = metrics['urgent']
+            overdue_tasks = metrics['overdue']
+            total_estimated_time = metrics['total_time'] or 0
+            avg_priority_score = metrics['avg_priority'] if metrics['avg_priority'] is not None else 5.0
             
             return {
                 'total_active_tasks': total_tasks,
-                'high_priority_tasks': high_priority_tasks,
+                'high_priority_tasks': metrics['high_priority'],
                 'urgent_tasks': urgent_tasks,
                 'overdue_tasks': overdue_tasks,
-                'upcoming_tasks_week': upcoming_tasks,
+                'upcoming_tasks_week': metrics['upcoming'],
                 'total_estimated_hours': total_estimated_time / 60,
                 'average_priority_score': avg_priority_score,
                 'workload_level': WorkloadAnalyzer._calculate_workload_level(
@@ -242,51 +536,71 @@ class WorkloadAnalyzer:
         Returns:
             Workload level string
         """
-        # Calculate workload score
-        score = 0
-        
-        # Task count factor
-        if total_tasks > 20:
-            score += 3
-        elif total_tasks > 10:
-            score += 2
-        elif total_tasks > 5:
-            score += 1
-        
-        # Urgent tasks factor
-        if urgent_tasks > 5:
-            score += 3
-        elif urgent_tasks > 2:
-            score += 2
-        elif urgent_tasks > 0:
-            score += 1
-        
-        # Overdue tasks factor (heavily weighted)
-        if overdue_tasks > 3:
-            score += 4
-        elif overdue_tasks > 1:
-            score += 3
-        elif overdue_tasks > 0:
-            score += 2
-        
-        # Time factor (hours)
-        hours = total_time / 60
-        if hours > 40:
-            score += 3
-        elif hours > 20:
-            score += 2
-        elif hours > 10:
-            score += 1
+        # Calculate workload score: each factor scores the points of the
+        # highest threshold it exceeds (bisect_left counts the thresholds below it)
+        score = sum(
+            points[bisect.bisect_left(thresholds, value)]
+            for value, (thresholds, points) in zip(
+                (total_tasks, urgent_tasks, overdue_tasks, total_time / 60),
+                _WORKLOAD_FACTORS
+            )
+        )
         
         # Determine level
-        if score >= 8:
-            return 'very_high'
-        elif score >= 6:
-            return 'high'
-        elif score >= 3:
-            return 'medium'
-        else:
-            return 'low'
+        return WORKLOAD_LEVELS[bisect.bisect_right(WORKLOAD_LEVEL_THRESHOLDS, score)]
+
+
+# Analysis logs waiting for the background writer
+_LOG_QUEUE: 'queue.Queue[AIAnalysisLog]' = queue.Queue()
+_LOG_BATCH_SIZE = 500
+# Longest time a log waits for its batch to fill before being written
+_LOG_FLUSH_INTERVAL = 1.0
+_log_writer_started = False
+_log_writer_lock = threading.Lock()
+
+
+def _write_logs(batch: List[AIAnalysisLog]) -> None:
+    """
+    Insert a batch of analysis logs
+    
+    Args:
+        batch: Unsaved AIAnalysisLog objects
+    """
+    close_old_connections()
+    try:
+        AIAnalysisLog.objects.bulk_create(batch, batch_size=_LOG_BATCH_SIZE)
+    except Exception as e:
+        logger.error(f"Error writing AI analysis logs, retrying individually: {str(e)}")
+        # Save one at a time so a bad entry doesn't lose the whole batch
+        for log_entry in batch:
+            try:
+                log_entry.save(force_insert=True)
+            except Exception as e:
+                logger.error(f"Error logging AI analysis: {str(e)}")
+
+
+def _log_writer() -> None:
+    """Write queued analysis logs in batches of up to _LOG_BATCH_SIZE"""
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        deadline = time.monotonic() + _LOG_FLUSH_INTERVAL
+        while len(batch) < _LOG_BATCH_SIZE:
+            try:
+                batch.append(_LOG_QUEUE.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+        _write_logs(batch)
+
+
+def _start_log_writer() -> None:
+    """Start the background log writer on first use"""
+    global _log_writer_started
+    if not _log_writer_started:
+        with _log_writer_lock:
+            if not _log_writer_started:
+                threading.Thread(target=_log_writer, name='ai-log-writer', daemon=True).start()
+                atexit.register(AIAnalysisLogger.flush)
+                _log_writer_started = True
 
 
 class AIAnalysisLogger:
@@ -313,10 +627,10 @@ class AIAnalysisLogger:
             success: Whether the analysis was successful
             
         Returns:
-            Created AIAnalysisLog object or None on error
+            AIAnalysisLog object queued for writing or None on error
         """
         try:
-            log_entry = AIAnalysisLog.objects.create(
+            log_entry = AIAnalysisLog(
                 user=user,
                 analysis_type=analysis_type,
                 input_data=input_data,
@@ -325,11 +639,26 @@ class AIAnalysisLogger:
                 error_message=error_message,
                 success=success
             )
+            # Logs are written in batches by a background thread, off the request path
+            _start_log_writer()
+            _LOG_QUEUE.put(log_entry)
             return log_entry
         except Exception as e:
             logger.error(f"Error logging AI analysis: {str(e)}")
             return None
     
+    @staticmethod
+    def flush() -> None:
+        """Write all queued analysis logs now"""
+        batch = []
+        while True:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        for start in range(0, len(batch), _LOG_BATCH_SIZE):
+            _write_logs(batch[start:start + _LOG_BATCH_SIZE])
+    
     @staticmethod
     def get_analysis_stats(user: User, days_back: int = 30) -> Dict[str, Any]:
         """
@@ -350,26 +679,26 @@ class AIAnalysisLogger:
                 created_at__gte=date_threshold
             )
             
-            total_analyses = logs.count()
-            successful_analyses = logs.filter(success=True).count()
-            failed_analyses = logs.filter(success=False).count()
-            
-            # Calculate average processing time
-            successful_logs = logs.filter(success=True, processing_time__isnull=False)
-            avg_processing_time = 0.0
-            if successful_logs.exists():
-                total_time = sum([log.processing_time for log in successful_logs])
-                avg_processing_time = total_time / successful_logs.count()
+            totals = logs.aggregate(
+                total=Count('id'),
+                successful=Count('id', filter=Q(success=True)),
+                failed=Count('id', filter=Q(success=False)),
+                # Calculate average processing time
+                avg_time=Avg('processing_time', filter=Q(success=True)),
+            )
+            total_analyses = totals['total']
+            successful_analyses = totals['successful']
+            failed_analyses = totals['failed']
+            avg_processing_time = totals['avg_time'] or 0.0
             
             # Get analysis type breakdown
-            analysis_types = {}
-            for log in logs:
-                analysis_type = log.analysis_type
-                if analysis_type not in analysis_types:
-                    analysis_types[analysis_type] = {'total': 0, 'successful': 0}
-                analysis_types[analysis_type]['total'] += 1
-                if log.success:
-                    analysis_types[analysis_type]['successful'] += 1
+            analysis_types = {
+                row['analysis_type']: {'total': row['total'], 'successful': row['successful']}
+                for row in logs.order_by().values('analysis_type').annotate(
+                    total=Count('id'),
+                    successful=Count('id', filter=Q(success=True)),
+                )
+            }
             
             return {
                 'total_analyses': total_analyses,
@@ -392,31 +721,61 @@ class AIAnalysisLogger:
             }
 
 
+# Long-lived event loop that runs the AI analyses of all views, started on first use
+_ai_loop: Optional[asyncio.AbstractEventLoop] = None
+_ai_loop_lock = threading.Lock()
+
+
+def _get_ai_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background AI event loop, starting its thread if needed
+    
+    Returns:
+        Running event loop
+    """
+    global _ai_loop
+    if _ai_loop is None:
+        with _ai_loop_lock:
+            if _ai_loop is None:
+                # Only this loop runs on uvloop; the process-wide policy is left alone
+                if uvloop is not None and getattr(settings, 'AI_USE_UVLOOP', True):
+                    loop = uvloop.new_event_loop()
+                else:
+                    loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='ai-event-loop', daemon=True).start()
+                _ai_loop = loop
+    return _ai_loop
+
+
 def run_async_ai_analysis(coro):
     """
     Helper function to run async AI analysis in Django views
     
+    The coroutine runs on a shared background event loop, so calls don't pay
+    for a new loop or thread. It gets a batch scope of its own, so its prompts
+    are never batched with those of other requests.
+    
     Args:
         coro: Coroutine to run
         
     Returns:
         Result of the coroutine
+        
+    Raises:
+        TimeoutError: If the analysis takes longer than AI_ANALYSIS_TIMEOUT seconds;
+            the analysis is cancelled
     """
+    from .ai_core import run_in_batch_scope
+    
+    timeout = getattr(settings, 'AI_ANALYSIS_TIMEOUT', 60)
+    future = asyncio.run_coroutine_threadsafe(run_in_batch_scope(coro), _get_ai_loop())
     try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running, create a new thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result()
-        else:
-            # If no loop is running, run directly
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        # No event loop exists, create one
-        return asyncio.run(coro)
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        # Don't let a hung analysis hold the worker thread or keep running
+        future.cancel()
+        logger.error(f"AI analysis timed out after {timeout}s")
+        raise TimeoutError(f"AI analysis timed out after {timeout} seconds")
 
 
 def measure_processing_time(func):
@@ -429,15 +788,13 @@ def measure_processing_time(func):
     Returns:
         Decorated function that returns (result, processing_time)
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        try:
-            result = func(*args, **kwargs)
-            processing_time = time.time() - start_time
-            return result, processing_time
-        except Exception as e:
-            processing_time = time.time() - start_time
-            raise e
+        # Monotonic clock, so the measurement isn't skewed by system clock changes
+        start_time = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        processing_time = (time.perf_counter_ns() - start_time) / 1e9
+        return result, processing_time
     return wrapper
 
 
@@ -486,8 +843,10 @@ class CategoryTagManager:
                 defaults={'color': color}
             )
             if not created:
+                # Increment in the database so concurrent uses aren't lost. The
+                # cached popular lists catch up with the new count when they expire
+                Tag.objects.filter(pk=tag.pk).update(usage_count=F('usage_count') + 1)
                 tag.usage_count += 1
-                tag.save()
             return tag
         except Exception as e:
             logger.error(f"Error getting/creating tag: {str(e)}")
@@ -505,8 +864,9 @@ class CategoryTagManager:
             List of category names
         """
         try:
-            categories = Category.objects.order_by('-usage_frequency')[:limit]
-            return [cat.name for cat in categories]
+            return CategoryTagManager._cached_popular('categories', limit, lambda: list(
+                Category.objects.order_by('-usage_frequency').values_list('name', flat=True)[:limit]
+            ))
         except Exception as e:
             logger.error(f"Error getting popular categories: {str(e)}")
             return []
@@ -523,9 +883,40 @@ class CategoryTagManager:
             List of tag names
         """
         try:
-            tags = Tag.objects.order_by('-usage_count')[:limit]
-            return [tag.name for tag in tags]
+            return CategoryTagManager._cached_popular('tags', limit, lambda: list(
+                Tag.objects.order_by('-usage_count').values_list('name', flat=True)[:limit]
+            ))
         except Exception as e:
             logger.error(f"Error getting popular tags: {str(e)}")
             return []
+    
+    @staticmethod
+    def _cached_popular(kind: str, limit: int, query) -> List[str]:
+        """
+        Get a popular name list from the cache, running the query on a miss
+        
+        Like relevant context, the lists are only cached when the cache is
+        shared by all workers, since invalidation must reach every one of them.
+        
+        Args:
+            kind: 'categories' or 'tags'
+            limit: Maximum number of names in the list
+            query: Callable returning the list of names
+            
+        Returns:
+            List of names
+        """
+        if not _context_cache_enabled():
+            return query()
+        version = cache.get_or_set(_POPULAR_VERSION_KEY, 1, timeout=None)
+        return cache.get_or_set(f'popular_{kind}:{version}:{limit}', query, timeout=_POPULAR_CACHE_TIMEOUT)
+    
+    @staticmethod
+    def invalidate_popular() -> None:
+        """Drop the cached popular category and tag lists"""
+        try:
+            cache.incr(_POPULAR_VERSION_KEY)
+        except ValueError:
+            # No version yet, so nothing has been cached
+            pass
 
@@ -9,12 +9,14 @@ This module provides REST API endpoints for AI-powered features:
 - Task enhancement
 """
 
+import itertools
 import logging
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth.models import User
+from django.db.models import Count, Q
 from django.utils import timezone
 from tasks.models import Task, ContextEntry, Category, Tag
 from .ai_core import ai_manager
@@ -75,7 +77,7 @@ def analyze_context(request):
         @measure_processing_time
         def analyze():
             return run_async_ai_analysis(
-                ai_manager.ai_service.analyze_context(content, source_type)
+                ai_manager.analyze_context(content, source_type)
             )
         
         analysis_result, processing_time = analyze()
@@ -199,47 +201,20 @@ def get_ai_task_suggestions(request):
         
         ai_results, processing_time = process_task()
         
-        # Add detailed logging of AI suggestions
-        logger.info("=================== AI SUGGESTIONS LOG ====================")
-        logger.info(f"Task: {task_data.get('title')}")
-        logger.info(f"Complete AI results: {json.dumps(ai_results, indent=2, default=str)}")
+        # Log which suggestions were produced; the full results are only
+        # serialized when debug logging is on
+        logger.info("AI suggestions for task '%s': %s", task_data.get('title'),
+                    ', '.join(sorted(ai_results)) or 'none available')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Complete AI results: %s", json.dumps(ai_results, indent=2, default=str))
         
-        # Log specific suggestion types
-        if 'priority' in ai_results:
-            logger.info(f"PRIORITY SUGGESTION: {json.dumps(ai_results['priority'], indent=2, default=str)}")
-        else:
-            logger.info("PRIORITY SUGGESTION: Not available")
-            
-        if 'deadline' in ai_results:
-            logger.info(f"DEADLINE SUGGESTION: {json.dumps(ai_results['deadline'], indent=2, default=str)}")
-        else:
-            logger.info("DEADLINE SUGGESTION: Not available")
-            
-        if 'scheduling' in ai_results:
-            logger.info(f"SCHEDULING SUGGESTION: {json.dumps(ai_results['scheduling'], indent=2, default=str)}")
-        else:
-            logger.info("SCHEDULING SUGGESTION: Not available")
-            
-        if 'categorization' in ai_results:
-            logger.info(f"CATEGORY SUGGESTION: {json.dumps(ai_results['categorization'], indent=2, default=str)}")
-        else:
-            logger.info("CATEGORY SUGGESTION: Not available")
-            
-        if 'enhanced_description' in ai_results and ai_results['enhanced_description']:
-            logger.info(f"ENHANCED DESCRIPTION: {ai_results['enhanced_description']}")
-        else:
-            logger.info("ENHANCED DESCRIPTION: Not available")
-            
-        # Log enhanced description info if available
         if 'enhanced_description_info' in ai_results:
-            logger.info(f"ENHANCED DESCRIPTION INFO: {json.dumps(ai_results['enhanced_description_info'], indent=2, default=str)}")
             # If there was an error, log it clearly
             if not ai_results['enhanced_description_info'].get('is_enhanced', False):
                 logger.warning(f"Enhanced description generation failed: {ai_results['enhanced_description_info'].get('error', 'Unknown error')}")
                 # Make sure we're not sending None to the frontend
                 if ai_results.get('enhanced_description') is None:
                     ai_results['enhanced_description'] = ai_results['enhanced_description_info'].get('original_text', '')
-        logger.info("=============================================================")
         
         # Log the analysis
         AIAnalysisLogger.log_analysis(
@@ -316,7 +291,8 @@ def get_ai_task_suggestions(request):
         }
         
         # Log the final response being sent to frontend
-        logger.info(f"Response sent to frontend: {json.dumps(response_data, indent=2, default=str)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response sent to frontend: %s", json.dumps(response_data, indent=2, default=str))
         return Response(response_data, status=status.HTTP_200_OK)
         
     except Exception as e:
@@ -361,56 +337,65 @@ def prioritize_tasks(request):
             )
         
         # Get tasks
-        tasks = Task.objects.filter(
+        tasks = list(Task.objects.filter(
             id__in=task_ids,
             user=request.user
-        )
+        ).select_related('category'))
         
-        if not tasks.exists():
+        if not tasks:
             return Response(
                 {'error': 'No valid tasks found'}, 
                 status=status.HTTP_404_NOT_FOUND
             )
         
         prioritized_tasks = []
-        total_processing_time = 0
         
-        for task in tasks:
+        # Prepare task data for every task
+        tasks_data = [
+            {
+                'title': task.title,
+                'description': task.description,
+                'category': task.category.name if task.category else None,
+                'priority': task.priority,
+                'deadline': task.deadline.isoformat() if task.deadline else None,
+                'estimated_duration': task.estimated_duration
+            }
+            for task in tasks
+        ]
+        
+        # Get relevant context if requested, with one query for all tasks
+        if include_context:
+            contexts = ContextProcessor.get_relevant_context_batch(
+                request.user, tasks_data, days_back=7, max_entries=5
+            )
+        else:
+            contexts = [[] for _ in tasks]
+        pending = list(zip(tasks, tasks_data, contexts))
+        
+        # Prioritize all tasks with AI concurrently
+        @measure_processing_time
+        def prioritize():
+            return run_async_ai_analysis(
+                ai_manager.prioritize_tasks([
+                    (task_data, context_data) for _, task_data, context_data in pending
+                ])
+            )
+        
+        priority_results, total_processing_time = prioritize()
+        
+        analyzed_at = timezone.now()
+        updated_tasks = []
+        for (task, _, _), priority_result in zip(pending, priority_results):
             try:
-                # Prepare task data
-                task_data = {
-                    'title': task.title,
-                    'description': task.description,
-                    'category': task.category.name if task.category else None,
-                    'priority': task.priority,
-                    'deadline': task.deadline.isoformat() if task.deadline else None,
-                    'estimated_duration': task.estimated_duration
-                }
-                
-                # Get relevant context if requested
-                context_data = []
-                if include_context:
-                    context_data = ContextProcessor.get_relevant_context(
-                        request.user, task_data, days_back=7, max_entries=5
-                    )
-                
-                # Prioritize task with AI
-                @measure_processing_time
-                def prioritize():
-                    return run_async_ai_analysis(
-                        ai_manager.ai_service.prioritize_task(
-                            task_data, context_data
-                        )
-                    )
-                
-                priority_result, processing_time = prioritize()
-                total_processing_time += processing_time
+                if isinstance(priority_result, Exception):
+                    raise priority_result
                 
                 # Update task with AI priority
                 task.ai_priority_score = priority_result.score
                 task.ai_reasoning = priority_result.reasoning
-                task.last_ai_analysis = timezone.now()
-                task.save()
+                task.last_ai_analysis = analyzed_at
+                task.updated_at = analyzed_at
+                updated_tasks.append(task)
                 
                 prioritized_tasks.append({
                     'task_id': str(task.id),
@@ -430,6 +415,13 @@ def prioritize_tasks(request):
                     'error': str(e)
                 })
         
+        # Save all AI priorities in one query
+        Task.objects.bulk_update(
+            updated_tasks,
+            ['ai_priority_score', 'ai_reasoning', 'last_ai_analysis', 'updated_at'],
+            batch_size=100
+        )
+        
         # Sort by AI priority score
         prioritized_tasks.sort(key=lambda x: x.get('ai_priority_score', 0), reverse=True)
         
@@ -493,7 +485,11 @@ def get_context_insights(request):
         
         # First, get counts before slicing the queryset
         queryset = ContextEntry.objects.filter(**context_filter)
-        total_entries = queryset.count()
+        counts = queryset.aggregate(
+            total=Count('id'),
+            processed=Count('id', filter=Q(is_processed=True))
+        )
+        total_entries = counts['total']
         
         if total_entries == 0:
             return Response({
@@ -507,45 +503,26 @@ def get_context_insights(request):
                 }
             }, status=status.HTTP_200_OK)
         
-        # Count processed entries before slicing
-        processed_entries = queryset.filter(is_processed=True).count()
+        processed_entries = counts['processed']
         
         # Now get the limited set for detailed processing - only include processed entries
-        context_entries = queryset.filter(is_processed=True).order_by('-created_at')[:limit]
-        
-        all_key_topics = []
-        all_urgency_indicators = []
-        all_potential_tasks = []
-        sentiment_scores = []
-        
-        for entry in context_entries:
-            if entry.processed_insights:
-                # Extract topics from processed insights (simplified)
-                insights_text = entry.processed_insights.lower()
-                # This could be enhanced with proper NLP
-                
-            if entry.urgency_indicators:
-                all_urgency_indicators.extend(entry.urgency_indicators)
-                
-            if entry.extracted_tasks:
-                all_potential_tasks.extend(entry.extracted_tasks)
-                
-            if entry.sentiment_score is not None:
-                sentiment_scores.append(entry.sentiment_score)
+        recent_entries = queryset.filter(is_processed=True).order_by('-created_at')[:limit]
+        context_entries = list(recent_entries.values_list('extracted_tasks', 'sentiment_score'))
+        
+        all_potential_tasks = list(itertools.chain.from_iterable(
+            tasks for tasks, _ in context_entries if tasks
+        ))
+        sentiment_scores = [score for _, score in context_entries if score is not None]
         
         # Calculate aggregated metrics
         average_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0.0
         
-        # Get most common topics and indicators (simplified)
-        from collections import Counter
-        topic_counter = Counter(all_key_topics)
-        urgency_counter = Counter(all_urgency_indicators)
-        
         insights = {
             'total_entries': total_entries,
             'processed_entries': processed_entries,
-            'key_topics': [item[0] for item in topic_counter.most_common(10)],
-            'urgency_indicators': [item[0] for item in urgency_counter.most_common(10)],
+            # Topics aren't stored per entry, so there are none to aggregate yet
+            'key_topics': [],
+            'urgency_indicators': ContextProcessor.top_array_values(recent_entries, 'urgency_indicators', k=10),
             'potential_tasks': all_potential_tasks[:10],  # Limit to 10 most recent
             'average_sentiment': average_sentiment,
             'sentiment_trend': 'positive' if average_sentiment > 0.1 else 'negative' if average_sentiment < -0.1 else 'neutral'
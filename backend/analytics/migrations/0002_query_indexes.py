@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-16 04:56
+
+from django.db import migrations, models
+
+QUERY_INDEXES = [
+    ('aiinsight', models.Index(fields=['user', '-created_at'], name='analytics_a_user_id_4fd1e3_idx')),
+    ('aiinsight', models.Index(fields=['user', 'insight_type', 'importance_level'], name='analytics_a_user_id_711f50_idx')),
+    ('analyticssnapshot', models.Index(fields=['user', 'period_type', '-date'], name='analytics_a_user_id_448bbb_idx')),
+]
+
+
+def add_query_indexes(apps, schema_editor):
+    # Build the indexes without locking writes on PostgreSQL; other backends
+    # don't support CONCURRENTLY
+    concurrently = schema_editor.connection.vendor == 'postgresql'
+    for model_name, index in QUERY_INDEXES:
+        model = apps.get_model('analytics', model_name)
+        if concurrently:
+            schema_editor.add_index(model, index, concurrently=True)
+        else:
+            schema_editor.add_index(model, index)
+
+
+def remove_query_indexes(apps, schema_editor):
+    concurrently = schema_editor.connection.vendor == 'postgresql'
+    for model_name, index in QUERY_INDEXES:
+        model = apps.get_model('analytics', model_name)
+        if concurrently:
+            schema_editor.remove_index(model, index, concurrently=True)
+        else:
+            schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, index in QUERY_INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(add_query_indexes, remove_query_indexes),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-16 04:57
+
+import analytics.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aiinsight',
+            name='id',
+            field=models.UUIDField(default=analytics.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='analyticssnapshot',
+            name='id',
+            field=models.UUIDField(default=analytics.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
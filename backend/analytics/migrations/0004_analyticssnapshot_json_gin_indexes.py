@@ -0,0 +1,43 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations
+
+# Containment (JSONField __contains / has_key lookups) indexes over the snapshot
+# breakdowns; jsonb_path_ops keeps them small since only @> is needed
+JSON_GIN_INDEXES = [
+    GinIndex(
+        fields=['priority_distribution'],
+        opclasses=['jsonb_path_ops'],
+        name='snapshot_priority_dist_gin',
+    ),
+    GinIndex(
+        fields=['category_stats'],
+        opclasses=['jsonb_path_ops'],
+        name='snapshot_category_stats_gin',
+    ),
+]
+
+
+def add_json_gin_indexes(apps, schema_editor):
+    # JSONB and GIN are PostgreSQL only; the SQLite development database scans instead
+    if schema_editor.connection.vendor == 'postgresql':
+        model = apps.get_model('analytics', 'AnalyticsSnapshot')
+        for index in JSON_GIN_INDEXES:
+            schema_editor.add_index(model, index)
+
+
+def remove_json_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        model = apps.get_model('analytics', 'AnalyticsSnapshot')
+        for index in JSON_GIN_INDEXES:
+            schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_json_gin_indexes, remove_json_gin_indexes),
+    ]
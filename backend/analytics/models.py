@@ -8,13 +8,36 @@ and AI-generated insights.
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+import os
+import time
 import uuid
 import json
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562)
+    
+    The leading 48 bits are the Unix time in milliseconds, so new primary keys
+    land on the right-hand edge of the B-tree index instead of a random page.
+    
+    Returns:
+        UUID whose ordering follows its creation time
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    return uuid.UUID(int=(
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                                # version
+        | (rand >> 62 & 0xFFF) << 64               # rand_a
+        | 0b10 << 62                               # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF             # rand_b
+    ))
+
+
 class AnalyticsSnapshot(models.Model):
     """Stores periodic analytics snapshots for users"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='analytics_snapshots')
     
     # Time period this snapshot represents
@@ -61,15 +84,44 @@ class AnalyticsSnapshot(models.Model):
         indexes = [
             models.Index(fields=['user', 'date']),
             models.Index(fields=['period_type']),
+            models.Index(fields=['user', 'period_type', '-date']),
         ]
     
     def __str__(self):
         return f"{self.user.username}'s {self.period_type} analytics on {self.date}"
+    
+    @classmethod
+    def upsert_many(cls, snapshots, batch_size=500):
+        """
+        Insert snapshots, overwriting the metrics of existing ones for the same period
+        
+        Each batch is a single INSERT ... ON CONFLICT DO UPDATE instead of a
+        save() per snapshot.
+        
+        Args:
+            snapshots: Unsaved AnalyticsSnapshot instances
+            batch_size: Number of snapshots written per query
+            
+        Returns:
+            List of the given snapshots
+        """
+        unique_fields = ['user', 'date', 'period_type']
+        update_fields = [
+            field.name for field in cls._meta.concrete_fields
+            if not field.primary_key and field.name not in unique_fields and field.name != 'created_at'
+        ]
+        return cls.objects.bulk_create(
+            snapshots,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=update_fields
+        )
 
 
 class AIInsight(models.Model):
     """Stores AI-generated insights about user productivity and task management"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='ai_insights')
     
     # Insight details
@@ -102,6 +154,10 @@ class AIInsight(models.Model):
     
     class Meta:
         ordering = ['-created_at', '-importance_level']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'insight_type', 'importance_level']),
+        ]
     
     def __str__(self):
         return f"{self.insight_type}: {self.title}"
@@ -14,7 +14,6 @@ from django.db.models import Count, Avg, F, Sum, Q, ExpressionWrapper, fields
 from django.db.models.functions import TruncDate
 
 from tasks.models import Task, Category, ContextEntry
-from ai_service.ai_core import ai_manager
 
 logger = logging.getLogger('analytics')
 
@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for Smart Todo Backend
+
+Loaded automatically when gunicorn starts from this directory; GUNICORN_CMD_ARGS
+and command line arguments override it.
+"""
+
+import threading
+
+
+def _warm_up_ai():
+    # Importing ai_core builds the service with its compiled patterns and caches
+    from ai_service.ai_core import ai_manager
+    ai_manager.ai_service.warm_up()
+
+
+def post_worker_init(worker):
+    """
+    Load the AI service and connect to Gemini in the background once a worker
+    has loaded the application, so the first analysis request doesn't pay for it
+    """
+    from django.conf import settings
+
+    if getattr(settings, 'AI_WARMUP', True) and settings.GEMINI_API_KEY:
+        threading.Thread(target=_warm_up_ai, name='ai-warmup', daemon=True).start()
@@ -0,0 +1,56 @@
+"""
+Response renderers for Smart Todo Backend
+"""
+
+import dataclasses
+import math
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that serializes with orjson
+
+    Datetimes, UUIDs and dataclasses are encoded natively; anything orjson
+    doesn't know (Decimal, lazy strings, querysets) goes through DRF's encoder.
+    Like JSONRenderer, U+2028 and U+2029 are escaped and, with STRICT_JSON,
+    NaN and infinite floats raise ValueError (orjson would render them as null).
+    """
+    _encoder = JSONEncoder()
+    _options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        options = self._options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=self._encoder.default, option=options)
+        # orjson renders non-finite floats as null, so only output with a null can hide one
+        if self.strict and b'null' in ret and not _all_finite(data):
+            raise ValueError("Out of range float values are not JSON compliant")
+        # The separators are valid JSON but not valid JavaScript, so escape them
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+def _all_finite(value) -> bool:
+    """Whether every float in value, looking into containers and dataclasses, is finite"""
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        return all(_all_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_all_finite(item) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return all(_all_finite(getattr(value, field.name)) for field in dataclasses.fields(value))
+    return True
@@ -130,7 +130,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'smart_todo_backend.renderers.ORJSONRenderer',
     ],
 }
 
@@ -156,8 +156,30 @@ CORS_ALLOW_HEADERS = [
     'x-requested-with',
 ]
 
+# Cache shared by all workers; without REDIS_URL every process keeps its own
+# local memory cache, and caches that rely on invalidation stay off
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
 # Gemini AI API settings
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
+# Maximum number of Gemini requests in flight per process
+GEMINI_CONCURRENCY = int(os.getenv('GEMINI_CONCURRENCY', '8'))
+# Maximum number of AI analyses awaiting a result per event loop
+AI_MAX_IN_FLIGHT = int(os.getenv('AI_MAX_IN_FLIGHT', '32'))
+# Run the shared AI analysis event loop on uvloop when it is installed
+AI_USE_UVLOOP = os.getenv('AI_USE_UVLOOP', 'True').lower() == 'true'
+# Load the AI service and open the Gemini connection when a gunicorn worker
+# starts (see gunicorn.conf.py); management commands never do
+AI_WARMUP = os.getenv('AI_WARMUP', 'True').lower() == 'true'
+# Seconds a view waits for its AI analysis before giving up
+AI_ANALYSIS_TIMEOUT = float(os.getenv('AI_ANALYSIS_TIMEOUT', '60'))
 
 # Logging configuration
 LOGGING = {
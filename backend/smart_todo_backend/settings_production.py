@@ -96,11 +96,13 @@ LOGGING = {
 GEMINI_API_KEY = config('GEMINI_API_KEY', default='')
 AI_SERVICE_ENABLED = bool(GEMINI_API_KEY)
 
-# Cache configuration (optional)
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'smart-todo-cache',
+# Cache configuration: Redis when REDIS_URL is set (see settings.py), otherwise
+# a per-process local memory cache
+if not REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'smart-todo-cache',
+        }
     }
-}
 
@@ -0,0 +1,32 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# Full-text index over context content, used by ContextProcessor.get_relevant_context.
+# Its expression must match the SearchVector queried there.
+CONTENT_SEARCH_INDEX = GinIndex(
+    SearchVector('content', config='english'),
+    name='contextentry_content_search',
+)
+
+
+def add_content_search_index(apps, schema_editor):
+    # Full-text search is PostgreSQL only; the SQLite development database scans instead
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('tasks', 'ContextEntry'), CONTENT_SEARCH_INDEX)
+
+
+def remove_content_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('tasks', 'ContextEntry'), CONTENT_SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_task_is_time_blocked_task_scheduled_end_time_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_content_search_index, remove_content_search_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-16 04:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_contextentry_content_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aianalysislog',
+            index=models.Index(fields=['user', '-created_at'], name='tasks_aiana_user_id_28badc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contextentry',
+            index=models.Index(fields=['user', '-created_at'], name='tasks_conte_user_id_2a8ec5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'status', 'deadline'], name='tasks_task_user_id_137491_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_task_user_id_c0fce1_idx',
+        ),
+    ]
@@ -88,7 +88,8 @@ class Task(models.Model):
     class Meta:
         ordering = ['-ai_priority_score', '-created_at']
         indexes = [
-            models.Index(fields=['user', 'status']),
+            # Also serves lookups on (user, status) alone
+            models.Index(fields=['user', 'status', 'deadline']),
             models.Index(fields=['ai_priority_score']),
             models.Index(fields=['deadline']),
         ]
@@ -187,6 +188,7 @@ class ContextEntry(models.Model):
         ordering = ['-content_date', '-created_at']
         indexes = [
             models.Index(fields=['user', 'source_type']),
+            models.Index(fields=['user', '-created_at']),
             models.Index(fields=['is_processed']),
             models.Index(fields=['content_date']),
         ]
@@ -226,6 +228,11 @@ class AIAnalysisLog(models.Model):
     success = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+    
     def __str__(self):
         status = "Success" if self.success else "Failed"
         return f"{self.analysis_type} - {status} ({self.created_at})"